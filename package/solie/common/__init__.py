@@ -1,6 +1,32 @@
 from .connect_event import outsource
+from .cycle_scheduler import (
+    STAGE_ACCOUNT,
+    STAGE_BACKGROUND,
+    STAGE_CANDLE,
+    STAGE_DECISION,
+    CycleJob,
+    CycleScheduler,
+    get_cycle_scheduler,
+)
 from .info import PACKAGE_NAME, PACKAGE_PATH, PACKAGE_VERSION
-from .parallel import PROCESS_COUNT, get_sync_manager, go, prepare_process_pool
+from .loop_monitor import LoopMonitor, LoopOffender, SlowCallback, get_loop_monitor
+from .metrics import MetricRegistry, StreamingSummary, get_metric_registry
+from .parallel import (
+    BULK_PROCESS_COUNT,
+    IO_THREAD_COUNT,
+    LIVE_PROCESS_COUNT,
+    PROCESS_COUNT,
+    get_executor,
+    get_sync_manager,
+    go,
+    go_cold,
+    go_fit,
+    go_io,
+    go_live,
+    prepare_process_pool,
+    warm_up_lane,
+)
+from .span_timing import Span, SpanStore, get_span_store
 
 __all__ = [
     "outsource",
@@ -11,4 +37,30 @@ __all__ = [
     "PACKAGE_PATH",
     "PACKAGE_VERSION",
     "PACKAGE_NAME",
+    "Span",
+    "SpanStore",
+    "get_span_store",
+    "go_live",
+    "go_io",
+    "get_executor",
+    "LIVE_PROCESS_COUNT",
+    "IO_THREAD_COUNT",
+    "go_fit",
+    "go_cold",
+    "warm_up_lane",
+    "STAGE_CANDLE",
+    "STAGE_DECISION",
+    "STAGE_ACCOUNT",
+    "STAGE_BACKGROUND",
+    "CycleJob",
+    "CycleScheduler",
+    "get_cycle_scheduler",
+    "LoopMonitor",
+    "LoopOffender",
+    "SlowCallback",
+    "get_loop_monitor",
+    "MetricRegistry",
+    "StreamingSummary",
+    "get_metric_registry",
+    "BULK_PROCESS_COUNT",
 ]
@@ -0,0 +1,140 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Callable, Coroutine
+
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+
+logger = logging.getLogger(__name__)
+
+# stages of a cycle, which run in this order
+STAGE_CANDLE = 0
+STAGE_DECISION = 1
+STAGE_ACCOUNT = 2
+STAGE_BACKGROUND = 3
+
+
+@dataclass
+class CycleJob:
+    name: str
+    job_function: Callable[..., Coroutine]
+    period: int  # In seconds
+    stage: int
+    deadline: float  # In seconds from the cycle start
+    kwargs: dict[str, Any] = field(default_factory=dict)
+    task: asyncio.Task | None = None
+    run_count: int = 0
+    overlap_count: int = 0  # Skipped because the last run was still going
+    late_count: int = 0  # Skipped because the deadline passed before the start
+    missed_count: int = 0  # Finished after the deadline
+    last_duration: float = 0.0  # In seconds
+
+
+class CycleScheduler:
+    """
+    Runs periodic jobs of each cycle as a pipeline of stages.
+    Stages run one after another and jobs in the same stage run together.
+    A job is skipped when its last run is still going
+    or when its deadline has passed before it could start.
+    Background jobs also wait until no trading job is running.
+    """
+
+    def __init__(self):
+        self._jobs: dict[int, list[CycleJob]] = {}
+        self._trading_count = 0
+        self._trading_idle = asyncio.Event()
+        self._trading_idle.set()
+
+    def add_job(
+        self,
+        job_function: Callable[..., Coroutine],
+        period: int,
+        stage: int,
+        deadline: float,
+        kwargs: dict[str, Any] | None = None,
+    ):
+        name = job_function.__qualname__
+        if kwargs:
+            name += f"({', '.join(f'{k}={v}' for k, v in kwargs.items())})"
+        job = CycleJob(name, job_function, period, stage, deadline, kwargs or {})
+        self._jobs.setdefault(period, []).append(job)
+
+    def get_jobs(self) -> list[CycleJob]:
+        return [j for period_jobs in self._jobs.values() for j in period_jobs]
+
+    def attach(self, scheduler: AsyncIOScheduler):
+        """
+        Starts a cycle of every period with the given scheduler.
+        """
+        for period in self._jobs.keys():
+            scheduler.add_job(
+                self.run_cycle,
+                trigger="cron",
+                second=f"*/{period}",
+                kwargs={"period": period},
+            )
+
+    async def run_cycle(self, period: int):
+        loop = asyncio.get_running_loop()
+        cycle_start = loop.time()
+        period_jobs = self._jobs.get(period, [])
+
+        for stage in sorted({j.stage for j in period_jobs}):
+            stage_jobs = [j for j in period_jobs if j.stage == stage]
+            tasks: list[asyncio.Task] = []
+            for job in stage_jobs:
+                if job.task is not None and not job.task.done():
+                    job.overlap_count += 1
+                    continue
+                job.task = asyncio.create_task(self._run_job(job, cycle_start))
+                tasks.append(job.task)
+            if not tasks:
+                continue
+            # a stuck stage should not hold back the following stages forever
+            stage_deadline = max(j.deadline for j in stage_jobs)
+            timeout = cycle_start + stage_deadline - loop.time()
+            if timeout > 0:
+                await asyncio.wait(tasks, timeout=timeout)
+
+    async def _run_job(self, job: CycleJob, cycle_start: float):
+        loop = asyncio.get_running_loop()
+        deadline = cycle_start + job.deadline
+
+        is_trading = job.stage < STAGE_BACKGROUND
+        if not is_trading and not self._trading_idle.is_set():
+            try:
+                timeout = max(deadline - loop.time(), 0.0)
+                await asyncio.wait_for(self._trading_idle.wait(), timeout)
+            except asyncio.TimeoutError:
+                job.late_count += 1
+                return
+        if loop.time() > deadline:
+            job.late_count += 1
+            return
+
+        if is_trading:
+            self._trading_count += 1
+            self._trading_idle.clear()
+
+        start_time = loop.time()
+        try:
+            await job.job_function(**job.kwargs)
+        except Exception:
+            logger.exception(f"Cycle job {job.name} raised an exception")
+        finally:
+            end_time = loop.time()
+            job.run_count += 1
+            job.last_duration = end_time - start_time
+            if end_time > deadline:
+                job.missed_count += 1
+            if is_trading:
+                self._trading_count -= 1
+                if self._trading_count == 0:
+                    self._trading_idle.set()
+
+
+cycle_scheduler = CycleScheduler()
+
+
+def get_cycle_scheduler() -> CycleScheduler:
+    return cycle_scheduler
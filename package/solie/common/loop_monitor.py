@@ -0,0 +1,165 @@
+import asyncio
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+
+import numpy as np
+
+LAG_BUCKET_EDGES = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0)  # In seconds
+
+
+@dataclass
+class SlowCallback:
+    task_name: str
+    stack: list[str]  # Innermost frame comes last
+    start_time: float  # Unix time in seconds
+    duration: float  # In seconds
+
+
+@dataclass
+class LoopOffender:
+    task_name: str
+    count: int
+    total_duration: float  # In seconds
+    max_duration: float  # In seconds
+    stack: list[str]  # From the longest block
+
+
+class LoopMonitor:
+    """
+    Watches how long the event loop is kept from running other work.
+    A sampler coroutine measures how late the loop wakes up,
+    while a watchdog thread captures the running task and its stack
+    when the loop stops responding for longer than the threshold.
+    """
+
+    def __init__(
+        self,
+        interval: float = 0.1,
+        slow_threshold: float = 0.1,
+        capacity: int = 2**12,
+    ):
+        self.interval = interval
+        self.slow_threshold = slow_threshold
+        self.lags: deque[float] = deque(maxlen=capacity)
+        self.slow_callbacks: deque[SlowCallback] = deque(maxlen=2**8)
+        self._heartbeat = time.perf_counter()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread_id: int | None = None
+        self._is_watching = False
+
+    async def watch(self):
+        """
+        Keeps sampling the loop lag until `stop` is called.
+        """
+        self._loop = asyncio.get_running_loop()
+        self._loop_thread_id = threading.get_ident()
+        self._heartbeat = time.perf_counter()
+        self._is_watching = True
+        watchdog = threading.Thread(target=self._watch_blocking, daemon=True)
+        watchdog.start()
+
+        while self._is_watching:
+            expected_time = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            now = time.perf_counter()
+            self.lags.append(max(now - expected_time, 0.0))
+            self._heartbeat = now
+
+    def stop(self):
+        self._is_watching = False
+
+    def _watch_blocking(self):
+        # runs in a separate thread, which can see the blocked loop thread
+        slow_callback: SlowCallback | None = None
+        while self._is_watching:
+            time.sleep(self.slow_threshold / 4)
+            silence = time.perf_counter() - self._heartbeat - self.interval
+            if silence < self.slow_threshold:
+                slow_callback = None
+            elif slow_callback is None:
+                slow_callback = self._capture_slow_callback(silence)
+                if slow_callback is not None:
+                    self.slow_callbacks.append(slow_callback)
+            else:
+                slow_callback.duration = silence
+
+    def _capture_slow_callback(self, silence: float) -> SlowCallback | None:
+        loop = self._loop
+        thread_id = self._loop_thread_id
+        if loop is None or thread_id is None:
+            return None
+        # the standard library has no public way to see another thread's stack
+        frame = sys._current_frames().get(thread_id)  # noqa: SLF001
+        if frame is None:
+            return None
+        stack = traceback.format_list(traceback.extract_stack(frame, limit=16))
+        task = asyncio.current_task(loop)
+        if task is None:
+            task_name = "callback"
+        else:
+            coroutine = task.get_coro()
+            coroutine_name = getattr(coroutine, "__qualname__", "")
+            task_name = f"{task.get_name()} {coroutine_name}".strip()
+        return SlowCallback(task_name, stack, time.time() - silence, silence)
+
+    def summarize_lags(self) -> dict[str, float]:
+        """
+        Returns percentiles of recent loop lags.
+        """
+        if len(self.lags) == 0:
+            return {}
+        lags = np.fromiter(self.lags, np.float64)
+        p50, p95, p99 = np.percentile(lags, (50, 95, 99))
+        return {
+            "count": len(lags),
+            "p50": float(p50),
+            "p95": float(p95),
+            "p99": float(p99),
+            "max": float(lags.max()),
+        }
+
+    def get_lag_histogram(self) -> list[tuple[str, int]]:
+        """
+        Counts recent loop lags in each range.
+        """
+        lags = np.fromiter(self.lags, np.float64)
+        bucket_indices = np.searchsorted(LAG_BUCKET_EDGES, lags, side="right")
+        counts = np.bincount(bucket_indices, minlength=len(LAG_BUCKET_EDGES) + 1)
+        labels = [f"<{e * 1000:g}ms" for e in LAG_BUCKET_EDGES]
+        labels.append(f">={LAG_BUCKET_EDGES[-1] * 1000:g}ms")
+        return list(zip(labels, counts.tolist()))
+
+    def get_worst_offenders(self, count: int) -> list[LoopOffender]:
+        """
+        Groups slow callbacks by task and sorts them by total blocked time.
+        """
+        offenders: dict[str, LoopOffender] = {}
+        for slow_callback in list(self.slow_callbacks):
+            task_name = slow_callback.task_name
+            duration = slow_callback.duration
+            offender = offenders.get(task_name)
+            if offender is None:
+                offender = LoopOffender(task_name, 0, 0.0, 0.0, slow_callback.stack)
+                offenders[task_name] = offender
+            offender.count += 1
+            offender.total_duration += duration
+            if duration > offender.max_duration:
+                offender.max_duration = duration
+                offender.stack = slow_callback.stack
+        sorted_offenders = sorted(
+            offenders.values(),
+            key=lambda o: o.total_duration,
+            reverse=True,
+        )
+        return sorted_offenders[:count]
+
+
+loop_monitor = LoopMonitor()
+
+
+def get_loop_monitor() -> LoopMonitor:
+    return loop_monitor
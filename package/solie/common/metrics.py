@@ -0,0 +1,161 @@
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+
+RELATIVE_ACCURACY = 0.01
+GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+LOG_GAMMA = math.log(GAMMA)
+
+
+@dataclass
+class SummarySlice:
+    start_time: float  # Monotonic time in seconds
+    count: int = 0
+    total: float = 0.0
+    minimum: float = math.inf
+    maximum: float = 0.0
+    zero_count: int = 0
+    buckets: dict[int, int] = field(default_factory=dict)
+
+
+class StreamingSummary:
+    """
+    Summarizes recent non-negative values without keeping them.
+    The window is split into slices that are dropped as they get old,
+    so it covers the last `window` seconds give or take one slice.
+    Quantiles are estimated from logarithmic buckets
+    within a relative error of `RELATIVE_ACCURACY`.
+    """
+
+    def __init__(self, window: float = 600.0, slice_count: int = 10):
+        self.window = window
+        self._slice_length = window / slice_count
+        self._slices: deque[SummarySlice] = deque()
+        self._version = 0
+        self._cached_version = -1
+        self._cached_quantiles: dict[float, float] = {}
+
+    def add(self, value: float):
+        now = time.monotonic()
+        slices = self._slices
+        if not slices or now - slices[-1].start_time >= self._slice_length:
+            self._expire(now)
+            slices.append(SummarySlice(now))
+        current = slices[-1]
+        current.count += 1
+        current.total += value
+        if value < current.minimum:
+            current.minimum = value
+        if value > current.maximum:
+            current.maximum = value
+        if value <= 0.0:
+            current.zero_count += 1
+        else:
+            key = math.ceil(math.log(value) / LOG_GAMMA)
+            current.buckets[key] = current.buckets.get(key, 0) + 1
+        self._version += 1
+
+    def _expire(self, now: float):
+        slices = self._slices
+        while slices and slices[0].start_time < now - self.window:
+            slices.popleft()
+            self._version += 1
+
+    def _get_slices(self) -> deque[SummarySlice]:
+        self._expire(time.monotonic())
+        return self._slices
+
+    @property
+    def version(self) -> int:
+        """
+        Changes whenever a value is added or dropped.
+        """
+        self._expire(time.monotonic())
+        return self._version
+
+    @property
+    def count(self) -> int:
+        return sum(s.count for s in self._get_slices())
+
+    @property
+    def total(self) -> float:
+        return sum(s.total for s in self._get_slices())
+
+    @property
+    def minimum(self) -> float:
+        return min((s.minimum for s in self._get_slices()), default=math.inf)
+
+    @property
+    def maximum(self) -> float:
+        return max((s.maximum for s in self._get_slices()), default=0.0)
+
+    @property
+    def mean(self) -> float:
+        count = self.count
+        return self.total / count if count > 0 else 0.0
+
+    def get_quantiles(self, quantiles: tuple[float, ...]) -> dict[float, float]:
+        """
+        Estimates the given quantiles, between 0 and 1, in one pass.
+        Results are reused until a value is added or dropped.
+        """
+        if self.version != self._cached_version:
+            self._cached_quantiles.clear()
+            self._cached_version = self._version
+        missing = sorted(q for q in quantiles if q not in self._cached_quantiles)
+        slices = self._slices
+        count = sum(s.count for s in slices)
+        if missing and count > 0:
+            buckets: dict[int, int] = {}
+            for summary_slice in slices:
+                for key, bucket_count in summary_slice.buckets.items():
+                    buckets[key] = buckets.get(key, 0) + bucket_count
+            minimum = min(s.minimum for s in slices)
+            maximum = max(s.maximum for s in slices)
+
+            cumulated = sum(s.zero_count for s in slices)
+            bucket_items = iter(sorted(buckets.items()))
+            bucket_key: int | None = None
+            for quantile in missing:
+                rank = quantile * (count - 1)
+                while cumulated <= rank:
+                    bucket_key, bucket_count = next(bucket_items)
+                    cumulated += bucket_count
+                if bucket_key is None:
+                    estimate = 0.0
+                else:
+                    estimate = 2 * GAMMA**bucket_key / (GAMMA + 1)
+                estimate = min(max(estimate, minimum), maximum)
+                self._cached_quantiles[quantile] = estimate
+        return {q: self._cached_quantiles.get(q, 0.0) for q in quantiles}
+
+
+class MetricRegistry:
+    """
+    Keeps a streaming summary for each named metric.
+    Displays can tell if a metric has changed from its summary's `version`.
+    """
+
+    def __init__(self):
+        self._summaries: dict[str, StreamingSummary] = {}
+
+    def add(self, name: str, value: float):
+        summary = self._summaries.get(name)
+        if summary is None:
+            summary = StreamingSummary()
+            self._summaries[name] = summary
+        summary.add(value)
+
+    def get_summaries(self) -> dict[str, StreamingSummary]:
+        return self._summaries
+
+    def clear(self):
+        self._summaries.clear()
+
+
+metric_registry = MetricRegistry()
+
+
+def get_metric_registry() -> MetricRegistry:
+    return metric_registry
@@ -1,20 +1,61 @@
 import asyncio
 import functools
-from concurrent.futures import ProcessPoolExecutor
-from multiprocessing import Manager, cpu_count
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from importlib import import_module
+from multiprocessing import Manager, cpu_count, get_context
 from multiprocessing.managers import SyncManager
-from typing import Callable, TypeVar, ParamSpec
+from typing import Any, Callable, TypeVar, ParamSpec
+
+from .span_timing import get_span_store
 
 T = TypeVar("T")
 P = ParamSpec("P")
 
 PROCESS_COUNT = cpu_count()
+LIVE_PROCESS_COUNT = max(2, PROCESS_COUNT // 4)
+# lanes together don't use more processes than there are cores
+BULK_PROCESS_COUNT = max(1, PROCESS_COUNT - LIVE_PROCESS_COUNT)
+IO_THREAD_COUNT = 8
+INLINE_SIZE_LIMIT = 2**20  # In bytes
+
 sync_manager: SyncManager | None = None
+executors: dict[str, Executor] = {}
+lane_sizes = {
+    "live": LIVE_PROCESS_COUNT,
+    "bulk": BULK_PROCESS_COUNT,
+    "io": IO_THREAD_COUNT,
+}
+
+
+def initialize_worker():
+    """
+    Imports heavy modules as soon as a worker process starts,
+    instead of during its first task.
+    """
+    import_module("solie.utility.analyze_market")
 
 
 def prepare_process_pool():
-    global process_pool
-    process_pool = ProcessPoolExecutor(PROCESS_COUNT)
+    """
+    Prepares an executor for each lane of work,
+    so that work in one lane never waits behind another.
+
+    - `live`: Reserved processes for the live trading cycle
+    - `bulk`: Processes for simulations, downloads and other heavy work
+    - `io`: Threads for blocking I/O that doesn't need a process
+    """
+    executors["live"] = ProcessPoolExecutor(
+        lane_sizes["live"], initializer=initialize_worker
+    )
+    executors["bulk"] = ProcessPoolExecutor(
+        lane_sizes["bulk"], initializer=initialize_worker
+    )
+    executors["io"] = ThreadPoolExecutor(lane_sizes["io"])
+
+
+def get_executor(lane: str) -> Executor:
+    return executors[lane]
 
 
 def get_sync_manager() -> SyncManager:
@@ -24,9 +65,51 @@ def get_sync_manager() -> SyncManager:
     return sync_manager
 
 
+def run_with_start_time(callable: Callable[[], T]) -> tuple[float, T]:
+    """
+    Runs inside a worker process and tells when the work actually started.
+    """
+    start_time = time.time()
+    return start_time, callable()
+
+
+async def run_in_lane(
+    lane: str,
+    callable: Callable[P, T],
+    *args: P.args,
+    **kwargs: P.kwargs,
+) -> T:
+    event_loop = asyncio.get_event_loop()
+    submit_time = time.time()
+    start_time, result = await event_loop.run_in_executor(
+        executors[lane],
+        functools.partial(
+            run_with_start_time,
+            functools.partial(
+                callable,
+                *args,
+                **kwargs,
+            ),
+        ),
+    )
+
+    # time spent waiting for a free worker and sending arguments
+    function_name = getattr(callable, "__name__", type(callable).__name__)
+    queue_wait = start_time - submit_time
+    get_span_store().add(
+        "pool_queue_wait",
+        submit_time,
+        queue_wait,
+        lane=lane,
+        function=function_name,
+    )
+
+    return result
+
+
 async def go(callable: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
     """
-    Executes the given callable in a separate process pool
+    Executes the given callable in the bulk process pool
     using `asyncio`'s `run_in_executor`.
     This function is intended for executing blocking or CPU-bound operations
     asynchronously outside `asyncio`'s event loop.
@@ -44,13 +127,112 @@ async def go(callable: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
     print(result)  # Output: 30
     ```
     """
-    event_loop = asyncio.get_event_loop()
-    result = await event_loop.run_in_executor(
-        process_pool,
-        functools.partial(
-            callable,
-            *args,
-            **kwargs,
-        ),
+    return await run_in_lane("bulk", callable, *args, **kwargs)
+
+
+async def go_live(callable: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """
+    Same as `go`, but uses the process pool reserved for live trading.
+    Only work that the next order depends on should come here.
+    """
+    return await run_in_lane("live", callable, *args, **kwargs)
+
+
+async def go_io(callable: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """
+    Same as `go`, but uses a thread pool.
+    This suits blocking I/O such as reading files or opening a browser,
+    because arguments and results are not copied between processes.
+    """
+    return await run_in_lane("io", callable, *args, **kwargs)
+
+
+def estimate_size(value: Any) -> int:
+    """
+    Roughly tells how many bytes of array data a value holds.
+    Pandas and NumPy objects are measured without inspecting Python objects.
+    """
+    if hasattr(value, "memory_usage"):
+        usage = value.memory_usage(index=True, deep=False)
+        return int(usage.sum()) if hasattr(usage, "sum") else int(usage)
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    if isinstance(value, (list, tuple)):
+        return sum(estimate_size(v) for v in value)
+    if isinstance(value, dict):
+        return sum(estimate_size(v) for v in value.values())
+    return 0
+
+
+async def go_fit(callable: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """
+    Runs a pandas or NumPy operation where it costs the least.
+    Small inputs are handled right away on the event loop,
+    and larger ones in a thread, as their kernels mostly release the GIL.
+    Unlike `go`, data is never copied to another process,
+    which would take longer than operations like sorting or concatenating.
+    The chosen path is recorded as a span.
+    """
+    size = estimate_size(args) + estimate_size(kwargs)
+    function_name = getattr(callable, "__name__", type(callable).__name__)
+    start_time = time.time()
+    start_counter = time.perf_counter()
+
+    if size <= INLINE_SIZE_LIMIT:
+        span_name = "dispatch_inline"
+        result = callable(*args, **kwargs)
+    else:
+        span_name = "dispatch_thread"
+        result = await run_in_lane("io", callable, *args, **kwargs)
+
+    duration = time.perf_counter() - start_counter
+    get_span_store().add(
+        span_name,
+        start_time,
+        duration,
+        function=function_name,
+        size=size,
     )
+
     return result
+
+
+def run_after_others(callable: Callable[[], Any], barrier: Any):
+    callable()
+    # keep this worker until every worker got its own run
+    barrier.wait(timeout=60)
+
+
+async def warm_up_lane(
+    lane: str,
+    callable: Callable[P, Any],
+    *args: P.args,
+    **kwargs: P.kwargs,
+):
+    """
+    Starts every worker process of a lane
+    and runs the callable once in each of them.
+    """
+    worker_count = lane_sizes[lane]
+    barrier = get_sync_manager().Barrier(worker_count)
+    job = functools.partial(callable, *args, **kwargs)
+    coroutines = [
+        run_in_lane(lane, run_after_others, job, barrier) for _ in range(worker_count)
+    ]
+    await asyncio.gather(*coroutines)
+
+
+async def go_cold(callable: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """
+    Runs the callable in a newly spawned process without any preparation.
+    This is only for measuring how long a cold start takes.
+    """
+    cold_executor = ProcessPoolExecutor(1, mp_context=get_context("spawn"))
+    try:
+        event_loop = asyncio.get_event_loop()
+        return await event_loop.run_in_executor(
+            cold_executor,
+            functools.partial(callable, *args, **kwargs),
+        )
+    finally:
+        cold_executor.shutdown(wait=False)
@@ -0,0 +1,97 @@
+import json
+import time
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+import aiofiles
+import numpy as np
+
+from .metrics import get_metric_registry
+
+
+@dataclass
+class Span:
+    name: str
+    start_time: float  # Unix time in seconds
+    duration: float  # In seconds
+    attributes: dict[str, str | int | float] = field(default_factory=dict)
+
+
+class SpanStore:
+    """
+    Keeps recent timing spans of each stage in memory.
+    Every span name has its own bounded queue,
+    so that frequent spans don't push out rare ones.
+    """
+
+    def __init__(self, capacity: int = 2**12):
+        self.capacity = capacity
+        self._spans: dict[str, deque[Span]] = {}
+
+    def add(
+        self,
+        name: str,
+        start_time: float,
+        duration: float,
+        **attributes: str | int | float,
+    ):
+        if name not in self._spans:
+            self._spans[name] = deque(maxlen=self.capacity)
+        self._spans[name].append(Span(name, start_time, duration, attributes))
+        get_metric_registry().add(name, duration)
+
+    @contextmanager
+    def measure(self, name: str, **attributes: str | int | float):
+        """
+        Records the time spent inside the `with` block.
+        """
+        start_time = time.time()
+        start_counter = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start_counter
+            self.add(name, start_time, duration, **attributes)
+
+    def get_spans(self) -> list[Span]:
+        spans = [s for name_spans in self._spans.values() for s in name_spans]
+        spans.sort(key=lambda s: s.start_time)
+        return spans
+
+    def summarize(self) -> dict[str, dict[str, float]]:
+        """
+        Returns the count and percentiles of durations by span name.
+        """
+        summary = {}
+        for name, name_spans in self._spans.items():
+            if len(name_spans) == 0:
+                continue
+            durations = np.fromiter((s.duration for s in name_spans), np.float64)
+            p50, p95, p99 = np.percentile(durations, (50, 95, 99))
+            summary[name] = {
+                "count": len(durations),
+                "p50": float(p50),
+                "p95": float(p95),
+                "p99": float(p99),
+            }
+        return summary
+
+    async def export(self, filepath: Path):
+        """
+        Writes all kept spans as JSON lines in chronological order.
+        """
+        lines = [json.dumps(asdict(s)) + "\n" for s in self.get_spans()]
+        async with aiofiles.open(filepath, "w", encoding="utf8") as file:
+            await file.writelines(lines)
+
+    def clear(self):
+        self._spans.clear()
+
+
+span_store = SpanStore()
+
+
+def get_span_store() -> SpanStore:
+    return span_store
@@ -4,7 +4,13 @@ import logging
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from PySide6 import QtGui, QtWidgets
 
-from solie.common import PACKAGE_NAME, PACKAGE_PATH
+from solie.common import (
+    PACKAGE_NAME,
+    PACKAGE_PATH,
+    get_cycle_scheduler,
+    get_loop_monitor,
+)
+from solie.utility import close_http_session
 from solie.widget import AskPopup, OverlayPopup
 from solie.window import Window
 from solie.worker import (
@@ -57,6 +63,7 @@ async def live():
 
     logging.getLogger(PACKAGE_NAME).setLevel("DEBUG")
     asyncio.create_task(window.process_events())
+    asyncio.create_task(get_loop_monitor().watch())
     await window.boot()
     logger.info("Started up")
 
@@ -89,7 +96,9 @@ async def live():
     asyncio.create_task(simulator.display_available_years())
     asyncio.create_task(manager.check_binance_limits())
     asyncio.create_task(manager.display_internal_status())
+    asyncio.create_task(transactor.prepare_live_workers())
 
+    get_cycle_scheduler().attach(scheduler)
     scheduler.start()
     await asyncio.sleep(1)
 
@@ -97,6 +106,7 @@ async def live():
     await close_event.wait()
 
     scheduler.shutdown()
+    get_loop_monitor().stop()
     await asyncio.sleep(1)
 
     tasks = [
@@ -104,5 +114,8 @@ async def live():
         asyncio.create_task(transactor.save_scribbles()),
         asyncio.create_task(strategist.save_strategies()),
         asyncio.create_task(collector.save_candle_data()),
+        asyncio.create_task(collector.save_tick_archives()),
     ]
     await asyncio.wait(tasks)
+
+    await close_http_session()
@@ -1,15 +1,27 @@
+from .account_drift import find_account_drift
 from .analyze_market import (
     CalculationInput,
     CalculationOutput,
     SimulationError,
+    compile_script,
     decide,
     make_indicators,
     simulate_chunk,
+    time_first_decision,
+    warm_up_strategy,
 )
 from .api_requester import ApiRequester, ApiRequestError
 from .api_streamer import ApiStreamer
+from .archive_download import ArchiveCache, ArchiveDownloader
 from .backward_compatibility import examine_data_files
 from .ball import ball_ceil, ball_floor
+from .candle_coverage import (
+    BackfillProgress,
+    count_daily_candles,
+    is_period_covered,
+    read_daily_candle_counts,
+)
+from .candle_notifier import CandleClosed, CandleNotifier
 from .check_internet import (
     internet_connected,
     is_internet_checked,
@@ -19,16 +31,55 @@ from .check_internet import (
 )
 from .compare_versions import is_left_version_higher
 from .convert import list_to_dict, slice_deque
+from .decode_json import (
+    JSON_LIBRARY,
+    decode_json,
+    measure_decoding_speed,
+    parse_aggregate_trade,
+    parse_book_ticker,
+    parse_mark_prices,
+)
 from .download_from_binance import (
     DownloadPreset,
-    download_aggtrade_data,
     fill_holes_with_aggtrades,
+    find_candle_holes,
+    get_aggtrade_archive_url,
+    read_aggtrade_archive,
+)
+from .exchange_info import (
+    ExchangeInfoCache,
+    ExchangeInformation,
+    get_exchange_info_cache,
+    parse_exchange_information,
+)
+from .http_session import (
+    HttpSessionSettings,
+    close_http_session,
+    configure_http_session,
+    get_http_session,
 )
 from .log_handler import LogHandler
-from .pandas_related import combine_candle_data
+from .pandas_related import (
+    CandleGrid,
+    add_candle_row,
+    assemble_candle_data,
+    combine_candle_data,
+    make_candle_values,
+    merge_candle_data_file,
+)
 from .percent_axis_item import PercentAxisItem
-from .rw_lock import RWLock
+from .rate_limiter import (
+    PRIORITY_ACCOUNT,
+    PRIORITY_BACKFILL,
+    PRIORITY_ORDER,
+    RateLimiter,
+)
+from .redraw_coordinator import RedrawCoordinator
+from .replay_harness import ReplayHarness
+from .ring_buffer import BOOK_TICKER_DTYPE, MARK_PRICE_DTYPE, RingBuffer
+from .rw_lock import LockStats, RWLock, get_lock_stats
 from .simply_format import format_numeric
+from .snapshot_store import Snapshot, SnapshotStore
 from .sort_pandas import sort_data_frame, sort_series
 from .standardize import (
     create_empty_account_state,
@@ -38,10 +89,20 @@ from .standardize import (
     create_strategy_code_name,
 )
 from .stop_flag import find_stop_flag, make_stop_flag
+from .stream_record import (
+    ReplayExchange,
+    StreamRecorder,
+    UnrecordedRequestError,
+    get_stream_kind,
+    get_stream_recorder,
+    read_recording,
+    record_streams,
+)
 from .structs import (
     BOARD_LOCK_OPTIONS,
     AggregateTrade,
     BookTicker,
+    CollectorSettings,
     ManagementSettings,
     MarkPrice,
     SimulationSettings,
@@ -51,8 +112,9 @@ from .structs import (
     TransactionSettings,
 )
 from .syntax_highlighter import SyntaxHighlighter
+from .tick_archive import TickArchive, read_tick_archive
 from .time_axis_item import TimeAxisItem
-from .timing import add_task_duration, get_task_duration, to_moment
+from .timing import add_task_duration, to_moment
 from .user_settings import (
     DataSettings,
     read_data_settings,
@@ -75,14 +137,12 @@ __all__ = [
     "is_left_version_higher",
     "list_to_dict",
     "decide",
-    "download_aggtrade_data",
     "examine_data_files",
     "fill_holes_with_aggtrades",
     "LogHandler",
     "make_indicators",
     "PercentAxisItem",
     "add_task_duration",
-    "get_task_duration",
     "RWLock",
     "format_numeric",
     "sort_data_frame",
@@ -120,4 +180,61 @@ __all__ = [
     "MarkPrice",
     "AggregateTrade",
     "slice_deque",
+    "JSON_LIBRARY",
+    "decode_json",
+    "measure_decoding_speed",
+    "parse_aggregate_trade",
+    "parse_book_ticker",
+    "parse_mark_prices",
+    "RingBuffer",
+    "BOOK_TICKER_DTYPE",
+    "MARK_PRICE_DTYPE",
+    "TickArchive",
+    "read_tick_archive",
+    "CollectorSettings",
+    "ReplayExchange",
+    "StreamRecorder",
+    "UnrecordedRequestError",
+    "get_stream_kind",
+    "get_stream_recorder",
+    "record_streams",
+    "read_recording",
+    "find_candle_holes",
+    "ArchiveCache",
+    "ArchiveDownloader",
+    "get_aggtrade_archive_url",
+    "read_aggtrade_archive",
+    "assemble_candle_data",
+    "BackfillProgress",
+    "count_daily_candles",
+    "is_period_covered",
+    "read_daily_candle_counts",
+    "merge_candle_data_file",
+    "RateLimiter",
+    "PRIORITY_ORDER",
+    "PRIORITY_ACCOUNT",
+    "PRIORITY_BACKFILL",
+    "HttpSessionSettings",
+    "close_http_session",
+    "configure_http_session",
+    "get_http_session",
+    "ExchangeInfoCache",
+    "ExchangeInformation",
+    "get_exchange_info_cache",
+    "parse_exchange_information",
+    "find_account_drift",
+    "compile_script",
+    "time_first_decision",
+    "warm_up_strategy",
+    "LockStats",
+    "get_lock_stats",
+    "add_candle_row",
+    "CandleGrid",
+    "make_candle_values",
+    "Snapshot",
+    "SnapshotStore",
+    "CandleClosed",
+    "CandleNotifier",
+    "RedrawCoordinator",
+    "ReplayHarness",
 ]
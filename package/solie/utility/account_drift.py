@@ -0,0 +1,46 @@
+def is_value_drifted(expected: float, actual: float) -> bool:
+    # differences smaller than a billionth are numeric errors
+    scale = max(abs(expected), abs(actual))
+    if scale == 0:
+        return False
+    return abs(expected - actual) / scale > 10**-9
+
+
+def find_account_drift(expected_state: dict, actual_state: dict) -> list[str]:
+    """
+    Compares an account state kept by the user data stream
+    with one rebuilt from REST responses.
+    Returns descriptions of the differences.
+    """
+    drifts = []
+
+    expected_balance = expected_state["wallet_balance"]
+    actual_balance = actual_state["wallet_balance"]
+    if is_value_drifted(expected_balance, actual_balance):
+        drifts.append(f"Wallet balance {expected_balance} -> {actual_balance}")
+
+    for symbol, actual_position in actual_state["positions"].items():
+        expected_position = expected_state["positions"].get(symbol)
+        if expected_position is None:
+            continue
+        expected_direction = expected_position["direction"]
+        actual_direction = actual_position["direction"]
+        if expected_direction != actual_direction:
+            drifts.append(
+                f"{symbol} direction {expected_direction} -> {actual_direction}"
+            )
+        expected_price = expected_position["entry_price"]
+        actual_price = actual_position["entry_price"]
+        if is_value_drifted(expected_price, actual_price):
+            drifts.append(f"{symbol} entry price {expected_price} -> {actual_price}")
+
+    for symbol, actual_orders in actual_state["open_orders"].items():
+        expected_orders = expected_state["open_orders"].get(symbol, {})
+        missing_ids = actual_orders.keys() - expected_orders.keys()
+        stale_ids = expected_orders.keys() - actual_orders.keys()
+        if missing_ids:
+            drifts.append(f"{symbol} missed open orders {sorted(missing_ids)}")
+        if stale_ids:
+            drifts.append(f"{symbol} kept closed orders {sorted(stale_ids)}")
+
+    return drifts
@@ -1,6 +1,8 @@
+import functools
 import itertools
 import math
 import random
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from multiprocessing.managers import ListProxy
@@ -12,12 +14,24 @@ import pandas as pd
 import pandas_ta as ta
 
 
+@functools.lru_cache(maxsize=16)
+def compile_script(script: str) -> CodeType:
+    """
+    Compiled scripts are kept in each process,
+    so that a strategy isn't compiled again on every call.
+    """
+    return compile(script, "<string>", "exec")
+
+
 def make_indicators(
     target_symbols: list[str],
     candle_data: pd.DataFrame,
     indicators_script: str | CodeType,
     only_last_index: bool = False,
 ) -> pd.DataFrame:
+    if isinstance(indicators_script, str):
+        indicators_script = compile_script(indicators_script)
+
     # ■■■■■ interpolate nans ■■■■■
 
     candle_data = candle_data.interpolate()  # type:ignore
@@ -87,6 +101,9 @@ def decide(
     scribbles: dict,
     decision_script: str | CodeType,
 ) -> Tuple[dict, dict]:
+    if isinstance(decision_script, str):
+        decision_script = compile_script(decision_script)
+
     # ■■■■■ decision template ■■■■■
 
     decision = {}
@@ -123,6 +140,73 @@ def decide(
     return decision, scribbles
 
 
+def warm_up_strategy(indicators_script: str, decision_script: str):
+    """
+    Compiles the strategy scripts and runs the indicators script once
+    on a small random candle data,
+    so that the first real call in this process doesn't pay for it.
+    """
+    compile_script(decision_script)
+
+    row_count = 1000
+    index = pd.date_range(
+        datetime.fromtimestamp(0, tz=timezone.utc),
+        periods=row_count,
+        freq="10S",
+    )
+    prices = 100 + np.cumsum(np.random.normal(0, 0.1, row_count))
+    candle_data = pd.DataFrame(
+        {
+            ("WARMUP", "Open"): prices,
+            ("WARMUP", "High"): prices + 0.1,
+            ("WARMUP", "Low"): prices - 0.1,
+            ("WARMUP", "Close"): prices,
+            ("WARMUP", "Volume"): np.ones(row_count),
+        },
+        index=index,
+        dtype=np.float32,
+    )
+
+    try:
+        make_indicators(["WARMUP"], candle_data, indicators_script)
+    except Exception:
+        # the script might not expect random data,
+        # but modules that it uses are loaded by now
+        pass
+
+
+def time_first_decision(
+    target_symbols: list[str],
+    candle_data: pd.DataFrame,
+    indicators_script: str,
+    decision_script: str,
+    account_state: dict,
+    scribbles: dict,
+) -> float:
+    """
+    Makes indicators and a decision like a live transaction cycle does,
+    returning the duration in seconds.
+    """
+    start_time = time.perf_counter()
+    indicators = make_indicators(
+        target_symbols=target_symbols,
+        candle_data=candle_data,
+        indicators_script=indicators_script,
+        only_last_index=True,
+    )
+    current_moment = candle_data.index[-1]
+    decide(
+        target_symbols=target_symbols,
+        current_moment=current_moment,
+        current_candle_data=candle_data.tail(1).to_records()[-1],
+        current_indicators=indicators.to_records()[-1],
+        account_state=account_state,
+        scribbles=scribbles,
+        decision_script=decision_script,
+    )
+    return time.perf_counter() - start_time
+
+
 class SimulationError(Exception):
     pass
 
@@ -198,7 +282,7 @@ def simulate_chunk(calculation_input: CalculationInput) -> CalculationOutput:
     # ■■■■■ actual loop calculation ■■■■■
 
     calculation_index_length = len(calculation_index_ar)
-    decision_script_compiled = compile(decision_script, "<string>", "exec")
+    decision_script_compiled = compile_script(decision_script)
     first_calculation_moment = calculation_index_ar[0]
 
     for cycle in range(calculation_index_length):
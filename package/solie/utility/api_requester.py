@@ -1,11 +1,13 @@
-import asyncio
 import hashlib
 import hmac
 import json
 from datetime import datetime, timezone
 from urllib.parse import urlencode
 
-from aiohttp import ClientSession
+from .decode_json import decode_json
+from .http_session import get_http_session
+from .rate_limiter import RateLimiter, get_endpoint_rule
+from .stream_record import get_stream_recorder
 
 
 class ApiRequestError(Exception):
@@ -19,22 +21,34 @@ class ApiRequestError(Exception):
 
 class ApiRequester:
     used_rates = {}
+    rate_limiter = RateLimiter()
 
     def __init__(self):
-        self._session = ClientSession()
         self._binance_api_key = ""
         self._binance_api_secret = ""
 
-    def __del__(self):
-        asyncio.create_task(self._session.close())
-
     def update_keys(self, binance_api_key: str, binance_api_secret: str):
         self._binance_api_key = binance_api_key
         self._binance_api_secret = binance_api_secret
 
     async def binance(
-        self, http_method: str, path: str, payload: dict = {}, server="futures"
+        self,
+        http_method: str,
+        path: str,
+        payload: dict = {},
+        server="futures",
+        priority: int | None = None,
     ):
+        """
+        Futures requests wait in the shared rate limiter first.
+        When `priority` is not given, it's decided by the endpoint.
+        """
+        if server == "futures":
+            weight, endpoint_priority = get_endpoint_rule(http_method, path, payload)
+            if priority is None:
+                priority = endpoint_priority
+            await self.rate_limiter.acquire(weight, priority)
+
         query_string = urlencode(payload)
         # replace single quote to double quote
         query_string = query_string.replace("%27", "%22")
@@ -55,8 +69,8 @@ class ApiRequester:
         url += path
         url += "?" + query_string + "&signature=" + signature
 
-        async with self._session.request(http_method, url, headers=headers) as raw:
-            response = await raw.json()
+        async with get_http_session().request(http_method, url, headers=headers) as raw:
+            response = decode_json(await raw.read())
 
         # record api usage
         for header_key in raw.headers.keys():
@@ -64,6 +78,16 @@ class ApiRequester:
                 write_value = raw.headers[header_key]
                 current_time = datetime.now(timezone.utc)
                 self.used_rates[header_key] = (write_value, current_time)
+        if server == "futures":
+            self.rate_limiter.sync(raw.headers)
+            if raw.status in (418, 429):
+                # banned or about to be banned
+                retry_after = float(raw.headers.get("Retry-After", 60))
+                self.rate_limiter.block(retry_after)
+
+        recorder = get_stream_recorder()
+        if recorder is not None:
+            recorder.record_response(http_method, path, payload, response)
 
         # check if the response contains error message
         if "code" in response and response["code"] != 200:
@@ -81,8 +105,8 @@ class ApiRequester:
 
         url = "https://api.coingecko.com" + path + "?" + query_string
 
-        async with self._session.request(http_method, url) as raw:
-            response = await raw.json()
+        async with get_http_session().request(http_method, url) as raw:
+            response = decode_json(await raw.read())
 
         return response
 
@@ -91,7 +115,7 @@ class ApiRequester:
             "User-agent": "Mozilla/5.0",
         }
 
-        async with self._session.request("GET", url, headers=headers) as raw:
+        async with get_http_session().request("GET", url, headers=headers) as raw:
             response = await raw.read()
 
         status_code = raw.status
@@ -1,16 +1,20 @@
 import asyncio
 import json
 import logging
-from typing import Callable, Coroutine
+from typing import Any, Callable, Coroutine
 
-from aiohttp import ClientError, ClientSession, WSMsgType
+from aiohttp import ClientError, ClientWebSocketResponse, WSMsgType
+
+from .decode_json import decode_json
+from .http_session import get_http_session
+from .stream_record import get_stream_recorder
 
 logger = logging.getLogger(__name__)
 
 
 class ApiStreamError(Exception):
-    def __init__(self, received: dict | list):
-        formatted = json.dumps(received, indent=2)
+    def __init__(self, received: Any):
+        formatted = json.dumps(received, indent=2, default=str)
         super().__init__(formatted)
 
 
@@ -18,12 +22,18 @@ class ApiStreamer:
     def __init__(
         self,
         url: str,
-        handler: Callable[[dict], Coroutine] | Callable[[list], Coroutine],
+        handler: Callable[[Any], Coroutine],
+        parser: Callable[[str], Any] = decode_json,
     ):
+        """
+        `parser` turns each text frame into what `handler` receives.
+        Schema-specific parsers can be given to skip building dictionaries.
+        """
         self._url = url
         self._handler = handler
-        self._session = ClientSession()
+        self._parser = parser
         self._is_open = True
+        self._websocket: ClientWebSocketResponse | None = None
 
         asyncio.create_task(self._keep_connecting())
 
@@ -31,6 +41,11 @@ class ApiStreamer:
     def url(self) -> str:
         return self._url
 
+    @property
+    def is_connected(self) -> bool:
+        websocket = self._websocket
+        return websocket is not None and not websocket.closed
+
     async def _keep_connecting(self):
         while self._is_open:
             try:
@@ -41,7 +56,9 @@ class ApiStreamer:
             await asyncio.sleep(5.0)
 
     async def _keep_listening(self):
-        async with self._session.ws_connect(self._url, heartbeat=5.0) as websocket:
+        session = get_http_session()
+        async with session.ws_connect(self._url, heartbeat=5.0) as websocket:
+            self._websocket = websocket
             logger.info(f"Websocket connected\n{self._url}")
             async for message in websocket:
                 if message.type == WSMsgType.ERROR:
@@ -49,17 +66,28 @@ class ApiStreamer:
                     parsed = json.dumps(message.json(), indent=2)
                     logger.warning(f"Websocket got an error message\n{url}\n{parsed}")
                 else:
-                    content = message.json()
+                    recorder = get_stream_recorder()
+                    if recorder is not None:
+                        recorder.record_frame(self._url, message.data)
+                    self.feed(message.data)
+            logger.info(f"Websocket disconnected\n{self._url}")
 
-                    def done_callback(task: asyncio.Task, content=content):
-                        error = task.exception()
-                        if error:
-                            raise ApiStreamError(content) from error
+    def feed(self, frame: str):
+        """
+        Passes a text frame to the handler as if it was received.
+        This is also used for replaying recorded streams.
+        """
+        content = self._parser(frame)
 
-                    task = asyncio.create_task(self._handler(content))
-                    task.add_done_callback(done_callback)
-            logger.info(f"Websocket disconnected\n{self._url}")
+        def done_callback(task: asyncio.Task, content=content):
+            error = task.exception()
+            if error:
+                raise ApiStreamError(content) from error
+
+        task = asyncio.create_task(self._handler(content))
+        task.add_done_callback(done_callback)
 
     async def close(self):
         self._is_open = False
-        await self._session.close()
+        if self._websocket is not None:
+            await self._websocket.close()
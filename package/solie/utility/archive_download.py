@@ -0,0 +1,183 @@
+import asyncio
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+import aiofiles
+import aiofiles.os
+from aiohttp import ClientError, ClientTimeout
+
+from .http_session import get_http_session
+
+logger = logging.getLogger(__name__)
+
+
+class ArchiveChecksumError(Exception):
+    def __init__(self, url: str):
+        super().__init__(f"Downloaded archive doesn't match its checksum\n{url}")
+
+
+class ArchiveCache:
+    """
+    Keeps downloaded archives by the SHA-256 digest of their content.
+    An index maps archive URLs to digests,
+    so that the same archive is never downloaded twice.
+
+    - `{cache_path}/objects/{digest[:2]}/{digest}.zip`
+    - `{cache_path}/partial/{digest}.part`
+    - `{cache_path}/index.json`
+    """
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = cache_path
+        self._index: dict[str, str] | None = None
+        self._index_lock = asyncio.Lock()
+
+    def get_object_path(self, digest: str) -> Path:
+        return self.cache_path / "objects" / digest[:2] / f"{digest}.zip"
+
+    def get_partial_path(self, digest: str) -> Path:
+        return self.cache_path / "partial" / f"{digest}.part"
+
+    async def _load_index(self) -> dict[str, str]:
+        index = self._index
+        if index is None:
+            index = {}
+            filepath = self.cache_path / "index.json"
+            if await aiofiles.os.path.isfile(filepath):
+                async with aiofiles.open(filepath, "r", encoding="utf8") as file:
+                    index = json.loads(await file.read())
+            self._index = index
+        return index
+
+    async def find(self, url: str) -> Path | None:
+        index = await self._load_index()
+        digest = index.get(url)
+        if digest is None:
+            return None
+        return await self.find_digest(digest)
+
+    async def find_digest(self, digest: str) -> Path | None:
+        object_path = self.get_object_path(digest)
+        if await aiofiles.os.path.isfile(object_path):
+            return object_path
+        return None
+
+    async def add(self, url: str, digest: str, filepath: Path | None = None) -> Path:
+        """
+        Registers an archive under its URL.
+        When `filepath` is given, the file is moved into the cache.
+        """
+        object_path = self.get_object_path(digest)
+        if filepath is not None:
+            await aiofiles.os.makedirs(object_path.parent, exist_ok=True)
+            await aiofiles.os.replace(filepath, object_path)
+
+        async with self._index_lock:
+            index = await self._load_index()
+            index[url] = digest
+            filepath_index = self.cache_path / "index.json"
+            filepath_new = self.cache_path / "index.json.new"
+            await aiofiles.os.makedirs(self.cache_path, exist_ok=True)
+            async with aiofiles.open(filepath_new, "w", encoding="utf8") as file:
+                await file.write(json.dumps(index, indent=2))
+            await aiofiles.os.replace(filepath_new, filepath_index)
+
+        return object_path
+
+
+class ArchiveDownloader:
+    """
+    Downloads archives from `data.binance.vision` into an `ArchiveCache`
+    with a limited number of concurrent connections.
+    Interrupted downloads are resumed with range requests,
+    and every archive is verified against its `.CHECKSUM` file.
+    """
+
+    def __init__(self, cache_path: Path, concurrency: int = 4):
+        self.archive_cache = ArchiveCache(cache_path)
+        self.failed_urls: set[str] = set()
+        self._semaphore = asyncio.Semaphore(concurrency)
+        # Large archives take long, so only stalled reads time out
+        self._timeout = ClientTimeout(total=None, sock_read=60)
+
+    async def download(self, url: str) -> Path | None:
+        """
+        Returns the local path of the archive,
+        or `None` if it doesn't exist on the server or couldn't be downloaded.
+        URLs that couldn't be downloaded are kept in `failed_urls`.
+        Cached archives are returned without any network access.
+        """
+        cached = await self.archive_cache.find(url)
+        if cached is not None:
+            return cached
+
+        async with self._semaphore:
+            for attempt in range(5):
+                if attempt > 0:
+                    await asyncio.sleep(2**attempt)
+                try:
+                    return await self._download_once(url)
+                except (ClientError, asyncio.TimeoutError, ArchiveChecksumError):
+                    logger.debug(f"Failed to download an archive\n{url}")
+
+        logger.warning(f"Gave up downloading an archive\n{url}")
+        self.failed_urls.add(url)
+        return None
+
+    async def _download_once(self, url: str) -> Path | None:
+        archive_cache = self.archive_cache
+        session = get_http_session()
+
+        async with session.get(url + ".CHECKSUM") as response:
+            if response.status == 404:
+                return None
+            response.raise_for_status()
+            checksum_text = await response.text()
+        expected_digest = checksum_text.split()[0].lower()
+
+        # Another URL might have had the same content
+        found = await archive_cache.find_digest(expected_digest)
+        if found is not None:
+            await archive_cache.add(url, expected_digest)
+            return found
+
+        partial_path = archive_cache.get_partial_path(expected_digest)
+        await aiofiles.os.makedirs(partial_path.parent, exist_ok=True)
+
+        hasher = hashlib.sha256()
+        downloaded_size = 0
+        if await aiofiles.os.path.isfile(partial_path):
+            async with aiofiles.open(partial_path, "rb") as file:
+                while chunk := await file.read(2**20):
+                    hasher.update(chunk)
+                    downloaded_size += len(chunk)
+
+        headers = {}
+        if downloaded_size > 0:
+            headers["Range"] = f"bytes={downloaded_size}-"
+
+        async with session.get(url, headers=headers, timeout=self._timeout) as response:
+            if response.status == 404:
+                return None
+            if response.status == 416:
+                # The partial file is already complete
+                pass
+            else:
+                response.raise_for_status()
+                if response.status != 206:
+                    # The server sent the whole file
+                    hasher = hashlib.sha256()
+                    downloaded_size = 0
+                mode = "ab" if downloaded_size > 0 else "wb"
+                async with aiofiles.open(partial_path, mode) as file:
+                    async for chunk in response.content.iter_chunked(2**20):
+                        hasher.update(chunk)
+                        await file.write(chunk)
+
+        if hasher.hexdigest() != expected_digest:
+            await aiofiles.os.remove(partial_path)
+            raise ArchiveChecksumError(url)
+
+        return await archive_cache.add(url, expected_digest, partial_path)
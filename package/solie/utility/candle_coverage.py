@@ -0,0 +1,95 @@
+import calendar
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import aiofiles
+import aiofiles.os
+import pandas as pd
+
+from .download_from_binance import DownloadPreset
+
+CANDLES_PER_DAY = 24 * 60 * 6
+
+
+def count_daily_candles(candle_data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Returns how many candles each symbol has on each day.
+    Rows are UTC days and columns are symbols.
+    """
+    symbols = candle_data.columns.get_level_values(0).unique()
+    if len(candle_data) == 0:
+        return pd.DataFrame(
+            columns=symbols,
+            dtype=int,
+            index=pd.DatetimeIndex([], tz="UTC"),
+        )
+    close_df = candle_data.xs("Close", axis="columns", level=1)
+    assert isinstance(close_df, pd.DataFrame)  # nosec
+    days = close_df.index.floor("D")  # type:ignore
+    daily_counts = close_df.notna().groupby(days).sum()
+    assert isinstance(daily_counts, pd.DataFrame)  # nosec
+    return daily_counts.astype(int)
+
+
+def read_daily_candle_counts(filepath: Path) -> pd.DataFrame:
+    """
+    Counts candles of a stored year file inside a worker process,
+    so that the year data itself doesn't have to be sent back.
+    """
+    candle_data = pd.read_pickle(filepath)
+    assert isinstance(candle_data, pd.DataFrame)  # nosec
+    return count_daily_candles(candle_data)
+
+
+def is_period_covered(daily_counts: pd.DataFrame, preset: DownloadPreset) -> bool:
+    """
+    Tells whether every day in the period of the preset
+    already has all of its candles.
+    """
+    if preset.symbol not in daily_counts.columns:
+        return False
+
+    if preset.unit_size == "daily":
+        first_day = datetime(preset.year, preset.month, preset.day, tzinfo=timezone.utc)
+        day_count = 1
+    else:
+        first_day = datetime(preset.year, preset.month, 1, tzinfo=timezone.utc)
+        day_count = calendar.monthrange(preset.year, preset.month)[1]
+
+    days = pd.date_range(first_day, periods=day_count, freq="D")
+    counts = daily_counts[preset.symbol].reindex(days).fillna(0)
+    return bool((counts >= CANDLES_PER_DAY).all())
+
+
+class BackfillProgress:
+    """
+    Remembers which download presets were already filled and saved,
+    so that an interrupted backfill continues from where it stopped.
+    It's cleared when a backfill finishes,
+    so later runs only go by what is actually stored.
+    """
+
+    def __init__(self, filepath: Path):
+        self.filepath = filepath
+        self.done_presets: set[DownloadPreset] = set()
+
+    async def load(self):
+        if not await aiofiles.os.path.isfile(self.filepath):
+            return
+        async with aiofiles.open(self.filepath, "r", encoding="utf8") as file:
+            content = json.loads(await file.read())
+        self.done_presets = {DownloadPreset.from_dict(d) for d in content["done"]}
+
+    async def mark_done(self, download_presets: list[DownloadPreset]):
+        self.done_presets.update(download_presets)
+        content = {"done": [p.to_dict() for p in self.done_presets]}
+        filepath_new = self.filepath.with_suffix(".json.new")
+        async with aiofiles.open(filepath_new, "w", encoding="utf8") as file:
+            await file.write(json.dumps(content, indent=2))
+        await aiofiles.os.replace(filepath_new, self.filepath)
+
+    async def clear(self):
+        self.done_presets.clear()
+        if await aiofiles.os.path.isfile(self.filepath):
+            await aiofiles.os.remove(self.filepath)
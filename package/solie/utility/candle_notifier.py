@@ -0,0 +1,43 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class CandleClosed:
+    moment: datetime
+    row: pd.Series
+    version: int  # Version of the candle data snapshot
+
+
+class CandleNotifier:
+    """
+    Wakes up tasks waiting for a candle to be closed and written.
+    """
+
+    def __init__(self):
+        self._latest: CandleClosed | None = None
+        self._event = asyncio.Event()
+
+    @property
+    def latest(self) -> CandleClosed | None:
+        return self._latest
+
+    def publish(self, candle_closed: CandleClosed):
+        self._latest = candle_closed
+        # waiting tasks keep the old event, which is now set
+        self._event.set()
+        self._event = asyncio.Event()
+
+    async def wait_for(self, moment: datetime) -> CandleClosed:
+        """
+        Waits until the candle of the moment or a later one is closed.
+        Callers bound the wait with `asyncio.wait_for`.
+        """
+        while True:
+            latest = self._latest
+            if latest is not None and latest.moment >= moment:
+                return latest
+            await self._event.wait()
@@ -2,7 +2,7 @@ import asyncio
 import logging
 from typing import Callable, Coroutine
 
-from aiohttp import ClientSession
+from .http_session import get_http_session
 
 logger = logging.getLogger(__name__)
 
@@ -34,15 +34,15 @@ async def monitor_internet():
         # Try to connect to DNS servers and analyze internet connection
         was_connected = is_connected
         analyzed = False
-        async with ClientSession() as session:
-            for attempt_ip in ATTEMPT_IP:
-                try:
-                    async with session.get(f"http://{attempt_ip}") as response:
-                        if response.status == 200:
-                            analyzed = True
-                            break
-                except Exception:
-                    pass
+        session = get_http_session()
+        for attempt_ip in ATTEMPT_IP:
+            try:
+                async with session.get(f"http://{attempt_ip}") as response:
+                    if response.status == 200:
+                        analyzed = True
+                        break
+            except Exception:
+                pass
         is_connected = analyzed
         is_internet_checked.set()
 
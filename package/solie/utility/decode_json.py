@@ -0,0 +1,204 @@
+import json
+import re
+import time
+from typing import Any, Callable, Collection
+
+from .structs import AggregateTrade, BookTicker, MarkPrice
+
+try:
+    import orjson
+
+    JSON_LIBRARY = "orjson"
+    decode_json: Callable[[str | bytes], Any] = orjson.loads
+
+except ImportError:
+    JSON_LIBRARY = "json"
+    decode_json: Callable[[str | bytes], Any] = json.loads
+
+
+# Binance sends stream frames with a fixed key order,
+# so the needed fields can be picked out without building a dictionary.
+# This beats the standard library, but not `orjson` on small frames,
+# so patterns are only used for those when `orjson` is not installed.
+# When a frame doesn't match, the parsers fall back to full JSON decoding.
+AGGREGATE_TRADE_PATTERN = re.compile(
+    r'"s":"([^"]+)","a":\d+,"p":"([^"]+)","q":"([^"]+)",.*?"T":(\d+)'
+)
+BOOK_TICKER_PATTERN = re.compile(
+    r'"E":(\d+),.*?"s":"([^"]+)","b":"([^"]+)",.*?"a":"([^"]+)"'
+)
+MARK_PRICE_PATTERN = re.compile(r'"E":(\d+),"s":"([^"]+)","p":"([^"]+)"')
+
+
+def make_aggregate_trade(received: dict) -> AggregateTrade:
+    return AggregateTrade(
+        timestamp=int(received["T"]),
+        symbol=received["s"],
+        price=float(received["p"]),
+        volume=float(received["q"]),
+    )
+
+
+def make_book_ticker(received: dict) -> BookTicker:
+    return BookTicker(
+        timestamp=int(received["E"]),
+        symbol=received["s"],
+        best_bid_price=float(received["b"]),
+        best_ask_price=float(received["a"]),
+    )
+
+
+def make_mark_prices(
+    received: list[dict], target_symbols: Collection[str] | None = None
+) -> list[MarkPrice]:
+    return [
+        MarkPrice(
+            timestamp=int(about_mark_price["E"]),
+            symbol=about_mark_price["s"],
+            mark_price=float(about_mark_price["p"]),
+        )
+        for about_mark_price in received
+        if target_symbols is None or about_mark_price["s"] in target_symbols
+    ]
+
+
+def search_aggregate_trade(content: str) -> AggregateTrade | None:
+    matched = AGGREGATE_TRADE_PATTERN.search(content)
+    if not matched:
+        return None
+    symbol, price, volume, trade_time = matched.groups()
+    return AggregateTrade(
+        timestamp=int(trade_time),
+        symbol=symbol,
+        price=float(price),
+        volume=float(volume),
+    )
+
+
+def search_book_ticker(content: str) -> BookTicker | None:
+    matched = BOOK_TICKER_PATTERN.search(content)
+    if not matched:
+        return None
+    event_time, symbol, best_bid, best_ask = matched.groups()
+    return BookTicker(
+        timestamp=int(event_time),
+        symbol=symbol,
+        best_bid_price=float(best_bid),
+        best_ask_price=float(best_ask),
+    )
+
+
+def search_mark_prices(
+    content: str, target_symbols: Collection[str] | None = None
+) -> list[MarkPrice] | None:
+    found = MARK_PRICE_PATTERN.findall(content)
+    if not found:
+        return None
+    return [
+        MarkPrice(
+            timestamp=int(event_time),
+            symbol=symbol,
+            mark_price=float(mark_price),
+        )
+        for event_time, symbol, mark_price in found
+        if target_symbols is None or symbol in target_symbols
+    ]
+
+
+def parse_aggregate_trade(content: str) -> AggregateTrade:
+    if JSON_LIBRARY == "json":
+        found = search_aggregate_trade(content)
+        if found is not None:
+            return found
+    return make_aggregate_trade(decode_json(content))
+
+
+def parse_book_ticker(content: str) -> BookTicker:
+    if JSON_LIBRARY == "json":
+        found = search_book_ticker(content)
+        if found is not None:
+            return found
+    return make_book_ticker(decode_json(content))
+
+
+def parse_mark_prices(
+    content: str, target_symbols: Collection[str] | None = None
+) -> list[MarkPrice]:
+    """
+    Mark price frames include every symbol on the market.
+    Only the target symbols are turned into objects when they are given.
+    """
+    if JSON_LIBRARY == "json":
+        found = search_mark_prices(content, target_symbols)
+        if found is not None:
+            return found
+    return make_mark_prices(decode_json(content), target_symbols)
+
+
+SAMPLE_AGGREGATE_TRADE = (
+    '{"e":"aggTrade","E":1704067200123,"s":"BTCUSDT","a":2006217385,'
+    '"p":"42314.10","q":"0.015","f":4377186551,"l":4377186553,'
+    '"T":1704067200121,"m":false}'
+)
+SAMPLE_BOOK_TICKER = (
+    '{"e":"bookTicker","u":3779457624187,"E":1704067200123,"T":1704067200120,'
+    '"s":"BTCUSDT","b":"42314.10","B":"5.418","a":"42314.20","A":"2.102"}'
+)
+SAMPLE_MARK_PRICES = (
+    "["
+    + ",".join(
+        '{"e":"markPriceUpdate","E":1704067200000,"s":"'
+        + f"SYMBOL{turn}USDT"
+        + '","p":"42310.96000000","P":"42295.58734108",'
+        + '"i":"42327.24652174","r":"0.00010000","T":1704096000000}'
+        for turn in range(256)
+    )
+    + "]"
+)
+
+
+def measure_decoding_speed(repeat: int = 10000) -> dict[str, dict[str, float]]:
+    """
+    Measures how many stream frames can be turned into objects per second
+    with each available decoding method.
+    Mark price frames hold hundreds of symbols, so they are repeated less.
+    """
+    samples = {
+        "aggTrade": (
+            SAMPLE_AGGREGATE_TRADE,
+            repeat,
+            make_aggregate_trade,
+            search_aggregate_trade,
+        ),
+        "bookTicker": (
+            SAMPLE_BOOK_TICKER,
+            repeat,
+            make_book_ticker,
+            search_book_ticker,
+        ),
+        "markPrice": (
+            SAMPLE_MARK_PRICES,
+            max(repeat // 100, 1),
+            make_mark_prices,
+            search_mark_prices,
+        ),
+    }
+
+    measured: dict[str, dict[str, float]] = {}
+    for message_type, (sample, count, maker, searcher) in samples.items():
+        methods: dict[str, Callable[[str], Any]] = {
+            "json": lambda c, maker=maker: maker(json.loads(c)),
+            "pattern": searcher,
+        }
+        if JSON_LIBRARY != "json":
+            methods[JSON_LIBRARY] = lambda c, maker=maker: maker(decode_json(c))
+
+        measured[message_type] = {}
+        for method_name, method in methods.items():
+            start_time = time.perf_counter()
+            for _ in range(count):
+                method(sample)
+            duration = time.perf_counter() - start_time
+            measured[message_type][method_name] = count / duration
+
+    return measured
@@ -1,16 +1,15 @@
-import io
+import zipfile
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
-from urllib.request import urlopen
+from datetime import datetime, timedelta
+from pathlib import Path
 
 import numpy as np
 import pandas as pd
+from dataclasses_json import DataClassJsonMixin
 
-from .timing import to_moment
 
-
-@dataclass
-class DownloadPreset:
+@dataclass(frozen=True)
+class DownloadPreset(DataClassJsonMixin):
     symbol: str
     unit_size: str  # "daily" or "monthly"
     year: int
@@ -18,7 +17,7 @@ class DownloadPreset:
     day: int = 0  # Valid only when `unit_size` is "daily"
 
 
-def download_aggtrade_data(download_target: DownloadPreset) -> pd.DataFrame | None:
+def get_aggtrade_archive_url(download_target: DownloadPreset) -> str:
     symbol = download_target.symbol
     unit_size = download_target.unit_size
 
@@ -42,167 +41,266 @@ def download_aggtrade_data(download_target: DownloadPreset) -> pd.DataFrame | No
     else:
         raise ValueError("This download type is not supported")
 
-    zipped_csv_data = None
-    for _ in range(5):
-        try:
-            zipped_csv_data = io.BytesIO(urlopen(url).read())
-            break
-        except Exception:
-            pass
-
-    if zipped_csv_data is None:
-        return
-
-    try:
-        df: pd.DataFrame = pd.concat(
-            pd.read_csv(
-                zipped_csv_data,
-                compression="zip",
-                header=None,
-                usecols=[1, 2, 5],
-                dtype={1: np.float32, 2: np.float32, 5: np.int64},
-                chunksize=10**6,
-            )
+    return url
+
+
+class CandleAggregator:
+    """
+    Folds chunks of time-ordered trades into 10-second candles.
+    Only finished candles are kept as arrays,
+    and the last candle of a chunk stays open
+    in case the next chunk continues it.
+    Memory usage grows with the number of candles, not trades.
+    """
+
+    def __init__(self):
+        self._blocks: list[np.ndarray] = []
+        self._values: list[np.ndarray] = []  # Open, High, Low, Close, Volume
+        self._open_block: int | None = None
+        self._open_values = np.zeros(5, dtype=np.float64)
+
+    def add(self, timestamps: np.ndarray, prices: np.ndarray, volumes: np.ndarray):
+        """
+        Timestamps are in milliseconds.
+        """
+        if len(timestamps) == 0:
+            return
+        if np.any(timestamps[1:] < timestamps[:-1]):
+            order = np.argsort(timestamps, kind="stable")
+            timestamps = timestamps[order]
+            prices = prices[order]
+            volumes = volumes[order]
+
+        blocks = timestamps // 10000
+        block_starts = np.flatnonzero(np.diff(blocks, prepend=blocks[0] - 1))
+        block_ends = np.append(block_starts[1:], len(blocks)) - 1
+        values = np.column_stack(
+            [
+                prices[block_starts],
+                np.maximum.reduceat(prices, block_starts),
+                np.minimum.reduceat(prices, block_starts),
+                prices[block_ends],
+                np.add.reduceat(volumes, block_starts, dtype=np.float64),
+            ]
+        ).astype(np.float64)
+        blocks = blocks[block_starts]
+
+        if self._open_block is not None:
+            if blocks[0] == self._open_block:
+                # The open candle continues in this chunk
+                carried = self._open_values
+                values[0, 0] = carried[0]
+                values[0, 1] = max(values[0, 1], carried[1])
+                values[0, 2] = min(values[0, 2], carried[2])
+                values[0, 4] += carried[4]
+            else:
+                self._blocks.append(np.array([self._open_block]))
+                self._values.append(self._open_values[np.newaxis])
+
+        self._blocks.append(blocks[:-1])
+        self._values.append(values[:-1])
+        self._open_block = int(blocks[-1])
+        self._open_values = values[-1]
+
+    def get_candles(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns block numbers of 10-second units since the epoch
+        and an array of OHLCV rows, only for blocks with trades.
+        """
+        blocks = list(self._blocks)
+        values = list(self._values)
+        if self._open_block is not None:
+            blocks.append(np.array([self._open_block]))
+            values.append(self._open_values[np.newaxis])
+        if len(blocks) == 0:
+            return np.empty(0, dtype=np.int64), np.empty((0, 5), dtype=np.float64)
+        return (
+            np.concatenate(blocks).astype(np.int64),
+            np.concatenate(values),
         )
-    except ValueError:
-        # when there is a header line in start of the file
-        # from august 2022, header is included from binance
-        df: pd.DataFrame = pd.concat(
-            pd.read_csv(
-                zipped_csv_data,
-                compression="zip",
-                header=0,
-                usecols=[1, 2, 5],
-                dtype={1: np.float32, 2: np.float32, 5: np.int64},
-                chunksize=10**6,
+
+    def make_candle_data(self, symbol: str, gap_limit: int = 60) -> pd.DataFrame:
+        """
+        Blocks without trades are filled with the last price
+        only when the gap is not longer than `gap_limit` blocks.
+        Longer gaps are left out of the index.
+        """
+        column_names = ("Open", "High", "Low", "Close", "Volume")
+        blocks, values = self.get_candles()
+        if len(blocks) == 0:
+            return pd.DataFrame(
+                columns=pd.MultiIndex.from_product([[symbol], column_names]),
+                index=pd.DatetimeIndex([], tz="UTC"),
+                dtype=np.float32,
             )
+
+        # Mark blocks with trades and short gaps between them
+        positions = blocks - blocks[0]
+        gap_sizes = np.diff(positions) - 1
+        is_short_gap = (gap_sizes > 0) & (gap_sizes <= gap_limit)
+        marks = np.zeros(positions[-1] + 2, dtype=np.int64)
+        marks[positions[:-1][is_short_gap] + 1] += 1
+        marks[positions[1:][is_short_gap]] -= 1
+        is_valid = np.cumsum(marks)[:-1] > 0
+        is_valid[positions] = True
+        valid_positions = np.flatnonzero(is_valid)
+
+        # Carry the last trade over blocks without trades
+        source_rows = np.searchsorted(positions, valid_positions, side="right") - 1
+        has_trades = positions[source_rows] == valid_positions
+        filled = values[source_rows]
+        close_prices = filled[:, 3]
+        for column_index in range(3):
+            filled[~has_trades, column_index] = close_prices[~has_trades]
+        filled[~has_trades, 4] = 0.0
+
+        index = pd.to_datetime(
+            (valid_positions + blocks[0]) * 10000, unit="ms", utc=True
         )
-        df = df.rename(columns={"price": 1, "quantity": 2, "transact_time": 5})
-
-    df = df.set_index(5)
-    df.index.name = None
-    df.index = pd.to_datetime(df.index, unit="ms", utc=True)
-
-    # fill index holes that's smaller than 10 minutes
-    temp_sr = pd.Series(0, index=df.index, dtype=np.float32)
-    temp_sr = temp_sr.groupby(temp_sr.index).first()
-    temp_sr = temp_sr.resample("10s").agg("mean")
-    temp_sr = temp_sr.interpolate(limit=60, limit_direction="forward")
-    temp_sr = temp_sr.replace(np.nan, 1)
-    temp_sr = temp_sr.replace(0, np.nan)
-    temp_sr = temp_sr.interpolate(limit=60, limit_direction="backward")
-    temp_sr = temp_sr.replace(np.nan, 0)
-    temp_sr = temp_sr.replace(1, np.nan)
-    temp_sr = temp_sr.dropna()
-    valid_index = temp_sr.index
-
-    del temp_sr
-
-    # process data
-
-    close_sr: pd.Series = df[1].resample("10s").agg("last")  # type:ignore
-    close_sr = close_sr.reindex(valid_index)
-    close_sr = close_sr.ffill()
-    close_sr = close_sr.astype(np.float32)
-    close_sr.name = (symbol, "Close")
-
-    open_sr: pd.Series = df[1].resample("10s").agg("first")  # type:ignore
-    open_sr = open_sr.reindex(valid_index)
-    open_sr = open_sr.fillna(value=close_sr)
-    open_sr = open_sr.astype(np.float32)
-    open_sr.name = (symbol, "Open")
-
-    high_sr: pd.Series = df[1].resample("10s").agg("max")  # type:ignore
-    high_sr = high_sr.reindex(valid_index)
-    high_sr = high_sr.fillna(value=close_sr)
-    high_sr = high_sr.astype(np.float32)
-    high_sr.name = (symbol, "High")
-
-    low_sr: pd.Series = df[1].resample("10s").agg("min")  # type:ignore
-    low_sr = low_sr.reindex(valid_index)
-    low_sr = low_sr.fillna(value=close_sr)
-    low_sr = low_sr.astype(np.float32)
-    low_sr.name = (symbol, "Low")
-
-    volume_sr: pd.Series = df[2].resample("10s").agg("sum")  # type:ignore
-    volume_sr = volume_sr.reindex(valid_index)
-    volume_sr = volume_sr.fillna(value=0)
-    volume_sr = volume_sr.astype(np.float32)
-    volume_sr.name = (symbol, "Volume")
-
-    del df
-
-    series_list = [open_sr, high_sr, low_sr, close_sr, volume_sr]
-    new_df = pd.concat(series_list, axis="columns")
-
-    return new_df
+        return pd.DataFrame(
+            filled.astype(np.float32),
+            index=index,
+            columns=pd.MultiIndex.from_product([[symbol], column_names]),
+        )
+
+
+def read_aggtrade_archive(symbol: str, archive_path: Path) -> pd.DataFrame:
+    """
+    Makes candle data from a zipped CSV file of aggregate trades.
+    Archives are read from the disk in chunks
+    so that memory usage doesn't depend on the archive size.
+    """
+    # from august 2022, header is included from binance
+    with zipfile.ZipFile(archive_path) as archive:
+        with archive.open(archive.namelist()[0]) as csv_file:
+            first_line = csv_file.readline()
+    has_header = not first_line[:1].isdigit()
+
+    aggregator = CandleAggregator()
+    chunks = pd.read_csv(
+        archive_path,
+        compression="zip",
+        header=None,
+        skiprows=1 if has_header else 0,
+        usecols=[1, 2, 5],
+        dtype={1: np.float32, 2: np.float32, 5: np.int64},
+        chunksize=10**6,
+    )
+    for chunk in chunks:
+        aggregator.add(
+            chunk[5].to_numpy(),
+            chunk[1].to_numpy(),
+            chunk[2].to_numpy(),
+        )
+
+    return aggregator.make_candle_data(symbol)
+
+
+def find_candle_holes(
+    written_moments: pd.DatetimeIndex,
+    from_moment: datetime,
+    until_moment: datetime,
+) -> list[tuple[datetime, datetime]]:
+    """
+    Returns ranges of moments without candles
+    between `from_moment` and `until_moment`, both inclusive.
+    Each range is a pair of its first moment and the moment after its last one.
+    """
+    step = 10 * 10**9  # In nanoseconds
+    start = pd.Timestamp(from_moment).value
+    end = pd.Timestamp(until_moment).value
+    slot_count = (end - start) // step + 1
+
+    slots = (written_moments.asi8 - start) // step
+    slots = slots[(slots >= 0) & (slots < slot_count)]
+    is_written = np.zeros(slot_count + 2, dtype=np.int8)
+    is_written[[0, -1]] = 1
+    is_written[slots + 1] = 1
+
+    edges = np.diff(is_written)
+    hole_starts = np.flatnonzero(edges == -1)
+    hole_ends = np.flatnonzero(edges == 1)
+
+    return [
+        (
+            from_moment + timedelta(seconds=10 * int(hole_start)),
+            from_moment + timedelta(seconds=10 * int(hole_end)),
+        )
+        for hole_start, hole_end in zip(hole_starts, hole_ends)
+    ]
 
 
 def fill_holes_with_aggtrades(
-    symbol: str,
     recent_candle_data: pd.DataFrame,
-    aggtrades: dict,
-    moment_to_fill_from: datetime,
-    last_fetched_time: datetime,
+    aggtrades: dict[str, np.ndarray],
+    fill_ranges: dict[str, list[tuple[datetime, datetime]]],
 ) -> pd.DataFrame:
-    fill_moment = moment_to_fill_from
-
-    last_fetched_moment = to_moment(last_fetched_time)
-    while fill_moment < last_fetched_moment:
-        block_start = fill_moment
-        block_end = fill_moment + timedelta(seconds=10)
-
-        aggtrade_prices: list[float] = []
-        aggtrade_volumes: list[float] = []
-        for _, aggtrade in sorted(aggtrades.items()):
-            # sorted by time
-            aggtrade_time = datetime.fromtimestamp(
-                int(aggtrade["T"]) / 1000, tz=timezone.utc
-            )
-            if block_start <= aggtrade_time < block_end:
-                aggtrade_prices.append(float(aggtrade["p"]))
-                aggtrade_volumes.append(float(aggtrade["q"]))
-
-        can_write = True
-
-        if len(aggtrade_prices) == 0:
-            # when there are no trades
-            inspect_sr = recent_candle_data[(symbol, "Close")]
-            inspect_sr = inspect_sr.sort_index()
-            last_prices = inspect_sr[:fill_moment].dropna()
-            if len(last_prices) == 0:
-                # when there are no previous data
-                # because new data folder was created
-                can_write = False
-                last_price = 0
-            else:
-                last_price = last_prices.iloc[-1]
-            open_price = last_price
-            high_price = last_price
-            low_price = last_price
-            close_price = last_price
-            sum_volume = 0
-        else:
-            open_price = aggtrade_prices[0]
-            high_price = max(aggtrade_prices)
-            low_price = min(aggtrade_prices)
-            close_price = aggtrade_prices[-1]
-            sum_volume = sum(aggtrade_volumes)
-
-        if can_write:
-            column = (symbol, "Open")
-            recent_candle_data.loc[fill_moment, column] = open_price
-            column = (symbol, "High")
-            recent_candle_data.loc[fill_moment, column] = high_price
-            column = (symbol, "Low")
-            recent_candle_data.loc[fill_moment, column] = low_price
-            column = (symbol, "Close")
-            recent_candle_data.loc[fill_moment, column] = close_price
-            column = (symbol, "Volume")
-            recent_candle_data.loc[fill_moment, column] = sum_volume
-
-        fill_moment += timedelta(seconds=10)
+    """
+    Makes candles from aggregate trades in one pass per symbol
+    and writes them over the given ranges.
+    `aggtrades` holds arrays of `[timestamp, price, volume]` rows.
+    Moments without trades get the last known price and zero volume.
+    """
+    new_columns: dict[tuple[str, str], pd.Series] = {}
+
+    for symbol, symbol_ranges in fill_ranges.items():
+        if len(symbol_ranges) == 0:
+            continue
+
+        range_indexes = [
+            pd.date_range(start, end, freq="10s", inclusive="left")
+            for start, end in symbol_ranges
+        ]
+        fill_index = range_indexes[0].append(range_indexes[1:])
+        if len(fill_index) == 0:
+            continue
+
+        # Bin trades into 10-second blocks
+        symbol_aggtrades = aggtrades.get(symbol, np.empty((0, 3)))
+        aggregator = CandleAggregator()
+        aggregator.add(
+            symbol_aggtrades[:, 0].astype(np.int64),
+            symbol_aggtrades[:, 1],
+            symbol_aggtrades[:, 2],
+        )
+        blocks, values = aggregator.get_candles()
+        block_index = pd.to_datetime(blocks * 10000, unit="ms", utc=True)
+        binned = pd.DataFrame(
+            values,
+            index=block_index,
+            columns=["Open", "High", "Low", "Close", "Volume"],
+        )
+        binned = binned[binned.index.isin(fill_index)]
 
+        # Carry the last price over moments without trades
+        if (symbol, "Close") in recent_candle_data.columns:
+            previous_close_sr = recent_candle_data[(symbol, "Close")].dropna()
+        else:
+            empty_index = pd.DatetimeIndex([], tz="UTC")
+            previous_close_sr = pd.Series(dtype=np.float64, index=empty_index)
+        previous_close_sr = previous_close_sr[~previous_close_sr.index.isin(fill_index)]
+        close_sr = pd.concat([previous_close_sr, binned["Close"]]).sort_index()
+        close_sr = close_sr.reindex(close_sr.index.union(fill_index)).ffill()
+        close_sr = close_sr.reindex(fill_index)
+
+        filled = binned.reindex(fill_index)
+        filled["Close"] = close_sr
+        for column_name in ("Open", "High", "Low"):
+            filled[column_name] = filled[column_name].fillna(close_sr)
+        filled["Volume"] = filled["Volume"].fillna(0.0)
+
+        # Moments before any known price are left empty
+        filled = filled[close_sr.notna()]
+
+        for column_name, column_sr in filled.items():
+            new_columns[(symbol, str(column_name))] = column_sr
+
+    if len(new_columns) == 0:
+        return recent_candle_data
+
+    new_candle_data = pd.DataFrame(new_columns)
+    recent_candle_data = new_candle_data.combine_first(recent_candle_data)
+    recent_candle_data = recent_candle_data.astype(np.float32)
     recent_candle_data = recent_candle_data.sort_index(axis="index")
     recent_candle_data = recent_candle_data.sort_index(axis="columns")
 
@@ -0,0 +1,132 @@
+import asyncio
+import math
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from .api_requester import ApiRequester
+from .convert import list_to_dict
+
+
+@dataclass
+class ExchangeInformation:
+    price_precisions: dict[str, int] = field(default_factory=dict)
+    quantity_precisions: dict[str, int] = field(default_factory=dict)
+    minimum_notionals: dict[str, float] = field(default_factory=dict)
+    maximum_quantities: dict[str, float] = field(default_factory=dict)
+    rate_limits: dict[str, int] = field(default_factory=dict)  # Name and value
+    request_weight_limit: int = 2400  # Per minute
+
+
+def parse_exchange_information(about_exchange: dict) -> ExchangeInformation:
+    exchange_information = ExchangeInformation()
+
+    for about_symbol in about_exchange["symbols"]:
+        symbol = about_symbol["symbol"]
+
+        about_filters = about_symbol["filters"]
+        about_filters_keyed = list_to_dict(about_filters, "filterType")
+
+        minimum_notional = float(about_filters_keyed["MIN_NOTIONAL"]["notional"])
+        exchange_information.minimum_notionals[symbol] = minimum_notional
+
+        maximum_quantity = min(
+            float(about_filters_keyed["LOT_SIZE"]["maxQty"]),
+            float(about_filters_keyed["MARKET_LOT_SIZE"]["maxQty"]),
+        )
+        exchange_information.maximum_quantities[symbol] = maximum_quantity
+
+        ticksize = float(about_filters_keyed["PRICE_FILTER"]["tickSize"])
+        price_precision = int(math.log10(1 / ticksize))
+        exchange_information.price_precisions[symbol] = price_precision
+
+        stepsize = float(about_filters_keyed["LOT_SIZE"]["stepSize"])
+        quantity_precision = int(math.log10(1 / stepsize))
+        exchange_information.quantity_precisions[symbol] = quantity_precision
+
+    for about_rate_limit in about_exchange["rateLimits"]:
+        limit_type = about_rate_limit["rateLimitType"]
+        limit_value = about_rate_limit["limit"]
+        interval_unit = about_rate_limit["interval"]
+        interval_value = about_rate_limit["intervalNum"]
+        limit_name = f"{limit_type}({interval_value}{interval_unit})"
+        exchange_information.rate_limits[limit_name] = limit_value
+        if limit_type == "REQUEST_WEIGHT" and interval_unit == "MINUTE":
+            weight_limit = int(limit_value / interval_value)
+            exchange_information.request_weight_limit = weight_limit
+
+    return exchange_information
+
+
+class ExchangeInfoCache:
+    """
+    Keeps exchange information and leverage brackets for a while,
+    so that workers don't download and parse them on every cycle.
+    Callers that ask at the same time share a single request.
+    """
+
+    def __init__(self, time_to_live: float = 300.0):
+        self.time_to_live = time_to_live
+        self._exchange_information: ExchangeInformation | None = None
+        self._exchange_fetched_time = 0.0
+        self._exchange_lock = asyncio.Lock()
+        self._maximum_leverages: dict[str, int] | None = None
+        self._leverages_fetched_time = 0.0
+        self._leverages_lock = asyncio.Lock()
+
+    def invalidate(self):
+        self._exchange_information = None
+        self._maximum_leverages = None
+
+    def _is_fresh(self, fetched_time: float) -> bool:
+        return time.monotonic() - fetched_time < self.time_to_live
+
+    async def get_exchange_information(
+        self, api_requester: ApiRequester
+    ) -> ExchangeInformation:
+        async with self._exchange_lock:
+            cached = self._exchange_information
+            if cached is not None and self._is_fresh(self._exchange_fetched_time):
+                return cached
+            response = await api_requester.binance(
+                http_method="GET",
+                path="/fapi/v1/exchangeInfo",
+                payload={},
+            )
+            self._exchange_information = parse_exchange_information(response)
+            self._exchange_fetched_time = time.monotonic()
+            return self._exchange_information
+
+    async def get_maximum_leverages(
+        self, api_requester: ApiRequester
+    ) -> dict[str, int]:
+        """
+        Needs API keys, so `ApiRequestError` is raised when they are not ready.
+        """
+        async with self._leverages_lock:
+            cached = self._maximum_leverages
+            if cached is not None and self._is_fresh(self._leverages_fetched_time):
+                return cached
+            payload = {
+                "timestamp": int(datetime.now(timezone.utc).timestamp() * 1000),
+            }
+            response = await api_requester.binance(
+                http_method="GET",
+                path="/fapi/v1/leverageBracket",
+                payload=payload,
+            )
+            maximum_leverages = {}
+            for about_bracket in response:
+                symbol = about_bracket["symbol"]
+                max_leverage = about_bracket["brackets"][0]["initialLeverage"]
+                maximum_leverages[symbol] = max_leverage
+            self._maximum_leverages = maximum_leverages
+            self._leverages_fetched_time = time.monotonic()
+            return maximum_leverages
+
+
+exchange_info_cache = ExchangeInfoCache()
+
+
+def get_exchange_info_cache() -> ExchangeInfoCache:
+    return exchange_info_cache
@@ -0,0 +1,54 @@
+from dataclasses import dataclass
+
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+
+
+@dataclass
+class HttpSessionSettings:
+    # Websockets hold their connections too
+    connection_limit: int = 128
+    connection_limit_per_host: int = 32
+    keepalive_timeout: float = 60.0  # In seconds
+    dns_cache_seconds: int = 300
+    request_timeout: float = 60.0  # In seconds
+
+
+session_settings = HttpSessionSettings()
+session: ClientSession | None = None
+
+
+def configure_http_session(new_settings: HttpSessionSettings):
+    """
+    Settings are applied when the shared session is created,
+    so this should be called before any request is made.
+    """
+    global session_settings
+    session_settings = new_settings
+
+
+def get_http_session() -> ClientSession:
+    """
+    Returns the process-wide session.
+    Its connections are kept alive and shared by every requester and streamer,
+    so that requests don't wait for a new TLS handshake.
+    """
+    global session
+    if session is None or session.closed:
+        connector = TCPConnector(
+            limit=session_settings.connection_limit,
+            limit_per_host=session_settings.connection_limit_per_host,
+            keepalive_timeout=session_settings.keepalive_timeout,
+            ttl_dns_cache=session_settings.dns_cache_seconds,
+        )
+        session = ClientSession(
+            connector=connector,
+            timeout=ClientTimeout(total=session_settings.request_timeout),
+        )
+    return session
+
+
+async def close_http_session():
+    global session
+    if session is not None:
+        await session.close()
+        session = None
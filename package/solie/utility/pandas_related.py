@@ -1,6 +1,12 @@
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Sequence
+
 import numpy as np
 import pandas as pd
 
+from .structs import AggregateTrade
+
 
 def combine_candle_data(
     prior_df: pd.DataFrame, secondary_df: pd.DataFrame
@@ -10,3 +16,235 @@ def combine_candle_data(
     df = df.asfreq("10S")
     df = df.astype(np.float32)
     return df
+
+
+def make_candle_values(
+    aggregate_trades: Sequence[AggregateTrade],
+    target_symbols: list[str],
+    candle_data: pd.DataFrame,
+    before_moment: datetime,
+) -> tuple[dict[tuple[str, str], float], dict[str, int]] | None:
+    """
+    Folds the trades of the 10 seconds from `before_moment` into candle values,
+    along with the number of trades of each symbol.
+    Trades should be ordered by receive time.
+    Symbols without trades repeat their last close price.
+    Returns `None` if the trades don't cover the whole candle
+    or a symbol has no price to repeat.
+    """
+    collect_from = int(before_moment.timestamp()) * 1000
+    collect_to = int((before_moment + timedelta(seconds=10)).timestamp()) * 1000
+
+    # Ensure that the data have been watched for long enough.
+    if len(aggregate_trades) == 0 or collect_from <= aggregate_trades[0].timestamp:
+        return None
+
+    # Collect trades that should be included in the candle.
+    collected_aggregate_trades: list[AggregateTrade] = []
+    for aggregate_trade in reversed(aggregate_trades):
+        if aggregate_trade.timestamp < collect_from - 1000:
+            # Go additional 1000 millliseconds backward.
+            break
+        collected_aggregate_trades.append(aggregate_trade)
+    if len(collected_aggregate_trades) == 0:
+        return None
+    collected_aggregate_trades.reverse()  # Sort by time
+    collected_aggregate_trades = [
+        t for t in collected_aggregate_trades if collect_from < t.timestamp < collect_to
+    ]
+
+    new_values: dict[tuple[str, str], float] = {}
+    candle_sizes: dict[str, int] = {}
+    for symbol in target_symbols:
+        symbol_aggregate_trades = [
+            t for t in collected_aggregate_trades if t.symbol == symbol
+        ]
+        candle_sizes[symbol] = len(symbol_aggregate_trades)
+
+        if len(symbol_aggregate_trades) > 0:
+            open_price = symbol_aggregate_trades[0].price
+            high_price = max([t.price for t in symbol_aggregate_trades])
+            low_price = min([t.price for t in symbol_aggregate_trades])
+            close_price = symbol_aggregate_trades[-1].price
+            sum_volume = sum([t.volume for t in symbol_aggregate_trades])
+        else:
+            inspect_sr = candle_data.iloc[-60:][(symbol, "Close")].copy()
+            inspect_sr = inspect_sr.dropna()
+            if len(inspect_sr) == 0:
+                return None
+            last_price = inspect_sr.tolist()[-1]
+            open_price = last_price
+            high_price = last_price
+            low_price = last_price
+            close_price = last_price
+            sum_volume = 0.0
+
+        new_values[(symbol, "Open")] = open_price
+        new_values[(symbol, "High")] = high_price
+        new_values[(symbol, "Low")] = low_price
+        new_values[(symbol, "Close")] = close_price
+        new_values[(symbol, "Volume")] = sum_volume
+
+    return new_values, candle_sizes
+
+
+def add_candle_row(
+    candle_data: pd.DataFrame,
+    moment: datetime,
+    values: dict[tuple[str, str], float],
+) -> pd.DataFrame:
+    """
+    Returns new candle data with the values written at the moment.
+    The given candle data is left untouched.
+    """
+    if moment in candle_data.index:
+        candle_data = candle_data.copy()
+        for column_name, value in values.items():
+            candle_data.loc[moment, column_name] = value
+        return candle_data
+    row = pd.DataFrame(
+        [list(values.values())],
+        index=pd.DatetimeIndex([moment]),
+        columns=pd.MultiIndex.from_tuples(list(values.keys())),
+        dtype=np.float32,
+    )
+    return pd.concat([candle_data, row])
+
+
+def assemble_candle_data(
+    candle_blocks: list[pd.DataFrame], columns: pd.Index
+) -> pd.DataFrame:
+    """
+    Places blocks of candle data into one preallocated 10-second grid.
+    Each block is copied only once, so the cost grows linearly
+    with the total number of rows.
+    Later blocks overwrite earlier ones where they overlap.
+    """
+    all_columns = columns
+    for candle_block in candle_blocks:
+        all_columns = all_columns.union(candle_block.columns)
+    all_columns = all_columns.sort_values()
+
+    candle_blocks = [b for b in candle_blocks if len(b) > 0]
+    if len(candle_blocks) == 0:
+        return pd.DataFrame(
+            columns=all_columns,
+            dtype=np.float32,
+            index=pd.DatetimeIndex([], tz="UTC"),
+        )
+
+    step = 10 * 10**9  # In nanoseconds
+    start = min(b.index[0].value for b in candle_blocks)
+    end = max(b.index[-1].value for b in candle_blocks)
+    row_count = (end - start) // step + 1
+
+    grid = np.full((row_count, len(all_columns)), np.nan, dtype=np.float32)
+    for candle_block in candle_blocks:
+        rows = (candle_block.index.asi8 - start) // step
+        cols = all_columns.get_indexer(candle_block.columns)
+        grid[rows[:, np.newaxis], cols] = candle_block.to_numpy(dtype=np.float32)
+
+    index = pd.date_range(
+        pd.Timestamp(start, tz="UTC"),
+        periods=row_count,
+        freq="10s",
+    )
+    return pd.DataFrame(grid, index=index, columns=all_columns)
+
+
+class CandleGrid:
+    """
+    Appends candle rows by writing them into spare rows
+    of a preallocated 10-second grid,
+    so that the cost doesn't grow with the length of the candle data.
+    Returned candle data is a view of the filled rows,
+    and rows are only written past such views, so they never change.
+    Candle data that wasn't returned from here is copied into a new grid first.
+    """
+
+    def __init__(self):
+        self._values = np.empty((0, 0), dtype=np.float32)
+        self._index = pd.DatetimeIndex([], tz="UTC")
+        self._columns = pd.Index([])
+        self._start = 0  # In nanoseconds
+        self._length = 0
+        self._made: pd.DataFrame | None = None
+
+    def add_row(
+        self,
+        candle_data: pd.DataFrame,
+        moment: datetime,
+        values: dict[tuple[str, str], float],
+    ) -> pd.DataFrame:
+        """
+        Returns new candle data with the values written at the moment.
+        The given candle data is left untouched.
+        """
+        adopted = candle_data is self._made or self._adopt(candle_data, moment)
+
+        step = 10 * 10**9  # In nanoseconds
+        position, remainder = divmod(pd.Timestamp(moment).value - self._start, step)
+        cols = self._columns.get_indexer(list(values.keys()))
+        if not adopted or remainder != 0 or position < self._length or (cols < 0).any():
+            # rows that readers might see are never written
+            self._made = None
+            return add_candle_row(candle_data, moment, values)
+
+        if position >= len(self._values):
+            self._allocate(position + 1)
+        self._values[position, cols] = list(values.values())
+        self._length = position + 1
+
+        self._made = pd.DataFrame(
+            self._values[: self._length],
+            index=self._index[: self._length],
+            columns=self._columns,
+            copy=False,
+        )
+        return self._made
+
+    def _adopt(self, candle_data: pd.DataFrame, moment: datetime) -> bool:
+        step = 10 * 10**9  # In nanoseconds
+        moments = candle_data.index.asi8
+        if len(moments) > 0:
+            start = int(moments.min())
+            row_count = (int(moments.max()) - start) // step + 1
+        else:
+            start = pd.Timestamp(moment).value
+            row_count = 0
+        rows, remainders = np.divmod(moments - start, step)
+        if (remainders != 0).any():
+            return False
+
+        self._start = start
+        self._columns = candle_data.columns
+        self._values = np.empty((0, len(self._columns)), dtype=np.float32)
+        self._length = 0
+        self._allocate(row_count + 1)
+        # later rows overwrite earlier ones with the same moment
+        self._values[rows] = candle_data.to_numpy(dtype=np.float32)
+        self._length = row_count
+        return True
+
+    def _allocate(self, row_count: int):
+        # grow by an eighth so that copies stay rare
+        capacity = row_count + max(row_count // 8, 6 * 60 * 24)
+        values = np.full((capacity, len(self._columns)), np.nan, dtype=np.float32)
+        values[: self._length] = self._values[: self._length]
+        self._values = values
+        self._index = pd.date_range(
+            pd.Timestamp(self._start, tz="UTC"),
+            periods=capacity,
+            freq="10s",
+        )
+
+
+def merge_candle_data_file(candle_data: pd.DataFrame, filepath: Path):
+    """
+    Writes candle data into a stored file,
+    keeping the stored candles that are not in the new data.
+    """
+    if filepath.is_file():
+        stored_df: pd.DataFrame = pd.read_pickle(filepath)
+        candle_data = combine_candle_data(candle_data, stored_df)
+    candle_data.to_pickle(filepath)
@@ -0,0 +1,162 @@
+import asyncio
+import heapq
+import itertools
+import time
+from typing import Mapping
+
+# Lower numbers are served first
+PRIORITY_ORDER = 0
+PRIORITY_ACCOUNT = 1
+PRIORITY_BACKFILL = 2
+
+# Weights and priorities of Binance futures endpoints.
+# Endpoints that are not listed have a weight of 1
+# and are treated as account requests.
+ENDPOINT_RULES: dict[str, tuple[int, int]] = {
+    "/fapi/v1/order": (1, PRIORITY_ORDER),
+    "/fapi/v1/batchOrders": (5, PRIORITY_ORDER),
+    "/fapi/v1/allOpenOrders": (1, PRIORITY_ORDER),
+    "/fapi/v1/openOrders": (1, PRIORITY_ACCOUNT),
+    "/fapi/v2/account": (5, PRIORITY_ACCOUNT),
+    "/fapi/v1/leverageBracket": (1, PRIORITY_ACCOUNT),
+    "/fapi/v1/exchangeInfo": (1, PRIORITY_ACCOUNT),
+    "/fapi/v1/aggTrades": (20, PRIORITY_BACKFILL),
+    "/fapi/v1/klines": (5, PRIORITY_BACKFILL),
+}
+
+# Share of the limit that lower priorities must leave untouched
+RESERVED_SHARES = {
+    PRIORITY_ORDER: 0.0,
+    PRIORITY_ACCOUNT: 0.1,
+    PRIORITY_BACKFILL: 0.5,
+}
+
+
+def get_endpoint_rule(http_method: str, path: str, payload: dict) -> tuple[int, int]:
+    """
+    Returns the weight and the priority of a request.
+    """
+    weight, priority = ENDPOINT_RULES.get(path, (1, PRIORITY_ACCOUNT))
+    if path == "/fapi/v1/openOrders" and "symbol" not in payload:
+        weight = 40
+    elif path == "/fapi/v1/batchOrders" and http_method == "DELETE":
+        weight = 1
+    return weight, priority
+
+
+class RateLimiter:
+    """
+    Token bucket of request weight that refills over a minute.
+    Waiting requests are served by priority and then by arrival,
+    and lower priorities leave a reserved share of the bucket
+    for more important requests.
+    The bucket is corrected with the used weight that Binance reports
+    in response headers, and it stops entirely while banned.
+    """
+
+    def __init__(self, weight_limit: int = 2400, safety_ratio: float = 0.8):
+        self._safety_ratio = safety_ratio
+        self._capacity = weight_limit * safety_ratio
+        self._tokens = self._capacity
+        self._updated_time = time.monotonic()
+        self._blocked_until = 0.0
+        self._waiters: list[tuple[int, int, float, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def available_weight(self) -> float:
+        self._refill()
+        return self._tokens
+
+    @property
+    def waiting_count(self) -> int:
+        return len(self._waiters)
+
+    def update_limit(self, weight_limit: int):
+        """
+        Applies the limit from `exchangeInfo`.
+        """
+        self._refill()
+        new_capacity = weight_limit * self._safety_ratio
+        self._tokens = min(self._tokens, new_capacity)
+        self._capacity = new_capacity
+
+    def sync(self, headers: Mapping[str, str]):
+        """
+        Takes the used weight of the current minute from response headers.
+        """
+        used_weight_text = headers.get("X-MBX-USED-WEIGHT-1M")
+        if used_weight_text is None:
+            return
+        self._refill()
+        used_weight = int(used_weight_text)
+        self._tokens = min(self._tokens, self._capacity - used_weight)
+
+    def block(self, seconds: float):
+        """
+        Stops every request for a while,
+        as Binance asks with `Retry-After` on status 429 and 418.
+        """
+        blocked_until = time.monotonic() + seconds
+        self._blocked_until = max(self._blocked_until, blocked_until)
+        self._tokens = min(self._tokens, 0.0)
+        self._dispatch()
+
+    async def acquire(self, weight: int, priority: int):
+        if len(self._waiters) == 0 and self._can_spend(weight, priority):
+            self._tokens -= weight
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), weight, future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Give back the weight that was already taken
+                self._tokens += weight
+            self._waiters = [w for w in self._waiters if w[3] is not future]
+            heapq.heapify(self._waiters)
+            raise
+
+    def _refill(self):
+        current_time = time.monotonic()
+        elapsed = current_time - self._updated_time
+        self._updated_time = current_time
+        refilled = self._tokens + elapsed * self._capacity / 60
+        self._tokens = min(refilled, self._capacity)
+
+    def _can_spend(self, weight: float, priority: int) -> bool:
+        if time.monotonic() < self._blocked_until:
+            return False
+        self._refill()
+        reserved = self._capacity * RESERVED_SHARES.get(priority, 0.0)
+        return self._tokens - weight >= reserved
+
+    def _dispatch(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        while self._waiters:
+            priority, _, weight, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if not self._can_spend(weight, priority):
+                break
+            heapq.heappop(self._waiters)
+            self._tokens -= weight
+            future.set_result(None)
+
+        if self._waiters:
+            priority, _, weight, _ = self._waiters[0]
+            reserved = self._capacity * RESERVED_SHARES.get(priority, 0.0)
+            missing = weight + reserved - self._tokens
+            waiting_time = max(missing * 60 / self._capacity, 0.0)
+            blocked_time = self._blocked_until - time.monotonic()
+            waiting_time = max(waiting_time, blocked_time, 0.01)
+            event_loop = asyncio.get_running_loop()
+            self._timer = event_loop.call_later(waiting_time, self._dispatch)
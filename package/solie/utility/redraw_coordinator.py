@@ -0,0 +1,84 @@
+import asyncio
+from typing import Callable, Coroutine
+
+
+def merge_flags(requests: list[dict[str, bool]]) -> dict[str, bool]:
+    # a flag only stays on when every merged request has it
+    keys = {k for flags in requests for k in flags}
+    return {k: all(flags.get(k, False) for flags in requests) for k in keys}
+
+
+class RedrawCoordinator:
+    """
+    Keeps at most one drawing task of a widget in flight.
+    Requests carry boolean flags that are off by default,
+    and bursts of requests are merged into one drawing
+    that only gets the flags every merged request has.
+    A new request cancels the drawing in flight,
+    along with its process pool work that hasn't started yet,
+    unless that drawing lacks a flag the new request has.
+    """
+
+    def __init__(self, draw: Callable[..., Coroutine], debounce: float = 0.1):
+        self._draw = draw
+        self._debounce = debounce
+        self._pending: list[tuple[dict[str, bool], asyncio.Future[None]]] = []
+        self._runner: asyncio.Task | None = None
+        self._drawing: asyncio.Task | None = None
+        self._drawing_flags: dict[str, bool] = {}
+        self.request_count = 0
+        self.draw_count = 0
+        self.cancel_count = 0
+
+    async def request(self, **flags: bool):
+        """
+        Returns when a drawing that started after this request is done.
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self._pending.append((flags, waiter))
+        self.request_count += 1
+
+        drawing = self._drawing
+        if drawing is not None and not drawing.done():
+            # a fuller drawing in flight is not thrown away for a lighter one
+            drawing_flags = self._drawing_flags
+            if not any(v and not drawing_flags.get(k, False) for k, v in flags.items()):
+                drawing.cancel()
+        if self._runner is None or self._runner.done():
+            self._runner = asyncio.create_task(self._keep_drawing())
+
+        await waiter
+
+    async def _keep_drawing(self):
+        while self._pending:
+            # wait until requests stop coming in
+            while True:
+                request_count = self.request_count
+                await asyncio.sleep(self._debounce)
+                if request_count == self.request_count:
+                    break
+
+            pending = self._pending
+            self._pending = []
+            drawing_flags = merge_flags([flags for flags, _ in pending])
+            drawing = asyncio.create_task(self._draw(**drawing_flags))
+            self._drawing = drawing
+            self._drawing_flags = drawing_flags
+            await asyncio.wait([drawing])
+            self._drawing = None
+
+            if drawing.cancelled():
+                # a newer request will draw for these as well
+                self.cancel_count += 1
+                self._pending = pending + self._pending
+                continue
+
+            self.draw_count += 1
+            error = drawing.exception()
+            for _, waiter in pending:
+                if waiter.done():
+                    continue
+                if error is None:
+                    waiter.set_result(None)
+                else:
+                    waiter.set_exception(error)
@@ -0,0 +1,163 @@
+import asyncio
+import copy
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+
+from solie.common import go_live
+
+from .analyze_market import decide, make_indicators
+from .decode_json import parse_aggregate_trade
+from .pandas_related import CandleGrid, make_candle_values
+from .stream_record import ReplayExchange, get_stream_kind
+from .structs import AggregateTrade
+from .timing import to_moment
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayHarness:
+    """
+    Feeds a recorded session through its own candle and decision steps,
+    apart from the running workers.
+    The clock is the recorded receive time,
+    and REST requests are answered by its own `ReplayExchange`,
+    so live data, orders and the system clock are never touched.
+    Frames wait for each cycle, so a replay decides the same way every time.
+    Only aggregate trades drive the candles.
+    """
+
+    def __init__(
+        self,
+        lines: list[dict],
+        target_symbols: list[str],
+        candle_data: pd.DataFrame,
+        indicators_script: str,
+        decision_script: str,
+        account_state: dict,
+    ):
+        self.exchange = ReplayExchange(lines)
+        self.target_symbols = target_symbols
+        self.indicators_script = indicators_script
+        self.decision_script = decision_script
+        self.account_state = copy.deepcopy(account_state)
+        self.scribbles: dict = {}
+
+        self._frame_lines = [line for line in lines if "url" in line]
+        self.current_time = self._frame_lines[0]["time"]  # In nanoseconds
+
+        # only candles before the recording are taken from the live data
+        first_moment = to_moment(self.get_current_datetime())
+        seed_from = first_moment - timedelta(days=28)
+        seed_mask = (candle_data.index >= seed_from) & (
+            candle_data.index < first_moment
+        )
+        self.candle_data: pd.DataFrame = candle_data[seed_mask].copy()  # type:ignore
+        self.candle_grid = CandleGrid()
+        self.aggregate_trades: list[AggregateTrade] = []
+
+        self.cycle_count = 0
+        self.decision_durations: list[float] = []
+
+    def get_current_datetime(self) -> datetime:
+        return datetime.fromtimestamp(self.current_time / 10**9, tz=timezone.utc)
+
+    async def run(self, speed: float = 1.0) -> dict[str, float]:
+        """
+        Replays the frames, keeping the recorded gaps divided by `speed`,
+        and returns the order latency summary.
+        """
+        frame_lines = self._frame_lines
+        first_time = frame_lines[0]["time"]
+        step = 10 * 10**9  # In nanoseconds
+        next_close = (first_time // step + 1) * step
+
+        logger.info(f"Started replaying {len(frame_lines)} frames")
+        replay_start = time.perf_counter()
+        for line in frame_lines:
+            recorded_gap = (line["time"] - first_time) / 10**9 / speed
+            waiting_time = recorded_gap - (time.perf_counter() - replay_start)
+            if waiting_time > 0:
+                await asyncio.sleep(waiting_time)
+            while line["time"] >= next_close:
+                self.current_time = next_close
+                # order latency counts from the candle close
+                self.exchange.last_fed_time = time.perf_counter()
+                await self.run_cycle()
+                next_close += step
+            self.current_time = line["time"]
+            self.exchange.last_fed_time = time.perf_counter()
+            if get_stream_kind(line["url"]).endswith("@aggTrade"):
+                self.aggregate_trades.append(parse_aggregate_trade(line["frame"]))
+
+        summary = self.exchange.summarize_latencies()
+        logger.info(f"Finished replaying {self.cycle_count} cycles\n{summary}")
+        return summary
+
+    async def run_cycle(self):
+        current_moment = to_moment(self.get_current_datetime())
+        before_moment = current_moment - timedelta(seconds=10)
+
+        # ■■■■■ candle step ■■■■■
+
+        candle = make_candle_values(
+            self.aggregate_trades,
+            self.target_symbols,
+            self.candle_data,
+            before_moment,
+        )
+        if candle is None:
+            return
+        new_values, _ = candle
+        self.candle_data = self.candle_grid.add_row(
+            self.candle_data, before_moment, new_values
+        )
+        # older trades can't be in later candles
+        keep_from = int(current_moment.timestamp()) * 1000 - 1000
+        self.aggregate_trades = [
+            t for t in self.aggregate_trades if t.timestamp >= keep_from
+        ]
+
+        # ■■■■■ decision step ■■■■■
+
+        start_time = time.perf_counter()
+        candle_data = self.candle_data[current_moment - timedelta(days=28) :]
+
+        coroutines = [
+            go_live(
+                make_indicators,
+                target_symbols=[symbol],
+                candle_data=candle_data[[symbol]],  # type:ignore
+                indicators_script=self.indicators_script,
+                only_last_index=True,
+            )
+            for symbol in self.target_symbols
+        ]
+        symbol_indicators = await asyncio.gather(*coroutines)
+        indicators = pd.concat(symbol_indicators, axis="columns")
+
+        decision, self.scribbles = await go_live(
+            decide,
+            target_symbols=self.target_symbols,
+            current_moment=current_moment,
+            current_candle_data=candle_data.tail(1).to_records()[-1],
+            current_indicators=indicators.to_records()[-1],
+            account_state=self.account_state,
+            scribbles=self.scribbles,
+            decision_script=self.decision_script,
+        )
+        self.decision_durations.append(time.perf_counter() - start_time)
+        self.cycle_count += 1
+
+        # ■■■■■ order step ■■■■■
+
+        # commands are acknowledged one by one without sizing
+        for symbol, symbol_decision in decision.items():
+            for command_name in symbol_decision.keys():
+                await self.exchange.binance(
+                    http_method="POST",
+                    path="/fapi/v1/order",
+                    payload={"symbol": symbol, "type": command_name},
+                )
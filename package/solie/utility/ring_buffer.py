@@ -0,0 +1,96 @@
+import numpy as np
+
+BOOK_TICKER_DTYPE = np.dtype(
+    [
+        ("timestamp", np.int64),  # In milliseconds
+        ("symbol", np.int16),  # Index in the symbol list
+        ("best_bid_price", np.float64),
+        ("best_ask_price", np.float64),
+    ]
+)
+
+MARK_PRICE_DTYPE = np.dtype(
+    [
+        ("timestamp", np.int64),  # In milliseconds
+        ("symbol", np.int16),  # Index in the symbol list
+        ("mark_price", np.float64),
+    ]
+)
+
+
+class RingBuffer:
+    """
+    Fixed-size buffer of records stored in a NumPy structured array.
+    Oldest records get overwritten when it's full,
+    so memory usage is decided at creation.
+    Symbols are stored as indices of the given symbol list,
+    and records of other symbols are ignored.
+    """
+
+    def __init__(self, dtype: np.dtype, capacity: int, symbols: list[str]):
+        self.dtype = dtype
+        self._array = np.zeros(capacity, dtype=dtype)
+        self._capacity = capacity
+        self._written = 0
+        self.symbols = symbols
+        self._symbol_indices = {s: i for i, s in enumerate(symbols)}
+
+    def __len__(self) -> int:
+        return min(self._written, self._capacity)
+
+    @property
+    def written(self) -> int:
+        """
+        Total number of records appended so far, including overwritten ones.
+        """
+        return self._written
+
+    def append(self, timestamp: int, symbol: str, *values: float):
+        symbol_index = self._symbol_indices.get(symbol)
+        if symbol_index is None:
+            return
+        position = self._written % self._capacity
+        self._array[position] = (timestamp, symbol_index, *values)
+        self._written += 1
+
+    def clear(self):
+        self._written = 0
+
+    def get_recent(self, size: int, symbol: str | None = None) -> np.ndarray:
+        """
+        Returns a copy of the last records in chronological order.
+        When a symbol is given, only its records are kept
+        after taking `size` records.
+        """
+        size = min(size, len(self))
+        end = self._written % self._capacity
+        start = end - size
+        if start >= 0:
+            records = self._array[start:end].copy()
+        else:
+            records = np.concatenate([self._array[start:], self._array[:end]])
+        if symbol is not None:
+            records = records[records["symbol"] == self._symbol_indices[symbol]]
+        return records
+
+    def get_since(self, written: int) -> np.ndarray:
+        """
+        Returns a copy of records appended after `written` had been reached.
+        Records that were already overwritten are not included.
+        """
+        size = max(self._written - written, 0)
+        return self.get_recent(size)
+
+    def get_first_timestamp(self) -> int | None:
+        if len(self) == 0:
+            return None
+        if self._written <= self._capacity:
+            return int(self._array[0]["timestamp"])
+        position = self._written % self._capacity
+        return int(self._array[position]["timestamp"])
+
+    def get_last_timestamp(self) -> int | None:
+        if len(self) == 0:
+            return None
+        position = (self._written - 1) % self._capacity
+        return int(self._array[position]["timestamp"])
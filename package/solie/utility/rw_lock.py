@@ -1,23 +1,61 @@
 import asyncio
+import inspect
+import time
 from asyncio import AbstractEventLoop, Future, Task
 from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from types import CodeType, FrameType
 from typing import Generic, TypeVar
 
 
+@dataclass
+class LockStats:
+    count: int = 0
+    total_wait: float = 0.0  # In seconds
+    max_wait: float = 0.0  # In seconds
+    total_hold: float = 0.0  # In seconds
+    max_hold: float = 0.0  # In seconds
+
+
+# lock name, lock mode and call site
+lock_stats: dict[tuple[str, str, str], LockStats] = {}
+
+
+def get_lock_stats() -> dict[tuple[str, str, str], LockStats]:
+    return lock_stats
+
+
+call_sites: dict[tuple[CodeType, int], str] = {}
+
+
+def get_call_site(frame: FrameType) -> str:
+    code = frame.f_code
+    key = (code, frame.f_lineno)
+    call_site = call_sites.get(key)
+    if call_site is None:
+        call_site = f"{Path(code.co_filename).stem}.{code.co_name}:{key[1]}"
+        call_sites[key] = call_site
+    return call_site
+
+
 # The internal lock object managing the RWLock state.
 class RWLockCore:
     _RL = 1
     _WL = 2
 
-    def __init__(self, fast: bool, loop: AbstractEventLoop):
+    def __init__(self, fast: bool, loop: AbstractEventLoop, name: str | None):
         self._do_yield = not fast
         self._loop = loop
         self._read_waiters: deque[Future[None]] = deque()
         self._write_waiters: deque[Future[None]] = deque()
         self._r_state: int = 0
         self._w_state: int = 0
-        # tasks will be few, so a list is not inefficient
-        self._owning: list[tuple[Task, int]] = []
+        # how many times each task holds each lock type
+        self._owning: dict[tuple[Task, int], int] = {}
+        # only named locks are measured
+        self.name = name
+        self._holdings: dict[Task, list[tuple[float, LockStats]]] = {}
 
     @property
     def r_state(self) -> int:
@@ -35,6 +73,37 @@ class RWLockCore:
     def write_locked(self) -> bool:
         return self._w_state > 0
 
+    def _own(self, me: Task, lock_type: int):
+        key = (me, lock_type)
+        self._owning[key] = self._owning.get(key, 0) + 1
+
+    def note_acquired(self, mode: str, call_site: str, wait_time: float):
+        assert self.name is not None  # nosec
+        key = (self.name, mode, call_site)
+        stats = lock_stats.get(key)
+        if stats is None:
+            stats = LockStats()
+            lock_stats[key] = stats
+        stats.count += 1
+        stats.total_wait += wait_time
+        stats.max_wait = max(stats.max_wait, wait_time)
+
+        me = asyncio.current_task()
+        assert me is not None  # nosec
+        holding = (time.perf_counter(), stats)
+        self._holdings.setdefault(me, []).append(holding)
+
+    def note_released(self):
+        me = asyncio.current_task()
+        assert me is not None  # nosec
+        task_holdings = self._holdings[me]
+        acquired_time, stats = task_holdings.pop()
+        if not task_holdings:
+            del self._holdings[me]
+        hold_time = time.perf_counter() - acquired_time
+        stats.total_hold += hold_time
+        stats.max_hold = max(stats.max_hold, hold_time)
+
     async def _yield_after_acquire(self, lock_type: int):
         if self._do_yield:
             try:
@@ -51,13 +120,13 @@ class RWLockCore:
 
         if (me, self._RL) in self._owning or (me, self._WL) in self._owning:
             self._r_state += 1
-            self._owning.append((me, self._RL))
+            self._own(me, self._RL)
             await self._yield_after_acquire(self._RL)
             return True
 
         if not self._write_waiters and self._r_state >= 0 and self._w_state == 0:
             self._r_state += 1
-            self._owning.append((me, self._RL))
+            self._own(me, self._RL)
             await self._yield_after_acquire(self._RL)
             return True
 
@@ -65,7 +134,7 @@ class RWLockCore:
         self._read_waiters.append(fut)
         try:
             await fut
-            self._owning.append((me, self._RL))
+            self._own(me, self._RL)
             return True
 
         except asyncio.CancelledError:
@@ -84,7 +153,7 @@ class RWLockCore:
 
         if (me, self._WL) in self._owning:
             self._w_state += 1
-            self._owning.append((me, self._WL))
+            self._own(me, self._WL)
             await self._yield_after_acquire(self._WL)
             return True
         elif (me, self._RL) in self._owning:
@@ -93,7 +162,7 @@ class RWLockCore:
 
         if self._r_state == 0 and self._w_state == 0:
             self._w_state += 1
-            self._owning.append((me, self._WL))
+            self._own(me, self._WL)
             await self._yield_after_acquire(self._WL)
             return True
 
@@ -101,7 +170,7 @@ class RWLockCore:
         self._write_waiters.append(fut)
         try:
             await fut
-            self._owning.append((me, self._WL))
+            self._own(me, self._WL)
             return True
 
         except asyncio.CancelledError:
@@ -123,10 +192,14 @@ class RWLockCore:
         me = asyncio.current_task(loop=self._loop)
         assert me is not None  # nosec
 
-        try:
-            self._owning.remove((me, lock_type))
-        except ValueError:
+        key = (me, lock_type)
+        count = self._owning.get(key, 0)
+        if count == 0:
             raise RuntimeError("Cannot release an un-acquired lock")
+        elif count == 1:
+            del self._owning[key]
+        else:
+            self._owning[key] = count - 1
         if lock_type == self._RL:
             self._r_state -= 1
         else:
@@ -173,11 +246,22 @@ class ReadLock(Generic[T]):
         return self._lock.read_locked
 
     async def __aenter__(self) -> Cell[T]:
-        await self._lock.acquire_read()
+        lock = self._lock
+        if lock.name is None:
+            await lock.acquire_read()
+        else:
+            frame = inspect.currentframe()
+            assert frame is not None and frame.f_back is not None  # nosec
+            call_site = get_call_site(frame.f_back)
+            wait_start = time.perf_counter()
+            await lock.acquire_read()
+            lock.note_acquired("read", call_site, time.perf_counter() - wait_start)
         return self._wrapper
 
     async def __aexit__(self, exc_type, exc, tb):
         self._lock.release_read()
+        if self._lock.name is not None:
+            self._lock.note_released()
 
     def __repr__(self) -> str:
         status = "locked" if self._lock.r_state > 0 else "unlocked"
@@ -194,11 +278,22 @@ class WriteLock(Generic[T]):
         return self._lock.write_locked
 
     async def __aenter__(self) -> Cell[T]:
-        await self._lock.acquire_write()
+        lock = self._lock
+        if lock.name is None:
+            await lock.acquire_write()
+        else:
+            frame = inspect.currentframe()
+            assert frame is not None and frame.f_back is not None  # nosec
+            call_site = get_call_site(frame.f_back)
+            wait_start = time.perf_counter()
+            await lock.acquire_write()
+            lock.note_acquired("write", call_site, time.perf_counter() - wait_start)
         return self._wrapper
 
     async def __aexit__(self, exc_type, exc, tb):
         self._lock.release_write()
+        if self._lock.name is not None:
+            self._lock.note_released()
 
     def __repr__(self) -> str:
         status = "locked" if self._lock.w_state > 0 else "unlocked"
@@ -210,13 +305,16 @@ class RWLock(Generic[T]):
     operations and one for writing. The read lock may be held simultaneously
     by multiple reader tasks, so long as there are no writers. The write
     lock is exclusive.
+
+    When a name is given, time spent waiting for and holding the lock
+    is recorded by lock mode and call site.
     """
 
-    def __init__(self, cell_data: T, fast: bool = True):
+    def __init__(self, cell_data: T, fast: bool = True, name: str | None = None):
         loop = asyncio.get_running_loop()
         self._wrapper = Cell(cell_data)
         self._loop = loop
-        core = RWLockCore(fast, self._loop)
+        core = RWLockCore(fast, self._loop, name)
         self.read_lock = ReadLock(core, self._wrapper)
         self.write_lock = WriteLock(core, self._wrapper)
 
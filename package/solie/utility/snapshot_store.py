@@ -0,0 +1,60 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Generic, TypeVar
+
+from .rw_lock import Cell
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class Snapshot(Generic[T]):
+    version: int
+    data: T
+
+
+class SnapshotWriter(Generic[T]):
+    def __init__(self, store: "SnapshotStore[T]"):
+        self._store = store
+        self._lock = asyncio.Lock()
+        self._cell: Cell[T] | None = None
+
+    @property
+    def locked(self) -> bool:
+        return self._lock.locked()
+
+    async def __aenter__(self) -> Cell[T]:
+        await self._lock.acquire()
+        self._cell = Cell(self._store.snapshot().data)
+        return self._cell
+
+    async def __aexit__(self, exc_type, exc, tb):
+        cell = self._cell
+        self._cell = None
+        try:
+            if exc_type is None and cell is not None:
+                if cell.data is not self._store.snapshot().data:
+                    self._store.publish(cell.data)
+        finally:
+            self._lock.release()
+
+
+class SnapshotStore(Generic[T]):
+    """
+    Keeps immutable versions of data.
+    Readers take the latest version in O(1) without waiting,
+    while writers take turns to build and publish a new version.
+    Published data must never be modified in place,
+    because readers may still be using it.
+    """
+
+    def __init__(self, data: T):
+        self._snapshot = Snapshot(0, data)
+        self.write_lock = SnapshotWriter(self)
+
+    def snapshot(self) -> Snapshot[T]:
+        return self._snapshot
+
+    def publish(self, data: T) -> Snapshot[T]:
+        self._snapshot = Snapshot(self._snapshot.version + 1, data)
+        return self._snapshot
@@ -0,0 +1,186 @@
+import asyncio
+import json
+import logging
+import statistics
+import time
+from pathlib import Path
+from typing import Any
+
+import aiofiles
+
+from .decode_json import decode_json
+
+logger = logging.getLogger(__name__)
+
+
+class StreamRecorder:
+    """
+    Appends every received websocket frame and REST response to a file,
+    one JSON object per line with the receive time in nanoseconds.
+    Lines are written in batches to keep the event loop free.
+    """
+
+    def __init__(self, filepath: Path):
+        self.filepath = filepath
+        self._pending: list[str] = []
+
+    def record_frame(self, url: str, frame: str):
+        line = json.dumps({"time": time.time_ns(), "url": url, "frame": frame})
+        self._pending.append(line)
+
+    def record_response(
+        self, http_method: str, path: str, payload: dict, response: Any
+    ):
+        line = json.dumps(
+            {
+                "time": time.time_ns(),
+                "method": http_method,
+                "path": path,
+                "payload": payload,
+                "response": response,
+            }
+        )
+        self._pending.append(line)
+
+    async def flush(self):
+        if not self._pending:
+            return
+        lines, self._pending = self._pending, []
+        async with aiofiles.open(self.filepath, "a", encoding="utf8") as file:
+            await file.write("\n".join(lines) + "\n")
+
+
+recorder: StreamRecorder | None = None
+
+
+def get_stream_recorder() -> StreamRecorder | None:
+    return recorder
+
+
+async def record_streams(filepath: Path, duration: float):
+    """
+    Records all inbound frames and REST responses for the given seconds.
+    """
+    global recorder
+    if recorder is not None:
+        raise RuntimeError("Streams are already being recorded")
+
+    new_recorder = StreamRecorder(filepath)
+    recorder = new_recorder
+    logger.info(f"Started recording streams\n{filepath}")
+    try:
+        start_time = time.perf_counter()
+        while time.perf_counter() - start_time < duration:
+            await asyncio.sleep(1.0)
+            await new_recorder.flush()
+    finally:
+        recorder = None
+        await new_recorder.flush()
+    logger.info(f"Finished recording streams\n{filepath}")
+
+
+def get_stream_kind(url: str) -> str:
+    """
+    Returns the stream name from a websocket URL.
+    User data streams are named `userData`
+    because their listen keys change between sessions.
+
+    - `wss://fstream.binance.com/ws/btcusdt@aggTrade` → `btcusdt@aggTrade`
+    """
+    stream_name = url.rsplit("/", 1)[-1]
+    if "@" in stream_name:
+        return stream_name
+    return "userData"
+
+
+def get_payload_key(payload: dict) -> str:
+    """
+    Identifies a REST request by its payload,
+    leaving out the timestamp that changes on every request.
+    """
+    return json.dumps(
+        {k: v for k, v in payload.items() if k != "timestamp"},
+        sort_keys=True,
+    )
+
+
+class UnrecordedRequestError(Exception):
+    def __init__(self, http_method: str, path: str, payload: dict):
+        text = f"This request was not recorded\n{http_method} {path}"
+        text += f"\n{get_payload_key(payload)}"
+        super().__init__(text)
+
+
+async def read_recording(filepath: Path) -> list[dict]:
+    """
+    Reads the lines written by `StreamRecorder`.
+    """
+    async with aiofiles.open(filepath, "r", encoding="utf8") as file:
+        lines = [decode_json(line) for line in await file.readlines() if line.strip()]
+    if not lines:
+        raise ValueError("The recorded file is empty")
+    if not any("url" in line for line in lines):
+        raise ValueError("The recorded file has no stream frames")
+    return lines
+
+
+class ReplayExchange:
+    """
+    Stands in for `ApiRequester` during a replay.
+    Recorded responses are served by method, path and payload,
+    while orders are acknowledged locally and their latency is measured
+    from the last fed frame.
+    Requests that weren't recorded raise `UnrecordedRequestError`.
+    """
+
+    def __init__(self, lines: list[dict]):
+        self.responses: dict[tuple[str, str, str], Any] = {}
+        for line in lines:
+            if "path" in line:
+                payload_key = get_payload_key(line.get("payload", {}))
+                key = (line["method"], line["path"], payload_key)
+                self.responses[key] = line["response"]
+        self.order_latencies: list[float] = []
+        self.last_fed_time = time.perf_counter()
+        self._last_order_id = 0
+
+    async def binance(
+        self,
+        http_method: str,
+        path: str,
+        payload: dict = {},
+        server="futures",
+        priority: int | None = None,
+    ) -> Any:
+        if http_method == "POST" and path == "/fapi/v1/order":
+            return self._acknowledge_order(payload)
+        if http_method == "POST" and path == "/fapi/v1/batchOrders":
+            orders = decode_json(payload["batchOrders"])
+            return [self._acknowledge_order(o) for o in orders]
+        key = (http_method, path, get_payload_key(payload))
+        if key not in self.responses:
+            raise UnrecordedRequestError(http_method, path, payload)
+        return self.responses[key]
+
+    def _acknowledge_order(self, order: dict) -> dict:
+        self.order_latencies.append(time.perf_counter() - self.last_fed_time)
+        self._last_order_id += 1
+        return {
+            "symbol": order["symbol"],
+            "orderId": self._last_order_id,
+            "updateTime": time.time_ns() // 10**6,
+            "status": "NEW",
+        }
+
+    def summarize_latencies(self) -> dict[str, float]:
+        latencies = self.order_latencies
+        if len(latencies) < 2:
+            return {"count": len(latencies)}
+        quantiles = statistics.quantiles(latencies, n=100)
+        return {
+            "count": len(latencies),
+            "p50": quantiles[49],
+            "p95": quantiles[94],
+            "p99": quantiles[98],
+            "max": max(latencies),
+        }
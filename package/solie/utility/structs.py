@@ -60,6 +60,13 @@ class ManagementSettings(DataClassJsonMixin):
     lock_board: str = "NEVER"  # One of `BOARD_LOCK_OPTIONS`
 
 
+@dataclass
+class CollectorSettings(DataClassJsonMixin):
+    should_archive_ticks: bool = False
+    tick_archive_days: int = 30
+    download_concurrency: int = 4
+
+
 @dataclass
 class BookTicker:
     timestamp: int  # In milliseconds
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import aiofiles
+import aiofiles.os
+import numpy as np
+
+from .ring_buffer import RingBuffer
+
+
+def get_archive_dtype(dtype: np.dtype) -> np.dtype:
+    """
+    Archive files are split by symbol,
+    so the symbol field is not written to the disk.
+    """
+    fields = dtype.fields
+    assert fields is not None  # nosec
+    return np.dtype([(n, f[0]) for n, f in fields.items() if n != "symbol"])
+
+
+def read_tick_archive(filepath: Path, dtype: np.dtype) -> np.ndarray:
+    """
+    Reads a day of ticks written by `TickArchive`.
+    `dtype` should be the one of the ring buffer that was archived.
+    """
+    return np.fromfile(filepath, dtype=get_archive_dtype(dtype))
+
+
+class TickArchive:
+    """
+    Appends new records of a ring buffer to compact binary files,
+    one file per symbol per day.
+    Files older than `keep_days` are removed.
+
+    - `{archive_path}/{symbol}/{year}-{month}-{day}.bin`
+    """
+
+    def __init__(self, archive_path: Path, ring_buffer: RingBuffer, keep_days: int):
+        self.archive_path = archive_path
+        self.keep_days = keep_days
+        self._ring_buffer = ring_buffer
+        self._archive_dtype = get_archive_dtype(ring_buffer.dtype)
+        self._archived = ring_buffer.written
+
+    async def flush(self):
+        ring_buffer = self._ring_buffer
+        if ring_buffer.written < self._archived:
+            # The ring buffer was cleared
+            self._archived = 0
+        records = ring_buffer.get_since(self._archived)
+        self._archived = ring_buffer.written
+        if len(records) == 0:
+            return
+
+        days = records["timestamp"] // (24 * 60 * 60 * 1000)
+        for symbol_index, symbol in enumerate(ring_buffer.symbols):
+            symbol_mask = records["symbol"] == symbol_index
+            if not symbol_mask.any():
+                continue
+            symbol_path = self.archive_path / symbol
+            await aiofiles.os.makedirs(symbol_path, exist_ok=True)
+            for day in np.unique(days[symbol_mask]):
+                day_records = records[symbol_mask & (days == day)]
+                archived = np.empty(len(day_records), dtype=self._archive_dtype)
+                for field_name in self._archive_dtype.names or ():
+                    archived[field_name] = day_records[field_name]
+                date = datetime.fromtimestamp(int(day) * 24 * 60 * 60, tz=timezone.utc)
+                filepath = symbol_path / f"{date.strftime('%Y-%m-%d')}.bin"
+                async with aiofiles.open(filepath, "ab") as file:
+                    await file.write(archived.tobytes())
+
+    async def remove_old_files(self):
+        if not await aiofiles.os.path.isdir(self.archive_path):
+            return
+        oldest_date = datetime.now(timezone.utc) - timedelta(days=self.keep_days)
+        oldest_name = f"{oldest_date.strftime('%Y-%m-%d')}.bin"
+        for symbol in await aiofiles.os.listdir(self.archive_path):
+            symbol_path = self.archive_path / symbol
+            for filename in await aiofiles.os.listdir(symbol_path):
+                if filename < oldest_name:
+                    await aiofiles.os.remove(symbol_path / filename)
@@ -1,4 +1,5 @@
 import asyncio
+import functools
 import logging
 import math
 import random
@@ -7,31 +8,62 @@ import webbrowser
 from collections import deque
 from datetime import datetime, timedelta, timezone
 
+import aiofiles
 import aiofiles.os
 import numpy as np
 import pandas as pd
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from PySide6 import QtWidgets
 
-from solie.common import go, outsource
+from solie.common import (
+    STAGE_BACKGROUND,
+    STAGE_CANDLE,
+    get_cycle_scheduler,
+    go,
+    go_fit,
+    go_io,
+    outsource,
+)
 from solie.overlay import DonationGuide, DownloadFillOption
 from solie.utility import (
+    BOOK_TICKER_DTYPE,
+    MARK_PRICE_DTYPE,
     AggregateTrade,
     ApiRequester,
     ApiStreamer,
+    ArchiveDownloader,
+    BackfillProgress,
     BookTicker,
+    CandleClosed,
+    CandleGrid,
+    CandleNotifier,
+    CollectorSettings,
     DownloadPreset,
     MarkPrice,
-    RWLock,
+    RingBuffer,
+    SnapshotStore,
+    TickArchive,
     add_task_duration,
+    assemble_candle_data,
     combine_candle_data,
+    count_daily_candles,
     create_empty_candle_data,
-    download_aggtrade_data,
     fill_holes_with_aggtrades,
+    find_candle_holes,
     find_stop_flag,
     format_numeric,
+    get_aggtrade_archive_url,
+    get_exchange_info_cache,
     internet_connected,
+    is_period_covered,
+    make_candle_values,
     make_stop_flag,
+    merge_candle_data_file,
+    parse_aggregate_trade,
+    parse_book_ticker,
+    parse_mark_prices,
+    read_aggtrade_archive,
+    read_daily_candle_counts,
     slice_deque,
     sort_data_frame,
     to_moment,
@@ -57,6 +89,7 @@ class Collector:
 
         self.price_precisions: dict[str, int] = {}  # Symbol and decimal places
         self.markets_gone: set[str] = set()  # Symbols
+        self.tick_archives: list[TickArchive] = []
 
         # ■■■■■ remember and display ■■■■■
 
@@ -69,38 +102,58 @@ class Collector:
         # Candle data.
         # It's expected to have only the data of current year,
         # while data of previous years are stored in the disk.
-        self.candle_data = RWLock(
+        # Readers take an immutable snapshot without waiting for writers.
+        self.candle_data = SnapshotStore(
             create_empty_candle_data(window.data_settings.target_symbols)
         )
+        # New candles are written into spare rows instead of copying the whole data.
+        self.candle_grid = CandleGrid()
+        # Consumers wake up when a new candle is written.
+        self.candle_notifier = CandleNotifier()
+
+        self.collector_settings = CollectorSettings()
 
         # Realtime data
-        self.realtime_data = deque[BookTicker | MarkPrice]([], 2 ** (10 + 10 + 2))
+        target_symbols = window.data_settings.target_symbols
+        self.book_tickers = RingBuffer(
+            BOOK_TICKER_DTYPE, 2 ** (10 + 10 + 2), target_symbols
+        )
+        self.mark_prices = RingBuffer(MARK_PRICE_DTYPE, 2 ** (10 + 10), target_symbols)
         self.aggregate_trades = deque[AggregateTrade]([], 2 ** (10 + 10))
 
         # ■■■■■ repetitive schedules ■■■■■
 
-        self.scheduler.add_job(
+        cycle_scheduler = get_cycle_scheduler()
+        cycle_scheduler.add_job(
             self.display_status_information,
-            trigger="cron",
-            second="*",
+            period=1,
+            stage=STAGE_BACKGROUND,
+            deadline=0.9,
         )
-        self.scheduler.add_job(
+        cycle_scheduler.add_job(
+            self.add_candle_data,
+            period=10,
+            stage=STAGE_CANDLE,
+            deadline=2.0,
+        )
+        cycle_scheduler.add_job(
             self.fill_candle_data_holes,
-            trigger="cron",
-            second="*/10",
+            period=10,
+            stage=STAGE_BACKGROUND,
+            deadline=9.0,
         )
         self.scheduler.add_job(
-            self.add_candle_data,
+            self.organize_data,
             trigger="cron",
-            second="*/10",
+            minute="*",
         )
         self.scheduler.add_job(
-            self.organize_data,
+            self.get_exchange_information,
             trigger="cron",
             minute="*",
         )
         self.scheduler.add_job(
-            self.get_exchange_information,
+            self.save_tick_archives,
             trigger="cron",
             minute="*",
         )
@@ -115,12 +168,17 @@ class Collector:
         self.mark_price_streamer = ApiStreamer(
             "wss://fstream.binance.com/ws/!markPrice@arr@1s",
             self.add_mark_price,
+            functools.partial(
+                parse_mark_prices,
+                target_symbols=set(self.window.data_settings.target_symbols),
+            ),
         )
 
         self.book_ticker_streamers = [
             ApiStreamer(
                 f"wss://fstream.binance.com/ws/{s.lower()}@bookTicker",
                 self.add_book_tickers,
+                parse_book_ticker,
             )
             for s in self.window.data_settings.target_symbols
         ]
@@ -128,6 +186,7 @@ class Collector:
             ApiStreamer(
                 f"wss://fstream.binance.com/ws/{s.lower()}@aggTrade",
                 self.add_aggregate_trades,
+                parse_aggregate_trade,
             )
             for s in self.window.data_settings.target_symbols
         ]
@@ -158,14 +217,40 @@ class Collector:
     async def load(self):
         await aiofiles.os.makedirs(self.workerpath, exist_ok=True)
 
+        # settings
+        filepath = self.workerpath / "collector_settings.json"
+        if await aiofiles.os.path.isfile(filepath):
+            async with aiofiles.open(filepath, "r", encoding="utf8") as file:
+                content = await file.read()
+                self.collector_settings = CollectorSettings.from_json(content)
+        else:
+            async with aiofiles.open(filepath, "w", encoding="utf8") as file:
+                await file.write(self.collector_settings.to_json(indent=2))
+
+        # tick archives
+        if self.collector_settings.should_archive_ticks:
+            keep_days = self.collector_settings.tick_archive_days
+            self.tick_archives = [
+                TickArchive(
+                    self.workerpath / "ticks" / "book_ticker",
+                    self.book_tickers,
+                    keep_days,
+                ),
+                TickArchive(
+                    self.workerpath / "ticks" / "mark_price",
+                    self.mark_prices,
+                    keep_days,
+                ),
+            ]
+
         # candle data
         current_year = datetime.now(timezone.utc).year
         async with self.candle_data.write_lock as cell:
             filepath = self.workerpath / f"candle_data_{current_year}.pickle"
             if await aiofiles.os.path.isfile(filepath):
-                df: pd.DataFrame = await go(pd.read_pickle, filepath)
+                df: pd.DataFrame = await go_io(pd.read_pickle, filepath)
                 if not df.index.is_monotonic_increasing:
-                    df = await go(sort_data_frame, df)
+                    df = await go_fit(sort_data_frame, df)
                 cell.data = df
 
     async def organize_data(self):
@@ -177,7 +262,7 @@ class Collector:
                 unique_index = original_index.drop_duplicates()
                 cell.data = cell.data.reindex(unique_index)
             if not cell.data.index.is_monotonic_increasing:
-                cell.data = await go(sort_data_frame, cell.data)
+                cell.data = await go_fit(sort_data_frame, cell.data)
 
         duration = time.perf_counter() - start_time
         add_task_duration("collector_organize_data", duration)
@@ -190,13 +275,13 @@ class Collector:
         filepath_new = self.workerpath / f"candle_data_{current_year}.pickle.new"
         filepath_backup = self.workerpath / f"candle_data_{current_year}.pickle.backup"
 
-        async with self.candle_data.read_lock as cell:
-            mask = cell.data.index.year == current_year  # type:ignore
-            year_df: pd.DataFrame = cell.data[mask].copy()
+        candle_data = self.candle_data.snapshot().data
+        mask = candle_data.index.year == current_year  # type:ignore
+        year_df: pd.DataFrame = candle_data[mask].copy()
 
         # ■■■■■ make a new file ■■■■■
 
-        await go(year_df.to_pickle, filepath_new)
+        await go_io(year_df.to_pickle, filepath_new)
 
         # ■■■■■ safely replace the existing file ■■■■■
 
@@ -207,30 +292,20 @@ class Collector:
         if await aiofiles.os.path.isfile(filepath_new):
             await aiofiles.os.rename(filepath_new, filepath)
 
+    async def save_tick_archives(self):
+        for tick_archive in self.tick_archives:
+            await tick_archive.flush()
+            await tick_archive.remove_old_files()
+
     async def get_exchange_information(self):
         if not internet_connected():
             return
 
-        payload = {}
-        response = await self.api_requester.binance(
-            http_method="GET",
-            path="/fapi/v1/exchangeInfo",
-            payload=payload,
+        exchange_info_cache = get_exchange_info_cache()
+        exchange_information = await exchange_info_cache.get_exchange_information(
+            self.api_requester
         )
-        about_exchange = response
-
-        for about_symbol in about_exchange["symbols"]:
-            symbol = about_symbol["symbol"]
-
-            about_filter = {}
-            for filter in about_symbol["filters"]:
-                if filter["filterType"] == "PRICE_FILTER":
-                    about_filter = filter
-                    break
-
-            ticksize = float(about_filter["tickSize"])
-            price_precision = int(math.log10(1 / ticksize))
-            self.price_precisions[symbol] = price_precision
+        self.price_precisions = exchange_information.price_precisions
 
     async def fill_candle_data_holes(self):
         # ■■■■■ check internet connection ■■■■■
@@ -242,89 +317,118 @@ class Collector:
 
         current_moment = to_moment(datetime.now(timezone.utc))
         split_moment = current_moment - timedelta(days=2)
+        from_moment = current_moment - timedelta(hours=24)
+        until_moment = current_moment - timedelta(minutes=1)
 
-        # ■■■■■ fill holes ■■■■■
-
-        full_symbols: set[str] = set()
-        request_count = 0
+        # ■■■■■ find holes ■■■■■
 
         # only the recent part
-        async with self.candle_data.read_lock as cell:
-            recent_candle_data = cell.data[cell.data.index >= split_moment].copy()
-
-        did_fill = False
+        candle_data = self.candle_data.snapshot().data
+        recent_candle_data = candle_data[candle_data.index >= split_moment].copy()
 
         target_symbols = self.window.data_settings.target_symbols
-        needed_moments = int((86400 - 60) / 10) + 1
-        while len(full_symbols) < len(target_symbols) and request_count < 10:
-            for symbol in target_symbols:
-                if symbol in full_symbols:
-                    continue
+        segments: list[tuple[str, datetime, datetime]] = []
+        for symbol in target_symbols:
+            if symbol in self.markets_gone:
+                continue
+            written_moments = recent_candle_data[(symbol, "Close")].dropna().index
+            holes = find_candle_holes(
+                written_moments,  # type:ignore
+                from_moment,
+                until_moment,
+            )
+            for hole_start, hole_end in holes:
+                # split long holes so that they can be fetched concurrently
+                segment_start = hole_start
+                while segment_start < hole_end:
+                    segment_end = min(segment_start + timedelta(hours=1), hole_end)
+                    segments.append((symbol, segment_start, segment_end))
+                    segment_start = segment_end
+
+        if len(segments) == 0:
+            return
 
-                from_moment = current_moment - timedelta(hours=24)
-                until_moment = current_moment - timedelta(minutes=1)
+        # older holes first, taking turns between symbols
+        segments.sort(key=lambda segment: segment[1])
 
-                inspect_df: pd.DataFrame = recent_candle_data[symbol][
-                    from_moment:until_moment
-                ]  # type:ignore
-                base_index = inspect_df.dropna().index
-                temp_sr = pd.Series(0, index=base_index)
-                written_moments = len(temp_sr)
+        # ■■■■■ request historical aggtrade data ■■■■■
 
-                if written_moments == needed_moments:
-                    # case when there are no holes
-                    full_symbols.add(symbol)
-                    continue
+        # the rate limiter keeps aggtrade requests
+        # from taking the weight needed by orders
+        request_limit = 10
+        request_count = 0
 
-                if from_moment not in temp_sr.index:
-                    temp_sr[from_moment] = np.nan
-                if until_moment not in temp_sr.index:
-                    temp_sr[until_moment] = np.nan
-                temp_sr = await go(temp_sr.asfreq, "10S")
-                isnan_sr = await go(temp_sr.isna)
-                nan_index = isnan_sr[isnan_sr == 1].index  # type:ignore
-                moment_to_fill_from: datetime = nan_index[0]  # type:ignore
-
-                # request historical aggtrade data
-                aggtrades = {}
-                last_fetched_time = moment_to_fill_from
-                while last_fetched_time < moment_to_fill_from + timedelta(seconds=10):
-                    # intend to fill at least one 10 second candle bar
-                    payload = {
-                        "symbol": symbol,
-                        "startTime": int(last_fetched_time.timestamp() * 1000),
-                        "limit": 1000,
-                    }
+        fetched: dict[str, list[np.ndarray]] = {s: [] for s in target_symbols}
+        fill_ranges: dict[str, list[tuple[datetime, datetime]]] = {
+            s: [] for s in target_symbols
+        }
+        semaphore = asyncio.Semaphore(4)
+
+        async def fetch_segment(
+            symbol: str, segment_start: datetime, segment_end: datetime
+        ):
+            nonlocal request_count
+            segment_end_timestamp = int(segment_end.timestamp() * 1000)
+            payload = {
+                "symbol": symbol,
+                "startTime": int(segment_start.timestamp() * 1000),
+                "limit": 1000,
+            }
+            fetched_until = segment_start
+            async with semaphore:
+                while request_count < request_limit:
+                    request_count += 1
                     response = await self.api_requester.binance(
                         http_method="GET",
                         path="/fapi/v1/aggTrades",
                         payload=payload,
                     )
-                    request_count += 1
                     if len(response) == 0:
-                        self.markets_gone.add(symbol)
+                        if "startTime" in payload:
+                            # there were no trades since this moment
+                            self.markets_gone.add(symbol)
+                        else:
+                            fetched_until = segment_end
                         break
-                    for aggtrade in response:
-                        aggtrade_id = int(aggtrade["a"])
-                        aggtrades[aggtrade_id] = aggtrade
-                    last_fetched_id = max(aggtrades.keys())
+                    rows = np.array(
+                        [(int(a["T"]), float(a["p"]), float(a["q"])) for a in response],
+                        dtype=np.float64,
+                    )
+                    fetched[symbol].append(rows[rows[:, 0] < segment_end_timestamp])
+                    last_aggtrade = response[-1]
                     last_fetched_time = datetime.fromtimestamp(
-                        aggtrades[last_fetched_id]["T"] / 1000, tz=timezone.utc
+                        int(last_aggtrade["T"]) / 1000, tz=timezone.utc
                     )
+                    if len(response) < 1000 or last_fetched_time >= segment_end:
+                        fetched_until = segment_end
+                        break
+                    # the last block might not be complete yet
+                    fetched_until = max(to_moment(last_fetched_time), segment_start)
+                    payload = {
+                        "symbol": symbol,
+                        "fromId": int(last_aggtrade["a"]) + 1,
+                        "limit": 1000,
+                    }
+            if fetched_until > segment_start:
+                fill_ranges[symbol].append((segment_start, fetched_until))
 
-                recent_candle_data = await go(
-                    fill_holes_with_aggtrades,
-                    symbol,
-                    recent_candle_data,
-                    aggtrades,
-                    moment_to_fill_from,
-                    last_fetched_time,
-                )
-                did_fill = True
+        await asyncio.gather(*(fetch_segment(*segment) for segment in segments))
 
-        if not did_fill:
+        if not any(fill_ranges.values()):
             return
 
+        aggtrades = {
+            symbol: np.concatenate(chunks)
+            for symbol, chunks in fetched.items()
+            if len(chunks) > 0
+        }
+        recent_candle_data = await go(
+            fill_holes_with_aggtrades,
+            recent_candle_data,
+            aggtrades,
+            fill_ranges,
+        )
+
         # combine
         async with self.candle_data.write_lock as cell:
             original_candle_data = cell.data[cell.data.index < split_moment]
@@ -333,7 +437,7 @@ class Collector:
             temp_df = cell.data[cell.data.index >= split_moment]
             recent_candle_data = recent_candle_data.combine_first(temp_df)
             if not recent_candle_data.index.is_monotonic_increasing:
-                recent_candle_data = await go(
+                recent_candle_data = await go_fit(
                     sort_data_frame,
                     recent_candle_data,
                 )
@@ -341,10 +445,9 @@ class Collector:
             cell.data = candle_data
 
     async def display_status_information(self):
-        async with self.candle_data.read_lock as cell:
-            if len(cell.data) == 0:
-                # when the app is executed for the first time
-                return
+        if len(self.candle_data.snapshot().data) == 0:
+            # when the app is executed for the first time
+            return
 
         if len(self.price_precisions) == 0:
             # right after the app execution
@@ -369,15 +472,9 @@ class Collector:
         # bottom information
         if len(self.markets_gone) == 0:
             cumulation_rate = await self.check_candle_data_cumulation_rate()
-            first_written_time = None
-            last_written_time = None
-            realtime_data = self.realtime_data
-            if len(realtime_data) > 0:
-                if first_written_time is None:
-                    first_record = realtime_data[0]
-                    first_written_time = first_record.timestamp
-                last_record = realtime_data[-1]
-                last_written_time = last_record.timestamp
+            first_written_time = self.book_tickers.get_first_timestamp()
+            last_written_time = self.book_tickers.get_last_timestamp()
+            if first_written_time is not None and last_written_time is not None:
                 written_seconds = (last_written_time - first_written_time) / 10**3
             else:
                 written_seconds = 0.0
@@ -410,15 +507,15 @@ class Collector:
         # Pandas dataframe slicing uses inclusive end.
         count_end_moment -= timedelta(seconds=1)
 
-        async with self.candle_data.read_lock as cell:
-            cumulated = len(cell.data[count_start_moment:count_end_moment].dropna())
+        candle_data = self.candle_data.snapshot().data
+        cumulated = len(candle_data[count_start_moment:count_end_moment].dropna())
         needed_moments = 6 * 60 * 24
         cumulation_rate = cumulated / needed_moments
 
         return cumulation_rate
 
     async def open_binance_data_page(self):
-        await go(webbrowser.open, "https://www.binance.com/en/landing/data")
+        await go_io(webbrowser.open, "https://www.binance.com/en/landing/data")
 
     async def download_fill_candle_data(self):
         # ■■■■■ ask filling type ■■■■■
@@ -503,6 +600,24 @@ class Collector:
                     ),
                 )
 
+        # ■■■■■ skip periods that are already stored ■■■■■
+
+        backfill_progress = BackfillProgress(self.workerpath / "backfill_progress.json")
+        await backfill_progress.load()
+        daily_candle_counts = await self.get_daily_candle_counts(
+            {p.year for p in download_presets}
+        )
+        download_presets = [
+            p
+            for p in download_presets
+            if p not in backfill_progress.done_presets
+            and not is_period_covered(daily_candle_counts, p)
+        ]
+
+        if len(download_presets) == 0:
+            logger.info("All candle data in the chosen range is already stored")
+            return
+
         random.shuffle(download_presets)
 
         total_steps = len(download_presets)
@@ -535,6 +650,13 @@ class Collector:
 
         # ■■■■■ calculate in parellel ■■■■■
 
+        # Archives are kept in the cache,
+        # so filling the same range again doesn't need the network.
+        archive_downloader = ArchiveDownloader(
+            self.workerpath / "archive_cache",
+            self.collector_settings.download_concurrency,
+        )
+
         # Gather information about years.
         current_year = datetime.now(timezone.utc).year
         all_years: set[int] = {t.year for t in download_presets}
@@ -547,50 +669,63 @@ class Collector:
         for download_preset in download_presets:
             classified_download_presets[download_preset.year].append(download_preset)
 
+        candle_columns = self.candle_data.snapshot().data.columns
+
         for preset_year, download_presets in classified_download_presets.items():
-            # Make an empty dataframe, but of same types with that of candle data.
-            async with self.candle_data.read_lock as cell:
-                combined_df = RWLock(cell.data.iloc[0:0].copy())
+            # Blocks are only collected while downloading,
+            # and they are assembled into one dataframe at the end.
+            candle_blocks: list[pd.DataFrame] = []
+            finished_presets: list[DownloadPreset] = []
 
             async def download_fill(download_preset: DownloadPreset) -> None:
                 nonlocal done_steps
-                nonlocal combined_df
 
                 if find_stop_flag("download_fill_candle_data", task_id):
                     return
 
-                returned = await go(download_aggtrade_data, download_preset)
-                if returned is not None:
-                    new_df = returned
-                    async with combined_df.write_lock as cell:
-                        new = await go(combine_candle_data, new_df, cell.data)
-                        cell.data = new
+                url = get_aggtrade_archive_url(download_preset)
+                archive_path = await archive_downloader.download(url)
+                if archive_path is not None:
+                    symbol = download_preset.symbol
+                    new_df = await go(read_aggtrade_archive, symbol, archive_path)
+                    candle_blocks.append(new_df)
+                    # Missing archives might be published later
+                    finished_presets.append(download_preset)
 
                 done_steps += 1
 
             tasks = [asyncio.create_task(download_fill(p)) for p in download_presets]
             await asyncio.wait(tasks)
 
+            year_df = await go(assemble_candle_data, candle_blocks, candle_columns)
+            candle_blocks.clear()
+
             if preset_year < current_year:
                 # For data of previous years,
                 # save them in the disk.
-                async with combined_df.read_lock as cell:
-                    await go(
-                        cell.data.to_pickle,
-                        self.workerpath / f"candle_data_{preset_year}.pickle",
-                    )
+                await go(
+                    merge_candle_data_file,
+                    year_df,
+                    self.workerpath / f"candle_data_{preset_year}.pickle",
+                )
             else:
                 # For data of current year, pass it to this collector worker
                 # and store them in the memory.
-                async with combined_df.read_lock as cell:
-                    async with self.candle_data.write_lock as cell_worker:
-                        cell_worker.data = await go(
-                            combine_candle_data,
-                            cell.data,
-                            cell_worker.data,
-                        )
+                async with self.candle_data.write_lock as cell_worker:
+                    cell_worker.data = await go(
+                        combine_candle_data,
+                        year_df,
+                        cell_worker.data,
+                    )
                 await self.save_candle_data()
 
+            # Only presets whose data is saved are remembered.
+            await backfill_progress.mark_done(finished_presets)
+
+        # Progress is only kept to resume a stopped backfill.
+        if not find_stop_flag("download_fill_candle_data", task_id):
+            await backfill_progress.clear()
+
         # ■■■■■ add to log ■■■■■
 
         text = "Filled the candle data with the history data downloaded from Binance"
@@ -602,61 +737,56 @@ class Collector:
         asyncio.create_task(team.simulator.display_lines())
         asyncio.create_task(team.simulator.display_available_years())
 
-    async def add_book_tickers(self, received: dict):
+    async def get_daily_candle_counts(self, years: set[int]) -> pd.DataFrame:
+        current_year = datetime.now(timezone.utc).year
+        counts_list: list[pd.DataFrame] = []
+        for year in sorted(years):
+            if year == current_year:
+                candle_data = self.candle_data.snapshot().data
+                counts = await go(count_daily_candles, candle_data)
+            else:
+                filepath = self.workerpath / f"candle_data_{year}.pickle"
+                if not await aiofiles.os.path.isfile(filepath):
+                    continue
+                counts = await go(read_daily_candle_counts, filepath)
+            counts_list.append(counts)
+
+        if len(counts_list) == 0:
+            return pd.DataFrame()
+        return pd.concat(counts_list)
+
+    async def add_book_tickers(self, received: BookTicker):
         start_time = time.perf_counter()
-        symbol = received["s"]
-        best_bid = float(received["b"])
-        best_ask = float(received["a"])
-        event_time = received["E"]  # In milliseconds
-
-        book_ticker = BookTicker(
-            timestamp=event_time,
-            symbol=symbol,
-            best_bid_price=best_bid,
-            best_ask_price=best_ask,
+        self.book_tickers.append(
+            received.timestamp,
+            received.symbol,
+            received.best_bid_price,
+            received.best_ask_price,
         )
-        self.realtime_data.append(book_ticker)
-
         duration = time.perf_counter() - start_time
         add_task_duration("add_book_tickers", duration)
 
-    async def add_mark_price(self, received: list):
+    async def add_mark_price(self, received: list[MarkPrice]):
+        # Only target symbols are parsed from the stream.
         start_time = time.perf_counter()
-        target_symbols = self.window.data_settings.target_symbols
-        event_time = received[0]["E"]  # In milliseconds
-        for about_mark_price in received:
-            symbol = about_mark_price["s"]
-            if symbol in target_symbols:
-                mark_price = float(about_mark_price["p"])
-                mark_price = MarkPrice(
-                    timestamp=event_time,
-                    symbol=symbol,
-                    mark_price=mark_price,
-                )
-                self.realtime_data.append(mark_price)
+        for mark_price in received:
+            self.mark_prices.append(
+                mark_price.timestamp,
+                mark_price.symbol,
+                mark_price.mark_price,
+            )
         duration = time.perf_counter() - start_time
         add_task_duration("add_mark_price", duration)
 
-    async def add_aggregate_trades(self, received: dict):
+    async def add_aggregate_trades(self, received: AggregateTrade):
         start_time = time.perf_counter()
-        symbol = received["s"]
-        price = float(received["p"])
-        volume = float(received["q"])
-        trade_time = received["T"]  # In milliseconds
-
-        aggregate_trade = AggregateTrade(
-            timestamp=trade_time,
-            symbol=symbol,
-            price=price,
-            volume=volume,
-        )
-        self.aggregate_trades.append(aggregate_trade)
-
+        self.aggregate_trades.append(received)
         duration = time.perf_counter() - start_time
         add_task_duration("add_aggregate_trades", duration)
 
     async def clear_aggregate_trades(self):
-        self.realtime_data.clear()
+        self.book_tickers.clear()
+        self.mark_prices.clear()
 
     async def add_candle_data(self):
         start_time = time.perf_counter()
@@ -664,68 +794,30 @@ class Collector:
         # Prepare basic infos.
         current_moment = to_moment(datetime.now(timezone.utc))
         before_moment = current_moment - timedelta(seconds=10.0)
-        collect_from = int(before_moment.timestamp()) * 1000
-        collect_to = int(current_moment.timestamp()) * 1000
-        aggregate_trades = self.aggregate_trades
 
-        # Ensure that the data have been watched for long enough.
-        first_received_index = aggregate_trades[0].timestamp
-        if collect_from <= first_received_index:
-            return
-
-        # Collect trades that should be included in the candle.
-        collected_aggregate_trades: list[AggregateTrade] = []
-        for aggregate_trade in reversed(aggregate_trades):
-            if aggregate_trade.timestamp < collect_from - 1000:
-                # Go additional 1000 millliseconds backward.
-                break
-            collected_aggregate_trades.append(aggregate_trade)
-        if len(collected_aggregate_trades) == 0:
+        candle = make_candle_values(
+            self.aggregate_trades,
+            self.window.data_settings.target_symbols,
+            self.candle_data.snapshot().data,
+            before_moment,
+        )
+        if candle is None:
             return
-        collected_aggregate_trades.reverse()  # Sort by time
-        collected_aggregate_trades = [
-            t
-            for t in collected_aggregate_trades
-            if collect_from < t.timestamp < collect_to
-        ]
-
-        new_values = {}
-        for symbol in self.window.data_settings.target_symbols:
-            symbol_aggregate_trades = [
-                t for t in collected_aggregate_trades if t.symbol == symbol
-            ]
-            self.aggtrade_candle_sizes[symbol] = len(symbol_aggregate_trades)
-
-            if len(symbol_aggregate_trades) > 0:
-                open_price = symbol_aggregate_trades[0].price
-                high_price = max([t.price for t in symbol_aggregate_trades])
-                low_price = min([t.price for t in symbol_aggregate_trades])
-                close_price = symbol_aggregate_trades[-1].price
-                sum_volume = sum([t.volume for t in symbol_aggregate_trades])
-            else:
-                async with self.candle_data.read_lock as cell:
-                    inspect_sr = cell.data.iloc[-60:][(symbol, "Close")].copy()
-                inspect_sr = inspect_sr.dropna()
-                if len(inspect_sr) == 0:
-                    return
-                last_price = inspect_sr.tolist()[-1]
-                open_price = last_price
-                high_price = last_price
-                low_price = last_price
-                close_price = last_price
-                sum_volume = 0.0
-
-            new_values[(symbol, "Open")] = open_price
-            new_values[(symbol, "High")] = high_price
-            new_values[(symbol, "Low")] = low_price
-            new_values[(symbol, "Close")] = close_price
-            new_values[(symbol, "Volume")] = sum_volume
+        new_values, candle_sizes = candle
+        self.aggtrade_candle_sizes.update(candle_sizes)
 
         async with self.candle_data.write_lock as cell:
-            for column_name, new_data_value in new_values.items():
-                cell.data.loc[before_moment, column_name] = new_data_value
+            cell.data = self.candle_grid.add_row(cell.data, before_moment, new_values)
             if not cell.data.index.is_monotonic_increasing:
-                cell.data = await go(sort_data_frame, cell.data)
+                cell.data = await go_fit(sort_data_frame, cell.data)
+
+        snapshot = self.candle_data.snapshot()
+        candle_closed = CandleClosed(
+            moment=before_moment,
+            row=snapshot.data.loc[before_moment],
+            version=snapshot.version,
+        )
+        self.candle_notifier.publish(candle_closed)
 
         duration = time.perf_counter() - start_time
         add_task_duration("add_candle_data", duration)
@@ -749,5 +841,5 @@ class Collector:
 
     async def read_saved_candle_data(self, year: int) -> pd.DataFrame:
         filepath = self.workerpath / f"candle_data_{year}.pickle"
-        candle_data: pd.DataFrame = await go(pd.read_pickle, filepath)
+        candle_data: pd.DataFrame = await go_io(pd.read_pickle, filepath)
         return candle_data
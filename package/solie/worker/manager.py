@@ -1,7 +1,6 @@
 import asyncio
 import logging
 import os
-import statistics
 import webbrowser
 from collections import deque
 from datetime import datetime, timedelta, timezone
@@ -10,14 +9,30 @@ import aiofiles
 import aiofiles.os
 import time_machine
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-
-from solie.common import PROCESS_COUNT, go, outsource
+from PySide6 import QtWidgets
+
+from solie.common import (
+    BULK_PROCESS_COUNT,
+    IO_THREAD_COUNT,
+    LIVE_PROCESS_COUNT,
+    STAGE_BACKGROUND,
+    get_cycle_scheduler,
+    get_loop_monitor,
+    get_metric_registry,
+    get_span_store,
+    go_io,
+    outsource,
+)
 from solie.utility import (
     BOARD_LOCK_OPTIONS,
     ApiRequester,
     ManagementSettings,
-    get_task_duration,
+    ReplayHarness,
+    get_exchange_info_cache,
+    get_lock_stats,
     internet_connected,
+    read_recording,
+    record_streams,
     save_datapath,
 )
 from solie.widget import ask
@@ -48,6 +63,11 @@ class Manager:
         }
         self.binance_limits = {}
 
+        # texts are only set when they change
+        self.label_texts: dict[QtWidgets.QLabel, str] = {}
+        # metric texts are rebuilt only when their summaries change
+        self.metric_texts: dict[str, tuple[int, str]] = {}
+
         self.management_settings = ManagementSettings()
 
         time_traveller = time_machine.travel(datetime.now(timezone.utc))
@@ -56,20 +76,24 @@ class Manager:
 
         # ■■■■■ repetitive schedules ■■■■■
 
-        self.scheduler.add_job(
+        cycle_scheduler = get_cycle_scheduler()
+        cycle_scheduler.add_job(
             self.lock_board,
-            trigger="cron",
-            second="*",
+            period=1,
+            stage=STAGE_BACKGROUND,
+            deadline=0.9,
         )
-        self.scheduler.add_job(
+        cycle_scheduler.add_job(
             self.display_system_status,
-            trigger="cron",
-            second="*",
+            period=1,
+            stage=STAGE_BACKGROUND,
+            deadline=0.9,
         )
-        self.scheduler.add_job(
+        cycle_scheduler.add_job(
             self.check_online_status,
-            trigger="cron",
-            second="*",
+            period=1,
+            stage=STAGE_BACKGROUND,
+            deadline=0.9,
         )
         self.scheduler.add_job(
             self.correct_time,
@@ -132,13 +156,26 @@ class Manager:
             await file.write(self.management_settings.to_json(indent=2))
 
     async def open_datapath(self):
-        await go(os.startfile, self.window.datapath)
+        await go_io(os.startfile, self.window.datapath)
 
     async def deselect_log_output(self):
         self.window.listWidget.clearSelection()
 
+    def set_label_text(self, label: QtWidgets.QLabel, text: str):
+        # setting the same text still makes the label lay out again
+        if self.label_texts.get(label) == text:
+            return
+        self.label_texts[label] = text
+        label.setText(text)
+
     async def display_internal_status(self):
         while True:
+            await asyncio.sleep(0.1)
+
+            # labels are only seen when their tab is open
+            if not self.window.tab_7.isVisible():
+                continue
+
             texts = []
             all_tasks = asyncio.all_tasks()
             tasks_not_done = 0
@@ -152,15 +189,42 @@ class Manager:
                 list_text = "\n".join(texts)
             else:
                 list_text = "\n".join(texts[:max_tasks_shown]) + "\n..."
-            self.window.label_12.setText(f"{tasks_not_done} total\n\n{list_text}")
-
-            self.window.label_32.setText(f"Process count: {PROCESS_COUNT}")
+            text = f"{tasks_not_done} total\n\n{list_text}"
+            loop_monitor = get_loop_monitor()
+            lag_summary = loop_monitor.summarize_lags()
+            if len(lag_summary) > 0:
+                text += "\n\nLoop lag"
+                text += f"\nP50 {lag_summary['p50']:.6f}s"
+                text += f"\nP99 {lag_summary['p99']:.6f}s"
+                text += f"\nMaximum {lag_summary['max']:.6f}s"
+                for bucket_label, lag_count in loop_monitor.get_lag_histogram():
+                    text += f"\n{bucket_label} {lag_count}"
+            offenders = loop_monitor.get_worst_offenders(4)
+            if len(offenders) > 0:
+                text += "\n\nSlow callbacks"
+            for offender in offenders:
+                text += f"\n{offender.task_name} ({offender.count})"
+                text += f"\nTotal {offender.total_duration:.3f}s "
+                text += f"Maximum {offender.max_duration:.3f}s"
+                if len(offender.stack) > 0:
+                    text += f"\n{offender.stack[-1].strip()}"
+            self.set_label_text(self.window.label_12, text)
+
+            text = f"Live processes: {LIVE_PROCESS_COUNT}\n"
+            text += f"Bulk processes: {BULK_PROCESS_COUNT}\n"
+            text += f"I/O threads: {IO_THREAD_COUNT}"
+            self.set_label_text(self.window.label_32, text)
 
             texts = []
             texts.append("Limits")
             for limit_type, limit_value in self.binance_limits.items():
                 text = f"{limit_type}: {limit_value}"
                 texts.append(text)
+            rate_limiter = self.api_requester.rate_limiter
+            texts.append("")
+            texts.append("Rate limiter")
+            texts.append(f"Available weight: {rate_limiter.available_weight:.0f}")
+            texts.append(f"Waiting requests: {rate_limiter.waiting_count}")
             used_rates = self.api_requester.used_rates
             if len(used_rates) > 0:
                 texts.append("")
@@ -170,42 +234,67 @@ class Manager:
                     text = f"{used_type}: {used_tuple[0]}({time_string})"
                     texts.append(text)
             text = "\n".join(texts)
-            self.window.label_35.setText(text)
-
-            texts = []
-            task_durations = get_task_duration()
-            for data_name, deque_data in task_durations.items():
-                if len(deque_data) > 0:
-                    text = data_name
+            self.set_label_text(self.window.label_35, text)
+
+            metric_texts: dict[str, tuple[int, str]] = {}
+            for metric_name, summary in get_metric_registry().get_summaries().items():
+                version = summary.version
+                metric_text = self.metric_texts.get(metric_name)
+                if metric_text is None or metric_text[0] != version:
+                    p50, p95, p99 = summary.get_quantiles((0.5, 0.95, 0.99)).values()
+                    text = f"{metric_name} ({summary.count})"
                     text += "\n"
-                    data_value = sum(deque_data) / len(deque_data)
-                    text += f"Mean {data_value:.6f}s "
-                    data_value = statistics.median(deque_data)
-                    text += f"Median {data_value:.6f}s "
+                    text += f"Mean {summary.mean:.6f}s "
+                    text += f"Maximum {summary.maximum:.6f}s "
                     text += "\n"
-                    data_value = min(deque_data)
-                    text += f"Minimum {data_value:.6f}s "
-                    data_value = max(deque_data)
-                    text += f"Maximum {data_value:.6f}s "
-                    texts.append(text)
+                    text += f"P50 {p50:.6f}s "
+                    text += f"P95 {p95:.6f}s "
+                    text += f"P99 {p99:.6f}s "
+                    metric_text = (version, text)
+                metric_texts[metric_name] = metric_text
+            self.metric_texts = metric_texts
+            texts = [text for _, text in metric_texts.values()]
+            for cycle_job in get_cycle_scheduler().get_jobs():
+                text = f"{cycle_job.name} ({cycle_job.run_count})"
+                text += "\n"
+                text += f"Last {cycle_job.last_duration:.6f}s "
+                text += f"Overlapped {cycle_job.overlap_count} "
+                text += f"Late {cycle_job.late_count} "
+                text += f"Missed {cycle_job.missed_count} "
+                texts.append(text)
             text = "\n\n".join(texts)
-            self.window.label_33.setText(text)
+            self.set_label_text(self.window.label_33, text)
 
             texts = []
-            async with team.collector.candle_data.read_lock as cell:
-                candle_data_len = len(cell.data)
+            candle_data_len = len(team.collector.candle_data.snapshot().data)
             texts.append(f"candle_data {candle_data_len}")
-            texts.append(f"realtime_data {len(team.collector.realtime_data)}")
+            texts.append(f"book_tickers {len(team.collector.book_tickers)}")
+            texts.append(f"mark_prices {len(team.collector.mark_prices)}")
             texts.append(f"aggregate_trades {len(team.collector.aggregate_trades)}")
+            lock_stats = sorted(
+                get_lock_stats().items(),
+                key=lambda item: item[1].total_wait + item[1].total_hold,
+                reverse=True,
+            )
+            for (lock_name, lock_mode, call_site), stats in lock_stats[:8]:
+                text = "\n"
+                text += f"{lock_name} {lock_mode} ({stats.count})"
+                text += "\n"
+                text += f"{call_site}"
+                text += "\n"
+                text += f"Wait total {stats.total_wait:.6f}s "
+                text += f"Maximum {stats.max_wait:.6f}s "
+                text += "\n"
+                text += f"Hold total {stats.total_hold:.6f}s "
+                text += f"Maximum {stats.max_hold:.6f}s "
+                texts.append(text)
             text = "\n".join(texts)
-            self.window.label_34.setText(text)
+            self.set_label_text(self.window.label_34, text)
 
             block_sizes = team.collector.aggtrade_candle_sizes
             lines = (f"{symbol} {count}" for (symbol, count) in block_sizes.items())
             text = "\n".join(lines)
-            self.window.label_36.setText(text)
-
-            await asyncio.sleep(0.1)
+            self.set_label_text(self.window.label_36, text)
 
     async def run_script(self):
         script_text = self.window.plainTextEdit.toPlainText()
@@ -283,19 +372,13 @@ class Manager:
         if not internet_connected():
             return
 
-        payload = {}
-        response = await self.api_requester.binance(
-            http_method="GET",
-            path="/fapi/v1/exchangeInfo",
-            payload=payload,
+        exchange_info_cache = get_exchange_info_cache()
+        exchange_information = await exchange_info_cache.get_exchange_information(
+            self.api_requester
         )
-        for about_rate_limit in response["rateLimits"]:
-            limit_type = about_rate_limit["rateLimitType"]
-            limit_value = about_rate_limit["limit"]
-            interval_unit = about_rate_limit["interval"]
-            interval_value = about_rate_limit["intervalNum"]
-            limit_name = f"{limit_type}({interval_value}{interval_unit})"
-            self.binance_limits[limit_name] = limit_value
+        self.binance_limits = exchange_information.rate_limits
+        weight_limit = exchange_information.request_weight_limit
+        self.api_requester.rate_limiter.update_limit(weight_limit)
 
     async def reset_datapath(self):
         answer = await ask(
@@ -314,7 +397,7 @@ class Manager:
         self.window.close()
 
     async def open_documentation(self):
-        await go(webbrowser.open, "https://solie-docs.cunarist.com")
+        await go_io(webbrowser.open, "https://solie-docs.cunarist.com")
 
     async def lock_board(self):
         lock_board = self.management_settings.lock_board
@@ -339,3 +422,47 @@ class Manager:
         is_enabled = self.window.board.isEnabled()
         if is_enabled:
             self.window.board.setEnabled(False)
+
+    async def record_streams(self, duration: float = 600.0):
+        """
+        Records inbound frames and REST responses to the manager folder.
+        Can be called from the Python script panel.
+        """
+        filename = datetime.now(timezone.utc).strftime("%Y-%m-%d_%H-%M-%S")
+        filepath = self.workerpath / "recordings" / f"{filename}.jsonl"
+        await aiofiles.os.makedirs(filepath.parent, exist_ok=True)
+        await record_streams(filepath, duration)
+
+    async def export_spans(self):
+        """
+        Writes timing spans of the live trading path to the manager folder
+        as JSON lines.
+        Can be called from the Python script panel.
+        """
+        filename = datetime.now(timezone.utc).strftime("%Y-%m-%d_%H-%M-%S")
+        filepath = self.workerpath / "spans" / f"{filename}.jsonl"
+        await aiofiles.os.makedirs(filepath.parent, exist_ok=True)
+        await get_span_store().export(filepath)
+
+    async def replay_streams(self, filename: str, speed: float = 1.0) -> dict:
+        """
+        Runs a recording from the manager folder through a replay harness
+        with the current strategy and returns the order latency summary.
+        The running workers are left as they are.
+        Can be called from the Python script panel.
+        """
+        filepath = self.workerpath / "recordings" / filename
+        lines = await read_recording(filepath)
+
+        transactor = team.transactor
+        strategy_index = transactor.transaction_settings.strategy_index
+        strategy = team.strategist.strategies.all[strategy_index]
+        replay_harness = ReplayHarness(
+            lines,
+            self.window.data_settings.target_symbols,
+            team.collector.candle_data.snapshot().data,
+            strategy.indicators_script,
+            strategy.decision_script,
+            transactor.account_state,
+        )
+        return await replay_harness.run(speed)
@@ -12,11 +12,10 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from PySide6 import QtWidgets
 from scipy.signal import find_peaks
 
-from solie.common import get_sync_manager, go, outsource
+from solie.common import get_sync_manager, go, go_fit, go_io, outsource
 from solie.utility import (
-    BookTicker,
     CalculationInput,
-    MarkPrice,
+    RedrawCoordinator,
     RWLock,
     SimulationSettings,
     SimulationSummary,
@@ -72,6 +71,9 @@ class Simulator:
         self.asset_record = RWLock(create_empty_asset_record())
         self.unrealized_changes = RWLock(create_empty_unrealized_changes())
 
+        # Only the latest request of drawing lines is carried out.
+        self.line_redraw = RedrawCoordinator(self.draw_lines)
+
         # ■■■■■ repetitive schedules ■■■■■
 
         self.scheduler.add_job(
@@ -179,12 +181,9 @@ class Simulator:
         await self.present()
 
     async def display_lines(self, periodic=False, frequent=False):
-        # ■■■■■ start the task ■■■■■
-
-        task_name = "display_simulation_lines"
-
-        task_id = make_stop_flag(task_name)
+        await self.line_redraw.request(periodic=periodic, frequent=frequent)
 
+    async def draw_lines(self, periodic=False, frequent=False):
         # ■■■■■ check drawing mode ■■■■■
 
         should_draw_all_years = self.should_draw_all_years
@@ -194,9 +193,8 @@ class Simulator:
 
         # ■■■■■ check if the data exists ■■■■■
 
-        async with team.collector.candle_data.read_lock as cell:
-            if len(cell.data) == 0:
-                return
+        if len(team.collector.candle_data.snapshot().data) == 0:
+            return
 
         # ■■■■■ wait for the latest data to be added ■■■■■
 
@@ -204,14 +202,11 @@ class Simulator:
         before_moment = current_moment - timedelta(seconds=10)
 
         if periodic:
-            for _ in range(50):
-                if find_stop_flag(task_name, task_id):
-                    return
-                async with team.collector.candle_data.read_lock as cell:
-                    last_index = cell.data.index[-1]
-                    if last_index == before_moment:
-                        break
-                await asyncio.sleep(0.1)
+            try:
+                waiting = team.collector.candle_notifier.wait_for(before_moment)
+                await asyncio.wait_for(waiting, 5.0)
+            except asyncio.TimeoutError:
+                pass
 
         # ■■■■■ get ready for task duration measurement ■■■■■
 
@@ -225,23 +220,18 @@ class Simulator:
 
         # ■■■■■ get light data ■■■■■
 
-        realtime_data = slice_deque(team.collector.realtime_data, 2 ** (10 + 6))
+        mark_prices = team.collector.mark_prices.get_recent(2 ** (10 + 6), symbol)
+        book_tickers = team.collector.book_tickers.get_recent(2 ** (10 + 6), symbol)
         aggregate_trades = slice_deque(team.collector.aggregate_trades, 2 ** (10 + 6))
 
         # ■■■■■ draw light lines ■■■■■
 
         # mark price
-        mark_prices = [
-            d
-            for d in realtime_data
-            if isinstance(d, MarkPrice) and d.symbol == symbol and d.mark_price > 0.0
-        ]
-        data_y = [d.mark_price for d in mark_prices]
-        data_x = [d.timestamp / 10**3 for d in mark_prices]
+        mark_prices = mark_prices[mark_prices["mark_price"] > 0.0]
+        data_y = mark_prices["mark_price"]
+        data_x = mark_prices["timestamp"] / 10**3
         widget = self.window.simulation_lines["mark_price"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # last price and volume
@@ -252,8 +242,6 @@ class Simulator:
         data_y = [t.price for t in filtered]
         widget = self.window.simulation_lines["last_price"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # last trade volume
@@ -270,28 +258,19 @@ class Simulator:
         data_y = np.stack([nan_ar, zero_ar, value_ar], axis=1).reshape(-1)
         widget = self.window.simulation_lines["last_volume"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # book tickers
-        book_tickers = [
-            d for d in realtime_data if isinstance(d, BookTicker) and d.symbol == symbol
-        ]
-        data_x = [d.timestamp / 10**3 for d in book_tickers]
+        data_x = book_tickers["timestamp"] / 10**3
 
-        data_y = [d.best_bid_price for d in book_tickers]
+        data_y = book_tickers["best_bid_price"]
         widget = self.window.simulation_lines["book_tickers"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
-        data_y = [d.best_ask_price for d in book_tickers]
+        data_y = book_tickers["best_ask_price"]
         widget = self.window.simulation_lines["book_tickers"][1]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # entry price
@@ -308,8 +287,6 @@ class Simulator:
             data_y = []
         widget = self.window.simulation_lines["entry_price"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # ■■■■■ record task duration ■■■■■
@@ -340,9 +317,9 @@ class Simulator:
         for year in years:
             more_df = await team.collector.read_saved_candle_data(year)
             divided_datas.append(more_df)
-        candle_data_original: pd.DataFrame = await go(pd.concat, divided_datas)
+        candle_data_original: pd.DataFrame = await go_fit(pd.concat, divided_datas)
         if not candle_data_original.index.is_monotonic_increasing:
-            candle_data_original = await go(sort_data_frame, candle_data_original)
+            candle_data_original = await go_fit(sort_data_frame, candle_data_original)
         async with self.unrealized_changes.read_lock as cell:
             unrealized_changes = cell.data.copy()
         async with self.asset_record.read_lock as cell:
@@ -376,7 +353,7 @@ class Simulator:
                     asset_record.loc[observed_until, "Cause"] = "other"
                     asset_record.loc[observed_until, "Result Asset"] = last_asset
                     if not asset_record.index.is_monotonic_increasing:
-                        asset_record = await go(sort_data_frame, asset_record)
+                        asset_record = await go_fit(sort_data_frame, asset_record)
 
         # add the left end
 
@@ -384,7 +361,7 @@ class Simulator:
             asset_record.loc[slice_from, "Cause"] = "other"
             asset_record.loc[slice_from, "Result Asset"] = before_asset
             if not asset_record.index.is_monotonic_increasing:
-                asset_record = await go(sort_data_frame, asset_record)
+                asset_record = await go_fit(sort_data_frame, asset_record)
 
         # ■■■■■ draw heavy lines ■■■■■
 
@@ -431,8 +408,6 @@ class Simulator:
         ).reshape(-1)
         widget = self.window.simulation_lines["price_rise"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         data_x = np.stack(
@@ -465,8 +440,6 @@ class Simulator:
         ).reshape(-1)
         widget = self.window.simulation_lines["price_fall"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         data_x = np.stack(
@@ -499,8 +472,6 @@ class Simulator:
         ).reshape(-1)
         widget = self.window.simulation_lines["price_stay"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # wobbles
@@ -509,8 +480,6 @@ class Simulator:
         data_y = sr.to_numpy(dtype=np.float32)
         widget = self.window.simulation_lines["wobbles"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         sr = candle_data[(symbol, "Low")]
@@ -518,8 +487,6 @@ class Simulator:
         data_y = sr.to_numpy(dtype=np.float32)
         widget = self.window.simulation_lines["wobbles"][1]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # trade volume
@@ -529,8 +496,6 @@ class Simulator:
         data_y = sr.to_numpy(dtype=np.float32)
         widget = self.window.simulation_lines["volume"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # asset
@@ -538,8 +503,6 @@ class Simulator:
         data_y = asset_record["Result Asset"].to_numpy(dtype=np.float32)
         widget = self.window.simulation_lines["asset"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # asset with unrealized profit
@@ -552,8 +515,6 @@ class Simulator:
         data_y = sr.to_numpy(dtype=np.float32)
         widget = self.window.simulation_lines["asset_with_unrealized_profit"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # buy and sell
@@ -564,8 +525,6 @@ class Simulator:
         data_y = sr.to_numpy(dtype=np.float32)
         widget = self.window.simulation_lines["sell"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         df = asset_record.loc[asset_record["Symbol"] == symbol]
@@ -575,8 +534,6 @@ class Simulator:
         data_y = sr.to_numpy(dtype=np.float32)
         widget = self.window.simulation_lines["buy"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # ■■■■■ record task duration ■■■■■
@@ -615,12 +572,8 @@ class Simulator:
                     color = inside_strings[0]
                 widget.setPen(color)
                 widget.setData(data_x, data_y)
-                if find_stop_flag(task_name, task_id):
-                    return
                 await asyncio.sleep(0)
             else:
-                if find_stop_flag(task_name, task_id):
-                    return
                 widget.clear()
 
         # trade volume indicators
@@ -640,12 +593,8 @@ class Simulator:
                     color = inside_strings[0]
                 widget.setPen(color)
                 widget.setData(data_x, data_y)
-                if find_stop_flag(task_name, task_id):
-                    return
                 await asyncio.sleep(0)
             else:
-                if find_stop_flag(task_name, task_id):
-                    return
                 widget.clear()
 
         # abstract indicators
@@ -665,12 +614,8 @@ class Simulator:
                     color = inside_strings[0]
                 widget.setPen(color)
                 widget.setData(data_x, data_y)
-                if find_stop_flag(task_name, task_id):
-                    return
                 await asyncio.sleep(0)
             else:
-                if find_stop_flag(task_name, task_id):
-                    return
                 widget.clear()
 
         # ■■■■■ set minimum view range ■■■■■
@@ -941,11 +886,11 @@ class Simulator:
         else:
             # when calculating properly
             try:
-                previous_asset_record: pd.DataFrame = await go(
+                previous_asset_record: pd.DataFrame = await go_io(
                     pd.read_pickle,
                     asset_record_path,
                 )
-                previous_unrealized_changes: pd.Series = await go(
+                previous_unrealized_changes: pd.Series = await go_io(
                     pd.read_pickle,
                     unrealized_changes_path,
                 )
@@ -1108,7 +1053,7 @@ class Simulator:
             mask = ~asset_record.index.duplicated()
             asset_record = asset_record[mask]
             if not asset_record.index.is_monotonic_increasing:
-                asset_record = await go(sort_data_frame, asset_record)
+                asset_record = await go_fit(sort_data_frame, asset_record)
 
             unrealized_changes = previous_unrealized_changes
             for chunk_ouput_data in calculation_output_data:
@@ -1118,7 +1063,7 @@ class Simulator:
             mask = ~unrealized_changes.index.duplicated()
             unrealized_changes = unrealized_changes[mask]  # type:ignore
             if not unrealized_changes.index.is_monotonic_increasing:
-                unrealized_changes = await go(sort_series, unrealized_changes)
+                unrealized_changes = await go_fit(sort_series, unrealized_changes)
 
             scribbles = calculation_output_data[-1].chunk_scribbles
             account_state = calculation_output_data[-1].chunk_account_state
@@ -1147,8 +1092,8 @@ class Simulator:
         # ■■■■■ save if properly calculated ■■■■■
 
         if not only_visible and should_calculate:
-            await go(asset_record.to_pickle, asset_record_path)
-            await go(unrealized_changes.to_pickle, unrealized_changes_path)
+            await go_io(asset_record.to_pickle, asset_record_path)
+            await go_io(unrealized_changes.to_pickle, unrealized_changes_path)
             async with aiofiles.open(scribbles_path, "wb") as file:
                 content = pickle.dumps(scribbles)
                 await file.write(content)
@@ -1229,13 +1174,13 @@ class Simulator:
         unrealized_changes = unrealized_changes * leverage
         year_asset_changes: pd.Series = pd.concat(chunk_asset_changes_list)
         if not year_asset_changes.index.is_monotonic_increasing:
-            year_asset_changes = await go(sort_series, year_asset_changes)
+            year_asset_changes = await go_fit(sort_series, year_asset_changes)
 
         if len(asset_record) > 0:
             start_point = asset_record.index[0]
             year_asset_changes[start_point] = float(1)
             if not year_asset_changes.index.is_monotonic_increasing:
-                year_asset_changes = await go(sort_series, year_asset_changes)
+                year_asset_changes = await go_fit(sort_series, year_asset_changes)
         asset_record = asset_record.reindex(year_asset_changes.index)
         asset_record["Result Asset"] = year_asset_changes.cumprod()
 
@@ -1370,10 +1315,10 @@ class Simulator:
 
         try:
             async with self.raw_asset_record.write_lock as cell:
-                new = await go(pd.read_pickle, asset_record_path)
+                new = await go_io(pd.read_pickle, asset_record_path)
                 cell.data = new
             async with self.raw_unrealized_changes.write_lock as cell:
-                new = await go(pd.read_pickle, unrealized_changes_path)
+                new = await go_io(pd.read_pickle, unrealized_changes_path)
                 cell.data = new
             async with aiofiles.open(scribbles_path, "rb") as file:
                 content = await file.read()
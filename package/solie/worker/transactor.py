@@ -15,14 +15,26 @@ import pandas as pd
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from PySide6 import QtWidgets
 
-from solie.common import go, outsource
+from solie.common import (
+    STAGE_ACCOUNT,
+    STAGE_BACKGROUND,
+    STAGE_DECISION,
+    get_cycle_scheduler,
+    get_span_store,
+    go,
+    go_cold,
+    go_fit,
+    go_io,
+    go_live,
+    outsource,
+    warm_up_lane,
+)
 from solie.overlay import LongTextView
 from solie.utility import (
     ApiRequester,
     ApiRequestError,
     ApiStreamer,
-    BookTicker,
-    MarkPrice,
+    RedrawCoordinator,
     RWLock,
     TransactionSettings,
     add_task_duration,
@@ -31,7 +43,9 @@ from solie.utility import (
     create_empty_asset_record,
     create_empty_unrealized_changes,
     decide,
+    find_account_drift,
     find_stop_flag,
+    get_exchange_info_cache,
     internet_connected,
     list_to_dict,
     make_indicators,
@@ -39,7 +53,9 @@ from solie.utility import (
     slice_deque,
     sort_data_frame,
     sort_series,
+    time_first_decision,
     to_moment,
+    warm_up_strategy,
     when_internet_connected,
     when_internet_disconnected,
 )
@@ -67,6 +83,8 @@ class Transactor:
         self.quantity_precisions: dict[str, int] = {}  # Symbol and decimal places
         self.maximum_leverages: dict[str, int] = {}  # Symbol and value
         self.leverages: dict[str, int] = {}  # Symbol and value
+        self.position_amounts: dict[str, float] = {}  # Symbol and value
+        self.is_account_synced = False  # Whether the stream keeps the state
         self.is_key_restrictions_satisfied = True
 
         # ■■■■■ remember and display ■■■■■
@@ -82,8 +100,10 @@ class Transactor:
 
         self.scribbles = {}
         self.transaction_settings = TransactionSettings()
-        self.unrealized_changes = RWLock(create_empty_unrealized_changes())
-        self.asset_record = RWLock(create_empty_asset_record())
+        self.unrealized_changes = RWLock(
+            create_empty_unrealized_changes(), name="unrealized_changes"
+        )
+        self.asset_record = RWLock(create_empty_asset_record(), name="asset_record")
         self.auto_order_record = RWLock(
             pd.DataFrame(
                 columns=[
@@ -91,51 +111,69 @@ class Transactor:
                     "Order ID",
                 ],
                 index=pd.DatetimeIndex([], tz="UTC"),
-            )
+            ),
+            name="auto_order_record",
         )
 
+        # Only the latest request of drawing lines is carried out.
+        self.line_redraw = RedrawCoordinator(self.draw_lines)
+
         # ■■■■■ repetitive schedules ■■■■■
 
-        self.scheduler.add_job(
+        cycle_scheduler = get_cycle_scheduler()
+        cycle_scheduler.add_job(
+            self.cancel_conflicting_orders,
+            period=1,
+            stage=STAGE_ACCOUNT,
+            deadline=0.9,
+        )
+        cycle_scheduler.add_job(
             self.display_status_information,
-            trigger="cron",
-            second="*",
+            period=1,
+            stage=STAGE_BACKGROUND,
+            deadline=0.9,
         )
-        self.scheduler.add_job(
+        cycle_scheduler.add_job(
             self.display_range_information,
-            trigger="cron",
-            second="*",
+            period=1,
+            stage=STAGE_BACKGROUND,
+            deadline=0.9,
         )
-        self.scheduler.add_job(
-            self.cancel_conflicting_orders,
-            trigger="cron",
-            second="*",
+        cycle_scheduler.add_job(
+            self.perform_transaction,
+            period=10,
+            stage=STAGE_DECISION,
+            deadline=9.0,
         )
-        self.scheduler.add_job(
+        cycle_scheduler.add_job(
+            self.watch_binance,
+            period=10,
+            stage=STAGE_ACCOUNT,
+            deadline=9.0,
+        )
+        cycle_scheduler.add_job(
             self.display_lines,
-            trigger="cron",
-            second="*/10",
+            period=10,
+            stage=STAGE_BACKGROUND,
+            deadline=9.0,
             kwargs={"periodic": True, "frequent": True},
         )
-        self.scheduler.add_job(
+        cycle_scheduler.add_job(
             self.pan_view_range,
-            trigger="cron",
-            second="*/10",
+            period=10,
+            stage=STAGE_BACKGROUND,
+            deadline=9.0,
         )
-        self.scheduler.add_job(
-            self.perform_transaction,
-            trigger="cron",
-            second="*/10",
-        )
-        self.scheduler.add_job(
+        cycle_scheduler.add_job(
             self.save_scribbles,
-            trigger="cron",
-            second="*/10",
+            period=10,
+            stage=STAGE_BACKGROUND,
+            deadline=9.0,
         )
         self.scheduler.add_job(
-            self.watch_binance,
+            self.reconcile_account,
             trigger="cron",
-            second="*/10",
+            minute="*/5",
         )
         self.scheduler.add_job(
             self.organize_data,
@@ -248,20 +286,20 @@ class Transactor:
         # unrealized changes
         filepath = self.workerpath / "unrealized_changes.pickle"
         if await aiofiles.os.path.isfile(filepath):
-            sr: pd.Series = await go(pd.read_pickle, filepath)
-            self.unrealized_changes = RWLock(sr)
+            sr: pd.Series = await go_io(pd.read_pickle, filepath)
+            self.unrealized_changes = RWLock(sr, name="unrealized_changes")
 
         # asset record
         filepath = self.workerpath / "asset_record.pickle"
         if await aiofiles.os.path.isfile(filepath):
-            df: pd.DataFrame = await go(pd.read_pickle, filepath)
-            self.asset_record = RWLock(df)
+            df: pd.DataFrame = await go_io(pd.read_pickle, filepath)
+            self.asset_record = RWLock(df, name="asset_record")
 
         # auto order record
         filepath = self.workerpath / "auto_order_record.pickle"
         if await aiofiles.os.path.isfile(filepath):
-            df: pd.DataFrame = await go(pd.read_pickle, filepath)
-            self.auto_order_record = RWLock(df)
+            df: pd.DataFrame = await go_io(pd.read_pickle, filepath)
+            self.auto_order_record = RWLock(df, name="auto_order_record")
 
     async def organize_data(self):
         async with self.unrealized_changes.write_lock as cell:
@@ -269,14 +307,14 @@ class Transactor:
                 unique_index = cell.data.index.drop_duplicates()
                 cell.data = cell.data.reindex(unique_index)
             if not cell.data.index.is_monotonic_increasing:
-                cell.data = await go(sort_series, cell.data)
+                cell.data = await go_fit(sort_series, cell.data)
 
         async with self.auto_order_record.write_lock as cell:
             if not cell.data.index.is_unique:
                 unique_index = cell.data.index.drop_duplicates()
                 cell.data = cell.data.reindex(unique_index)
             if not cell.data.index.is_monotonic_increasing:
-                cell.data = await go(sort_data_frame, cell.data)
+                cell.data = await go_fit(sort_data_frame, cell.data)
             max_length = 2**16
             if len(cell.data) > max_length:
                 cell.data = cell.data.iloc[-max_length:].copy()
@@ -286,26 +324,26 @@ class Transactor:
                 unique_index = cell.data.index.drop_duplicates()
                 cell.data = cell.data.reindex(unique_index)
             if not cell.data.index.is_monotonic_increasing:
-                cell.data = await go(sort_data_frame, cell.data)
+                cell.data = await go_fit(sort_data_frame, cell.data)
 
     async def save_large_data(self):
         async with self.unrealized_changes.read_lock as cell:
             unrealized_changes = cell.data.copy()
-        await go(
+        await go_io(
             unrealized_changes.to_pickle,
             self.workerpath / "unrealized_changes.pickle",
         )
 
         async with self.auto_order_record.read_lock as cell:
             auto_order_record = cell.data.copy()
-        await go(
+        await go_io(
             auto_order_record.to_pickle,
             self.workerpath / "auto_order_record.pickle",
         )
 
         async with self.asset_record.read_lock as cell:
             asset_record = cell.data.copy()
-        await go(
+        await go_io(
             asset_record.to_pickle,
             self.workerpath / "asset_record.pickle",
         )
@@ -362,6 +400,7 @@ class Transactor:
             new_url,
             self.listen_to_account,
         )
+        self.is_account_synced = False
 
     async def listen_to_account(self, received: dict):
         # ■■■■■ default values ■■■■■
@@ -387,17 +426,18 @@ class Transactor:
             asset_token = self.window.data_settings.asset_token
 
             about_assets_keyed = list_to_dict(about_assets, "a")
-            about_asset = about_assets_keyed[asset_token]
-            wallet_balance = float(about_asset["wb"])
-            self.account_state["wallet_balance"] = wallet_balance
-
-            about_positions_keyed = list_to_dict(about_positions, "ps")
-            if "BOTH" in about_positions_keyed:
-                about_position = about_positions_keyed["BOTH"]
+            if asset_token in about_assets_keyed:
+                about_asset = about_assets_keyed[asset_token]
+                wallet_balance = float(about_asset["wb"])
+                self.account_state["wallet_balance"] = wallet_balance
 
-                target_symbols = self.window.data_settings.target_symbols
+            # several symbols can be updated by a single event
+            target_symbols = self.window.data_settings.target_symbols
+            for about_position in about_positions:
+                if about_position["ps"] != "BOTH":
+                    continue
                 if about_position["s"] not in target_symbols:
-                    return
+                    continue
 
                 symbol = str(about_position["s"])
                 amount = float(about_position["pa"])
@@ -416,6 +456,13 @@ class Transactor:
                 self.account_state["positions"][symbol]["direction"] = direction
                 self.account_state["positions"][symbol]["entry_price"] = entry_price
                 self.account_state["positions"][symbol]["update_time"] = event_time
+                self.position_amounts[symbol] = amount
+
+        elif event_type == "ACCOUNT_CONFIG_UPDATE":
+            if "ac" in received:
+                about_config = received["ac"]
+                symbol = str(about_config["s"])
+                self.leverages[symbol] = int(about_config["l"])
 
         elif event_type == "ORDER_TRADE_UPDATE":
             about_update = received["o"]
@@ -577,7 +624,7 @@ class Transactor:
                         else:
                             cell.data.loc[record_time, "Cause"] = "manual_trade"
                     if not cell.data.index.is_monotonic_increasing:
-                        cell.data = await go(sort_data_frame, cell.data)
+                        cell.data = await go_fit(sort_data_frame, cell.data)
 
         # ■■■■■ cancel conflicting orders ■■■■■
 
@@ -585,19 +632,19 @@ class Transactor:
 
     async def open_exchange(self):
         symbol = self.viewing_symbol
-        await go(
+        await go_io(
             webbrowser.open,
             f"https://www.binance.com/en/futures/{symbol}",
         )
 
     async def open_futures_wallet_page(self):
-        await go(
+        await go_io(
             webbrowser.open,
             "https://www.binance.com/en/my/wallet/account/futures",
         )
 
     async def open_api_management_page(self):
-        await go(
+        await go_io(
             webbrowser.open,
             "https://www.binance.com/en/my/settings/api-management",
         )
@@ -616,12 +663,16 @@ class Transactor:
 
         await self.save_transaction_settings()
         self.api_requester.update_keys(binance_api_key, binance_api_secret)
+        # cached information might belong to the previous account
+        get_exchange_info_cache().invalidate()
         await self.update_user_data_stream()
 
     async def update_automation_settings(self):
         # ■■■■■ get information about strategy ■■■■■
 
         strategy_index = self.window.comboBox_2.currentIndex()
+        if strategy_index != self.transaction_settings.strategy_index:
+            asyncio.create_task(self.warm_up_workers())
         self.transaction_settings.strategy_index = strategy_index
 
         asyncio.create_task(self.display_lines())
@@ -632,6 +683,8 @@ class Transactor:
 
         if is_checked:
             self.transaction_settings.should_transact = True
+            # account modes get corrected during reconciliation
+            asyncio.create_task(self.reconcile_account())
         else:
             self.transaction_settings.should_transact = False
 
@@ -749,12 +802,13 @@ class Transactor:
         self.window.comboBox_2.setCurrentIndex(strategy_index)
 
     async def display_lines(self, periodic=False, frequent=False):
+        await self.line_redraw.request(periodic=periodic, frequent=frequent)
+
+    async def draw_lines(self, periodic=False, frequent=False):
         # ■■■■■ start the task ■■■■■
 
         task_name = "display_transaction_lines"
 
-        task_id = make_stop_flag(task_name)
-
         # ■■■■■ check drawing mode ■■■■■
 
         should_draw_frequently = self.should_draw_frequently
@@ -765,9 +819,8 @@ class Transactor:
 
         # ■■■■■ check if the data exists ■■■■■
 
-        async with team.collector.candle_data.read_lock as cell:
-            if len(cell.data) == 0:
-                return
+        if len(team.collector.candle_data.snapshot().data) == 0:
+            return
 
         # ■■■■■ wait for the latest data to be added ■■■■■
 
@@ -775,14 +828,11 @@ class Transactor:
         before_moment = current_moment - timedelta(seconds=10)
 
         if periodic:
-            for _ in range(50):
-                if find_stop_flag(task_name, task_id):
-                    return
-                async with team.collector.candle_data.read_lock as cell:
-                    last_index = cell.data.index[-1]
-                    if last_index == before_moment:
-                        break
-                await asyncio.sleep(0.1)
+            try:
+                waiting = team.collector.candle_notifier.wait_for(before_moment)
+                await asyncio.wait_for(waiting, 5.0)
+            except asyncio.TimeoutError:
+                pass
 
         # ■■■■■ get ready for task duration measurement ■■■■■
 
@@ -796,23 +846,18 @@ class Transactor:
 
         # ■■■■■ get light data ■■■■■
 
-        realtime_data = slice_deque(team.collector.realtime_data, 2 ** (10 + 6))
+        mark_prices = team.collector.mark_prices.get_recent(2 ** (10 + 6), symbol)
+        book_tickers = team.collector.book_tickers.get_recent(2 ** (10 + 6), symbol)
         aggregate_trades = slice_deque(team.collector.aggregate_trades, 2 ** (10 + 6))
 
         # ■■■■■ draw light lines ■■■■■
 
         # mark price
-        mark_prices = [
-            d
-            for d in realtime_data
-            if isinstance(d, MarkPrice) and d.symbol == symbol and d.mark_price > 0.0
-        ]
-        data_y = [d.mark_price for d in mark_prices]
-        data_x = [d.timestamp / 10**3 for d in mark_prices]
+        mark_prices = mark_prices[mark_prices["mark_price"] > 0.0]
+        data_y = mark_prices["mark_price"]
+        data_x = mark_prices["timestamp"] / 10**3
         widget = self.window.transaction_lines["mark_price"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # last price and volume
@@ -823,8 +868,6 @@ class Transactor:
         data_y = [t.price for t in filtered]
         widget = self.window.transaction_lines["last_price"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         index_ar = np.array(timestamps)
@@ -837,28 +880,19 @@ class Transactor:
         data_y = np.stack([nan_ar, zero_ar, value_ar], axis=1).reshape(-1)
         widget = self.window.transaction_lines["last_volume"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # book tickers
-        book_tickers = [
-            d for d in realtime_data if isinstance(d, BookTicker) and d.symbol == symbol
-        ]
-        data_x = [d.timestamp / 10**3 for d in book_tickers]
+        data_x = book_tickers["timestamp"] / 10**3
 
-        data_y = [d.best_bid_price for d in book_tickers]
+        data_y = book_tickers["best_bid_price"]
         widget = self.window.transaction_lines["book_tickers"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
-        data_y = [d.best_ask_price for d in book_tickers]
+        data_y = book_tickers["best_ask_price"]
         widget = self.window.transaction_lines["book_tickers"][1]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # entry price
@@ -875,8 +909,6 @@ class Transactor:
             data_y = []
         widget = self.window.transaction_lines["entry_price"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # ■■■■■ set range of heavy data ■■■■■
@@ -894,8 +926,8 @@ class Transactor:
 
         # ■■■■■ get heavy data ■■■■■
 
-        async with team.collector.candle_data.read_lock as cell:
-            candle_data_original = cell.data[get_from:slice_until][[symbol]].copy()
+        candle_data = team.collector.candle_data.snapshot().data
+        candle_data_original = candle_data[get_from:slice_until][[symbol]].copy()
         async with self.unrealized_changes.read_lock as cell:
             unrealized_changes = cell.data.copy()
         async with self.asset_record.read_lock as cell:
@@ -929,7 +961,7 @@ class Transactor:
                     asset_record.loc[observed_until, "Cause"] = "other"
                     asset_record.loc[observed_until, "Result Asset"] = last_asset
                     if not asset_record.index.is_monotonic_increasing:
-                        asset_record = await go(sort_data_frame, asset_record)
+                        asset_record = await go_fit(sort_data_frame, asset_record)
 
         # add the left end
 
@@ -937,7 +969,7 @@ class Transactor:
             asset_record.loc[slice_from, "Cause"] = "other"
             asset_record.loc[slice_from, "Result Asset"] = before_asset
             if not asset_record.index.is_monotonic_increasing:
-                asset_record = await go(sort_data_frame, asset_record)
+                asset_record = await go_fit(sort_data_frame, asset_record)
 
         # ■■■■■ draw heavy lines ■■■■■
 
@@ -984,8 +1016,6 @@ class Transactor:
         ).reshape(-1)
         widget = self.window.transaction_lines["price_rise"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         data_x = np.stack(
@@ -1018,8 +1048,6 @@ class Transactor:
         ).reshape(-1)
         widget = self.window.transaction_lines["price_fall"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         data_x = np.stack(
@@ -1052,8 +1080,6 @@ class Transactor:
         ).reshape(-1)
         widget = self.window.transaction_lines["price_stay"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # wobbles
@@ -1062,8 +1088,6 @@ class Transactor:
         data_y = sr.to_numpy(dtype=np.float32)
         widget = self.window.transaction_lines["wobbles"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         sr = candle_data[(symbol, "Low")]
@@ -1071,8 +1095,6 @@ class Transactor:
         data_y = sr.to_numpy(dtype=np.float32)
         widget = self.window.transaction_lines["wobbles"][1]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # trade volume
@@ -1082,8 +1104,6 @@ class Transactor:
         data_y = sr.to_numpy(dtype=np.float32)
         widget = self.window.transaction_lines["volume"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # asset
@@ -1091,8 +1111,6 @@ class Transactor:
         data_y = asset_record["Result Asset"].to_numpy(dtype=np.float32)
         widget = self.window.transaction_lines["asset"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # asset with unrealized profit
@@ -1105,8 +1123,6 @@ class Transactor:
         data_y = sr.to_numpy(dtype=np.float32)
         widget = self.window.transaction_lines["asset_with_unrealized_profit"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # buy and sell
@@ -1117,8 +1133,6 @@ class Transactor:
         data_y = sr.to_numpy(dtype=np.float32)
         widget = self.window.transaction_lines["sell"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         df = asset_record.loc[asset_record["Symbol"] == symbol]
@@ -1128,8 +1142,6 @@ class Transactor:
         data_y = sr.to_numpy(dtype=np.float32)
         widget = self.window.transaction_lines["buy"][0]
         widget.setData(data_x, data_y)
-        if find_stop_flag(task_name, task_id):
-            return
         await asyncio.sleep(0)
 
         # ■■■■■ record task duration ■■■■■
@@ -1169,12 +1181,8 @@ class Transactor:
                     color = inside_strings[0]
                 widget.setPen(color)
                 widget.setData(data_x, data_y)
-                if find_stop_flag(task_name, task_id):
-                    return
                 await asyncio.sleep(0)
             else:
-                if find_stop_flag(task_name, task_id):
-                    return
                 widget.clear()
 
         # trade volume indicators
@@ -1194,12 +1202,8 @@ class Transactor:
                     color = inside_strings[0]
                 widget.setPen(color)
                 widget.setData(data_x, data_y)
-                if find_stop_flag(task_name, task_id):
-                    return
                 await asyncio.sleep(0)
             else:
-                if find_stop_flag(task_name, task_id):
-                    return
                 widget.clear()
 
         # abstract indicators
@@ -1219,12 +1223,8 @@ class Transactor:
                     color = inside_strings[0]
                 widget.setPen(color)
                 widget.setData(data_x, data_y)
-                if find_stop_flag(task_name, task_id):
-                    return
                 await asyncio.sleep(0)
             else:
-                if find_stop_flag(task_name, task_id):
-                    return
                 widget.clear()
 
         # ■■■■■ set minimum view range ■■■■■
@@ -1362,25 +1362,36 @@ class Transactor:
 
         # ■■■■■ Check if the data exists ■■■■■
 
-        async with team.collector.candle_data.read_lock as cell:
-            if len(cell.data) == 0:
-                # case when the app is executed for the first time
-                return
+        if len(team.collector.candle_data.snapshot().data) == 0:
+            # case when the app is executed for the first time
+            return
 
         # ■■■■■ Wait for the latest data to be added ■■■■■
 
-        for _ in range(50):
-            async with team.collector.candle_data.read_lock as cell:
-                last_index = cell.data.index[-1]
-                if last_index == before_moment:
-                    break
-            await asyncio.sleep(0.1)
+        span_store = get_span_store()
+        cycle = int(current_moment.timestamp())
+
+        with span_store.measure("wait_for_candle", cycle=cycle):
+            try:
+                waiting = team.collector.candle_notifier.wait_for(before_moment)
+                await asyncio.wait_for(waiting, 5.0)
+            except asyncio.TimeoutError:
+                pass
+
+        # delay from the candle close to its row being available
+        candle_delay = datetime.now(timezone.utc) - current_moment
+        span_store.add(
+            "candle_delay",
+            current_moment.timestamp(),
+            candle_delay.total_seconds(),
+            cycle=cycle,
+        )
 
         # ■■■■■ Get the candle data ■■■■■
 
-        slice_from = datetime.now(timezone.utc) - timedelta(days=28)
-        async with team.collector.candle_data.read_lock as cell:
-            candle_data = cell.data[slice_from:].copy()
+        with span_store.measure("slice", cycle=cycle):
+            slice_from = datetime.now(timezone.utc) - timedelta(days=28)
+            candle_data = team.collector.candle_data.snapshot().data[slice_from:].copy()
 
         # ■■■■■ Make decision ■■■■■
 
@@ -1391,18 +1402,20 @@ class Transactor:
 
         indicators_script = strategy.indicators_script
 
-        # Split the candle data by symbol before calculation to reduct UI lags
-        coroutines = []
-        for symbol in target_symbols:
-            coroutines.append(
-                go(
+        async def job_indicators(symbol: str) -> pd.DataFrame:
+            with span_store.measure("indicators", cycle=cycle, symbol=symbol):
+                return await go_live(
                     make_indicators,
                     target_symbols=[symbol],
                     candle_data=candle_data[[symbol]],
                     indicators_script=indicators_script,
                     only_last_index=True,
                 )
-            )
+
+        # Split the candle data by symbol before calculation to reduct UI lags
+        coroutines = []
+        for symbol in target_symbols:
+            coroutines.append(job_indicators(symbol))
             await asyncio.sleep(0)
         symbol_indicators = await asyncio.gather(*coroutines)
         indicators = pd.concat(symbol_indicators, axis="columns")
@@ -1411,16 +1424,17 @@ class Transactor:
         current_indicators: np.record = indicators.to_records()[-1]
         decision_script = strategy.decision_script
 
-        decision, scribbles = await go(
-            decide,
-            target_symbols=target_symbols,
-            current_moment=current_moment,
-            current_candle_data=current_candle_data,
-            current_indicators=current_indicators,
-            account_state=self.account_state,
-            scribbles=self.scribbles,
-            decision_script=decision_script,
-        )
+        with span_store.measure("decide", cycle=cycle):
+            decision, scribbles = await go_live(
+                decide,
+                target_symbols=target_symbols,
+                current_moment=current_moment,
+                current_candle_data=current_candle_data,
+                current_indicators=current_indicators,
+                account_state=self.account_state,
+                scribbles=self.scribbles,
+                decision_script=decision_script,
+            )
         self.scribbles = scribbles
 
         # ■■■■■ Record task duration ■■■■■
@@ -1431,7 +1445,74 @@ class Transactor:
 
         # ■■■■■ Place order ■■■■■
 
-        await self.place_orders(decision)
+        with span_store.measure("place_orders", cycle=cycle):
+            await self.place_orders(decision)
+
+        # from the candle close to every order being acknowledged
+        cycle_duration = datetime.now(timezone.utc) - current_moment
+        span_store.add(
+            "cycle",
+            current_moment.timestamp(),
+            cycle_duration.total_seconds(),
+            cycle=cycle,
+        )
+
+    async def warm_up_workers(self):
+        """
+        Prepares every live worker process with the current strategy,
+        so that the next transaction cycle doesn't wait for imports or compilation.
+        """
+        strategy_index = self.transaction_settings.strategy_index
+        strategy = team.strategist.strategies.all[strategy_index]
+        await warm_up_lane(
+            "live",
+            warm_up_strategy,
+            strategy.indicators_script,
+            strategy.decision_script,
+        )
+
+    async def benchmark_first_decision(self) -> dict[str, float]:
+        """
+        Measures the first decision in a cold process
+        and in a warmed-up live worker, including transfer and startup.
+        Can be called from the Python script panel.
+        """
+        target_symbols = self.window.data_settings.target_symbols
+        strategy_index = self.transaction_settings.strategy_index
+        strategy = team.strategist.strategies.all[strategy_index]
+
+        slice_from = datetime.now(timezone.utc) - timedelta(days=28)
+        candle_data = team.collector.candle_data.snapshot().data[slice_from:].copy()
+        if len(candle_data) == 0:
+            return {}
+
+        arguments = {
+            "target_symbols": target_symbols,
+            "candle_data": candle_data,
+            "indicators_script": strategy.indicators_script,
+            "decision_script": strategy.decision_script,
+            "account_state": self.account_state,
+            "scribbles": self.scribbles.copy(),
+        }
+
+        start_time = time.perf_counter()
+        await go_cold(time_first_decision, **arguments)
+        cold_duration = time.perf_counter() - start_time
+
+        start_time = time.perf_counter()
+        await go_live(time_first_decision, **arguments)
+        warm_duration = time.perf_counter() - start_time
+
+        text = "First decision latency\n"
+        text += f"Cold process {cold_duration:.3f}s\n"
+        text += f"Warm live worker {warm_duration:.3f}s"
+        logger.info(text)
+
+        return {"cold": cold_duration, "warm": warm_duration}
+
+    async def prepare_live_workers(self):
+        await self.warm_up_workers()
+        await self.benchmark_first_decision()
 
     async def display_day_range(self):
         range_start = (datetime.now(timezone.utc) - timedelta(hours=24)).timestamp()
@@ -1484,11 +1565,11 @@ class Transactor:
         await self.save_transaction_settings()
 
     async def watch_binance(self):
-        # ■■■■■ Basic data ■■■■■
-
-        target_symbols = self.window.data_settings.target_symbols
-        asset_token = self.window.data_settings.asset_token
-
+        """
+        Keeps the account state of each cycle ready without account requests,
+        because the user data stream delivers every change as it happens.
+        The state is rebuilt from REST only when the stream can't be trusted.
+        """
         # ■■■■■ Check internet connection ■■■■■
 
         if not internet_connected():
@@ -1499,62 +1580,146 @@ class Transactor:
         current_moment = to_moment(datetime.now(timezone.utc))
         before_moment = current_moment - timedelta(seconds=10)
 
-        # ■■■■■ Request exchange information ■■■■■
+        # ■■■■■ Get exchange information ■■■■■
 
-        payload = {}
-        response = await self.api_requester.binance(
-            http_method="GET",
-            path="/fapi/v1/exchangeInfo",
-            payload=payload,
+        exchange_info_cache = get_exchange_info_cache()
+        exchange_information = await exchange_info_cache.get_exchange_information(
+            self.api_requester
         )
-        about_exchange = response
+        self.minimum_notionals = exchange_information.minimum_notionals
+        self.maximum_quantities = exchange_information.maximum_quantities
+        self.price_precisions = exchange_information.price_precisions
+        self.quantity_precisions = exchange_information.quantity_precisions
 
-        for about_symbol in about_exchange["symbols"]:
-            symbol = about_symbol["symbol"]
+        # ■■■■■ Get leverage bracket information ■■■■■
 
-            about_filters = about_symbol["filters"]
-            about_filters_keyed = list_to_dict(about_filters, "filterType")
+        try:
+            self.maximum_leverages = await exchange_info_cache.get_maximum_leverages(
+                self.api_requester
+            )
+        except ApiRequestError:
+            # when the key is not ready
+            return
 
-            minimum_notional = float(about_filters_keyed["MIN_NOTIONAL"]["notional"])
-            self.minimum_notionals[symbol] = minimum_notional
+        # ■■■■■ Reconcile when the stream can't be trusted ■■■■■
 
-            maximum_quantity = min(
-                float(about_filters_keyed["LOT_SIZE"]["maxQty"]),
-                float(about_filters_keyed["MARKET_LOT_SIZE"]["maxQty"]),
-            )
-            self.maximum_quantities[symbol] = maximum_quantity
+        user_data_streamer = self.user_data_streamer
+        if user_data_streamer is None or not user_data_streamer.is_connected:
+            # events might be missed while disconnected
+            self.is_account_synced = False
 
-            ticksize = float(about_filters_keyed["PRICE_FILTER"]["tickSize"])
-            price_precision = int(math.log10(1 / ticksize))
-            self.price_precisions[symbol] = price_precision
+        if not self.is_account_synced:
+            is_reconciled = await self.reconcile_account()
+            if not is_reconciled:
+                return
 
-            stepsize = float(about_filters_keyed["LOT_SIZE"]["stepSize"])
-            quantity_precision = int(math.log10(1 / stepsize))
-            self.quantity_precisions[symbol] = quantity_precision
+        # ■■■■■ Update account state ■■■■■
 
-        # ■■■■■ Request leverage bracket information ■■■■■
+        # observed until
+        self.account_state["observed_until"] = current_moment
 
-        try:
-            payload = {
-                "timestamp": int(datetime.now(timezone.utc).timestamp() * 1000),
-            }
-            response = await self.api_requester.binance(
-                http_method="GET",
-                path="/fapi/v1/leverageBracket",
-                payload=payload,
-            )
-            about_brackets = response
+        # ■■■■■ Record unrealized change ■■■■■
 
-            for about_bracket in about_brackets:
-                symbol = about_bracket["symbol"]
-                max_leverage = about_bracket["brackets"][0]["initialLeverage"]
-                self.maximum_leverages[symbol] = max_leverage
-        except ApiRequestError:
-            # when the key is not ready
-            return
+        # unrealized profit is not included in walletBalance
+        wallet_balance = self.account_state["wallet_balance"]
+        if wallet_balance != 0:
+            unrealized_profit = self.get_unrealized_profit()
+            unrealized_change = unrealized_profit / wallet_balance
+        else:
+            unrealized_change = 0
+
+        async with self.unrealized_changes.write_lock as cell:
+            cell.data[before_moment] = unrealized_change
+            if not cell.data.index.is_monotonic_increasing:
+                cell.data = await go_fit(sort_series, cell.data)
+
+        # ■■■■■ Make an asset trace if it's blank ■■■■■
+
+        async with self.asset_record.write_lock as cell:
+            if len(cell.data) == 0:
+                current_time = datetime.now(timezone.utc)
+                cell.data.loc[current_time, "Cause"] = "other"
+                cell.data.loc[current_time, "Result Asset"] = wallet_balance
+
+        # ■■■■■ When the wallet balance changed for no good reason ■■■■■
+
+        async with self.asset_record.read_lock as cell:
+            last_index = cell.data.index[-1]
+            last_asset: float = cell.data.loc[last_index, "Result Asset"]  # type:ignore
+
+        if wallet_balance == 0:
+            pass
+        elif abs(wallet_balance - last_asset) / wallet_balance > 10**-9:
+            # when the difference is bigger than a billionth
+            # referal fee, funding fee, wallet transfer, etc..
+            async with self.asset_record.write_lock as cell:
+                current_time = datetime.now(timezone.utc)
+                cell.data.loc[current_time, "Cause"] = "other"
+                cell.data.loc[current_time, "Result Asset"] = wallet_balance
+                if not cell.data.index.is_monotonic_increasing:
+                    cell.data = await go_fit(sort_data_frame, cell.data)
+        else:
+            # when the difference is small enough to consider as an numeric error
+            async with self.asset_record.write_lock as cell:
+                last_index = cell.data.index[-1]
+                cell.data.loc[last_index, "Result Asset"] = wallet_balance
+
+    def get_unrealized_profit(self) -> float:
+        """
+        Calculates unrealized profit of target symbols
+        from positions and the latest mark prices.
+        """
+        mark_prices = team.collector.mark_prices
+        target_symbols = self.window.data_settings.target_symbols
+
+        # mark prices of all symbols arrive every second
+        recent_records = mark_prices.get_recent(len(target_symbols) * 8)
+        latest_prices: dict[str, float] = {}
+        for record in recent_records:
+            symbol = mark_prices.symbols[record["symbol"]]
+            latest_prices[symbol] = float(record["mark_price"])
+
+        unrealized_profit = 0.0
+        for symbol in target_symbols:
+            if symbol not in latest_prices:
+                continue
+            amount = self.position_amounts.get(symbol, 0.0)
+            entry_price = self.account_state["positions"][symbol]["entry_price"]
+            unrealized_profit += amount * (latest_prices[symbol] - entry_price)
+
+        return unrealized_profit
+
+    async def reconcile_account(self) -> bool:
+        """
+        Rebuilds the account state from REST responses
+        and reports how far the stream-kept state has drifted.
+        This runs at a low frequency while the user data stream is connected,
+        and on every cycle while it's not.
+        Account modes and API key restrictions are checked here as well.
+
+        Returns whether the account state could be rebuilt.
+        """
+        # ■■■■■ Basic data ■■■■■
+
+        target_symbols = self.window.data_settings.target_symbols
+        asset_token = self.window.data_settings.asset_token
+
+        # ■■■■■ Check internet connection ■■■■■
+
+        if not internet_connected():
+            return False
+
+        # ■■■■■ Moment ■■■■■
+
+        current_moment = to_moment(datetime.now(timezone.utc))
 
         # ■■■■■ Request account information ■■■■■
 
+        user_data_streamer = self.user_data_streamer
+        is_stream_connected = (
+            user_data_streamer is not None and user_data_streamer.is_connected
+        )
+
         try:
             payload = {
                 "timestamp": int(datetime.now(timezone.utc).timestamp() * 1000),
@@ -1567,41 +1732,43 @@ class Transactor:
             about_account = response
         except ApiRequestError:
             # when the key is not ready
-            return
+            return False
 
-        about_open_orders = {}
+        # open orders of all symbols come in a single response
+        payload = {
+            "timestamp": int(datetime.now(timezone.utc).timestamp() * 1000),
+        }
+        response = await self.api_requester.binance(
+            http_method="GET",
+            path="/fapi/v1/openOrders",
+            payload=payload,
+        )
 
-        async def job(symbol):
-            payload = {
-                "symbol": symbol,
-                "timestamp": int(datetime.now(timezone.utc).timestamp() * 1000),
-            }
-            response = await self.api_requester.binance(
-                http_method="GET",
-                path="/fapi/v1/openOrders",
-                payload=payload,
-            )
-            about_open_orders[symbol] = response
+        about_open_orders: dict[str, list[dict]] = {s: [] for s in target_symbols}
+        for about_open_order in response:
+            symbol = about_open_order["symbol"]
+            if symbol in about_open_orders:
+                about_open_orders[symbol].append(about_open_order)
 
-        tasks = [asyncio.create_task(job(s)) for s in target_symbols]
-        await asyncio.wait(tasks)
+        # ■■■■■ Rebuild account state ■■■■■
 
-        # ■■■■■ Update account state ■■■■■
+        account_state = create_empty_account_state(target_symbols)
 
         # observed until
-        self.account_state["observed_until"] = current_moment
+        account_state["observed_until"] = current_moment
 
         # wallet_balance
         about_assets = about_account["assets"]
         about_assets_keyed = list_to_dict(about_assets, "asset")
         about_asset = about_assets_keyed[asset_token]
         wallet_balance = float(about_asset["walletBalance"])
-        self.account_state["wallet_balance"] = wallet_balance
+        account_state["wallet_balance"] = wallet_balance
 
         about_positions = about_account["positions"]
         about_positions_keyed = list_to_dict(about_positions, "symbol")
 
         # positions
+        position_amounts = {}
         for symbol in target_symbols:
             about_position = about_positions_keyed[symbol]
 
@@ -1619,10 +1786,11 @@ class Transactor:
             amount = float(about_position["positionAmt"])
             margin = abs(amount) * entry_price / leverage
 
-            self.account_state["positions"][symbol]["margin"] = margin
-            self.account_state["positions"][symbol]["direction"] = direction
-            self.account_state["positions"][symbol]["entry_price"] = entry_price
-            self.account_state["positions"][symbol]["update_time"] = update_time
+            account_state["positions"][symbol]["margin"] = margin
+            account_state["positions"][symbol]["direction"] = direction
+            account_state["positions"][symbol]["entry_price"] = entry_price
+            account_state["positions"][symbol]["update_time"] = update_time
+            position_amounts[symbol] = amount
 
         # open orders
         open_orders = {}
@@ -1718,7 +1886,22 @@ class Transactor:
                     "left_margin": left_margin,
                 }
 
-        self.account_state["open_orders"] = open_orders
+        account_state["open_orders"] = open_orders
+
+        # ■■■■■ Report drift of the stream-kept state ■■■■■
+
+        if self.is_account_synced:
+            drifts = find_account_drift(self.account_state, account_state)
+            if drifts:
+                text = "Account state drifted from the user data stream\n"
+                text += "\n".join(drifts)
+                logger.warning(text)
+
+        # ■■■■■ Apply account state ■■■■■
+
+        self.account_state = account_state
+        self.position_amounts = position_amounts
+        self.is_account_synced = is_stream_connected
 
         # ■■■■■ Update hidden state ■■■■■
 
@@ -1727,55 +1910,6 @@ class Transactor:
             leverage = int(about_position["leverage"])
             self.leverages[symbol] = leverage
 
-        # ■■■■■ Record unrealized change ■■■■■
-
-        # unrealized profit is not included in walletBalance
-        wallet_balance = float(about_asset["walletBalance"])
-        if wallet_balance != 0:
-            unrealized_profit = float(about_asset["unrealizedProfit"])
-            unrealized_change = unrealized_profit / wallet_balance
-        else:
-            unrealized_change = 0
-
-        async with self.unrealized_changes.write_lock as cell:
-            cell.data[before_moment] = unrealized_change
-            if not cell.data.index.is_monotonic_increasing:
-                cell.data = await go(sort_series, cell.data)
-
-        # ■■■■■ Make an asset trace if it's blank ■■■■■
-
-        async with self.asset_record.write_lock as cell:
-            if len(cell.data) == 0:
-                wallet_balance = float(about_asset["walletBalance"])
-                current_time = datetime.now(timezone.utc)
-                cell.data.loc[current_time, "Cause"] = "other"
-                cell.data.loc[current_time, "Result Asset"] = wallet_balance
-
-        # ■■■■■ When the wallet balance changed for no good reason ■■■■■
-
-        wallet_balance = float(about_asset["walletBalance"])
-
-        async with self.asset_record.read_lock as cell:
-            last_index = cell.data.index[-1]
-            last_asset: float = cell.data.loc[last_index, "Result Asset"]  # type:ignore
-
-        if wallet_balance == 0:
-            pass
-        elif abs(wallet_balance - last_asset) / wallet_balance > 10**-9:
-            # when the difference is bigger than a billionth
-            # referal fee, funding fee, wallet transfer, etc..
-            async with self.asset_record.write_lock as cell:
-                current_time = datetime.now(timezone.utc)
-                cell.data.loc[current_time, "Cause"] = "other"
-                cell.data.loc[current_time, "Result Asset"] = wallet_balance
-                if not cell.data.index.is_monotonic_increasing:
-                    cell.data = await go(sort_data_frame, cell.data)
-        else:
-            # when the difference is small enough to consider as an numeric error
-            async with self.asset_record.write_lock as cell:
-                last_index = cell.data.index[-1]
-                cell.data.loc[last_index, "Result Asset"] = wallet_balance
-
         # ■■■■■ Correct mode of the account market if automation is turned on ■■■■■
 
         if self.transaction_settings.should_transact:
@@ -1888,6 +2022,8 @@ class Transactor:
                 is_satisfied = False
         self.is_key_restrictions_satisfied = is_satisfied
 
+        return True
+
     async def place_orders(self, decision: dict):
         target_symbols = self.window.data_settings.target_symbols
         current_timestamp = to_moment(datetime.now(timezone.utc)).timestamp() * 1000
@@ -1927,29 +2063,101 @@ class Transactor:
                 payload=payload,
             )
 
-        async def job_new_order(payload):
-            response = await self.api_requester.binance(
-                http_method="POST",
-                path="/fapi/v1/order",
-                payload=payload,
-            )
-            order_symbol = response["symbol"]
-            order_id = response["orderId"]
-            timestamp = response["updateTime"] / 1000
-            update_time = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+        async def record_orders(responses: list[dict]):
+            # all acknowledged orders of a request are written at once
+            if not responses:
+                return
             async with self.auto_order_record.write_lock as cell:
-                while update_time in cell.data.index:
-                    update_time += timedelta(milliseconds=1)
-                cell.data.loc[update_time, "Symbol"] = order_symbol
-                cell.data.loc[update_time, "Order ID"] = order_id
+                taken_times = set(cell.data.index)
+                update_times = []
+                for response in responses:
+                    timestamp = response["updateTime"] / 1000
+                    update_time = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+                    while update_time in taken_times:
+                        update_time += timedelta(milliseconds=1)
+                    taken_times.add(update_time)
+                    update_times.append(update_time)
+                new_df = pd.DataFrame(
+                    {
+                        "Symbol": [r["symbol"] for r in responses],
+                        "Order ID": [r["orderId"] for r in responses],
+                    },
+                    index=pd.DatetimeIndex(update_times),
+                )
+                cell.data = pd.concat([cell.data, new_df])
                 if not cell.data.index.is_monotonic_increasing:
-                    cell.data = await go(sort_data_frame, cell.data)
+                    cell.data = await go_fit(sort_data_frame, cell.data)
+
+        span_store = get_span_store()
+
+        async def job_new_orders(orders: list[dict]):
+            symbol = orders[0]["symbol"]
+            if len(orders) == 1:
+                try:
+                    with span_store.measure("order_ack", symbol=symbol, count=1):
+                        response = await self.api_requester.binance(
+                            http_method="POST",
+                            path="/fapi/v1/order",
+                            payload=orders[0],
+                        )
+                except ApiRequestError as error:
+                    # like in a batch, a failed order doesn't stop later stages
+                    logger.warning(str(error))
+                    return
+                await record_orders([response])
+                return
+
+            batch_orders = []
+            for order in orders:
+                batch_order = {}
+                for key, value in order.items():
+                    if key == "timestamp":
+                        continue
+                    if isinstance(value, bool):
+                        value = "true" if value else "false"
+                    batch_order[key] = str(value)
+                batch_orders.append(batch_order)
+            payload = {
+                "timestamp": int(datetime.now(timezone.utc).timestamp() * 1000),
+                "batchOrders": json.dumps(batch_orders, separators=(",", ":")),
+            }
+            try:
+                with span_store.measure("order_ack", symbol=symbol, count=len(orders)):
+                    responses = await self.api_requester.binance(
+                        http_method="POST",
+                        path="/fapi/v1/batchOrders",
+                        payload=payload,
+                    )
+            except ApiRequestError as error:
+                logger.warning(str(error))
+                return
+
+            # each order in a batch succeeds or fails on its own
+            placed_responses = []
+            for response in responses:
+                if "code" in response:
+                    error_code = response["code"]
+                    error_message = response["msg"]
+                    text = f"Binance error code {error_code}\n{error_message}"
+                    logger.warning(text)
+                else:
+                    placed_responses.append(response)
+            await record_orders(placed_responses)
+
+        async def job_stage(orders: list[dict]):
+            # orders in the same stage don't depend on each other
+            batch_size = 5  # Limit of Binance
+            tasks = []
+            for turn in range(0, len(orders), batch_size):
+                batch = orders[turn : turn + batch_size]
+                tasks.append(asyncio.create_task(job_new_orders(batch)))
+            await asyncio.gather(*tasks)
 
-        # ■■■■■ Do cancel orders ■■■■■
+        # ■■■■■ Prepare cancel orders ■■■■■
 
-        # These orders must be executed one after another.
+        # Stages of a symbol must be executed one after another.
         # For example, some `later_orders` expect a position made from `now_orders`
-        cancel_orders = []
+        cancel_orders: dict[str, dict] = {}
 
         for symbol in target_symbols:
             if symbol not in decision:
@@ -1960,15 +2168,11 @@ class Transactor:
                     "timestamp": int(datetime.now(timezone.utc).timestamp() * 1000),
                     "symbol": symbol,
                 }
-                cancel_orders.append(cancel_order)
-
-        if cancel_orders:
-            tasks = [asyncio.create_task(job_cancel_order(o)) for o in cancel_orders]
-            await asyncio.wait(tasks)
+                cancel_orders[symbol] = cancel_order
 
-        # ■■■■■ Do now orders ■■■■■
+        # ■■■■■ Prepare now orders ■■■■■
 
-        now_orders = []
+        now_orders: dict[str, list[dict]] = {s: [] for s in target_symbols}
 
         for symbol in target_symbols:
             if symbol not in decision:
@@ -1995,7 +2199,7 @@ class Transactor:
                         "reduceOnly": True,
                         "newOrderRespType": "RESULT",
                     }
-                    now_orders.append(new_order)
+                    now_orders[symbol].append(new_order)
                 else:
                     text = "Cannot close position when there isn't any"
                     logger.warning(text)
@@ -2012,7 +2216,7 @@ class Transactor:
                     "quantity": ball_ceil(quantity, quantity_precision),
                     "newOrderRespType": "RESULT",
                 }
-                now_orders.append(new_order)
+                now_orders[symbol].append(new_order)
 
             if "now_sell" in decision[symbol]:
                 command = decision[symbol]["now_sell"]
@@ -2026,15 +2230,11 @@ class Transactor:
                     "quantity": ball_ceil(quantity, quantity_precision),
                     "newOrderRespType": "RESULT",
                 }
-                now_orders.append(new_order)
+                now_orders[symbol].append(new_order)
 
-        if now_orders:
-            tasks = [asyncio.create_task(job_new_order(o)) for o in now_orders]
-            await asyncio.wait(tasks)
-
-        # ■■■■■ Do book orders ■■■■■
+        # ■■■■■ Prepare book orders ■■■■■
 
-        book_orders = []
+        book_orders: dict[str, list[dict]] = {s: [] for s in target_symbols}
 
         for symbol in target_symbols:
             if symbol not in decision:
@@ -2060,7 +2260,7 @@ class Transactor:
                     "price": round(boundary, price_precision),
                     "timeInForce": "GTC",
                 }
-                book_orders.append(new_order)
+                book_orders[symbol].append(new_order)
 
             if "book_sell" in decision[symbol]:
                 command = decision[symbol]["book_sell"]
@@ -2076,15 +2276,11 @@ class Transactor:
                     "price": round(boundary, price_precision),
                     "timeInForce": "GTC",
                 }
-                book_orders.append(new_order)
+                book_orders[symbol].append(new_order)
 
-        if book_orders:
-            tasks = [asyncio.create_task(job_new_order(o)) for o in book_orders]
-            await asyncio.wait(tasks)
+        # ■■■■■ Prepare later orders ■■■■■
 
-        # ■■■■■ Do later orders ■■■■■
-
-        later_orders = []
+        later_orders: dict[str, list[dict]] = {s: [] for s in target_symbols}
 
         for symbol in target_symbols:
             if symbol not in decision:
@@ -2131,7 +2327,7 @@ class Transactor:
                         "stopPrice": round(float(command["boundary"]), price_precision),
                         "closePosition": True,
                     }
-                    later_orders.append(new_order)
+                    later_orders[symbol].append(new_order)
                 else:
                     text = "Cannot place `later_up_close` with no open position"
                     logger.warning(text)
@@ -2153,7 +2349,7 @@ class Transactor:
                         "stopPrice": round(float(command["boundary"]), price_precision),
                         "closePosition": True,
                     }
-                    later_orders.append(new_order)
+                    later_orders[symbol].append(new_order)
                 else:
                     text = "Cannot place `later_down_close` with no open position"
                     logger.warning(text)
@@ -2171,7 +2367,7 @@ class Transactor:
                     "quantity": ball_ceil(quantity, quantity_precision),
                     "stopPrice": round(boundary, price_precision),
                 }
-                later_orders.append(new_order)
+                later_orders[symbol].append(new_order)
 
             if "later_down_buy" in decision[symbol]:
                 command = decision[symbol]["later_down_buy"]
@@ -2186,7 +2382,7 @@ class Transactor:
                     "quantity": ball_ceil(quantity, quantity_precision),
                     "stopPrice": round(boundary, price_precision),
                 }
-                later_orders.append(new_order)
+                later_orders[symbol].append(new_order)
 
             if "later_up_sell" in decision[symbol]:
                 command = decision[symbol]["later_up_sell"]
@@ -2201,7 +2397,7 @@ class Transactor:
                     "quantity": ball_ceil(quantity, quantity_precision),
                     "stopPrice": round(boundary, price_precision),
                 }
-                later_orders.append(new_order)
+                later_orders[symbol].append(new_order)
 
             if "later_down_sell" in decision[symbol]:
                 command = decision[symbol]["later_down_sell"]
@@ -2216,10 +2412,26 @@ class Transactor:
                     "quantity": ball_ceil(quantity, quantity_precision),
                     "stopPrice": round(boundary, price_precision),
                 }
-                later_orders.append(new_order)
-
-        if later_orders:
-            tasks = [asyncio.create_task(job_new_order(o)) for o in later_orders]
+                later_orders[symbol].append(new_order)
+
+        # ■■■■■ Place orders ■■■■■
+
+        async def job_symbol(symbol: str):
+            if symbol in cancel_orders:
+                await job_cancel_order(cancel_orders[symbol])
+            for stage_orders in (
+                now_orders[symbol],
+                book_orders[symbol],
+                later_orders[symbol],
+            ):
+                if stage_orders:
+                    await job_stage(stage_orders)
+
+        # symbols don't wait for each other
+        tasks = [
+            asyncio.create_task(job_symbol(s)) for s in target_symbols if s in decision
+        ]
+        if tasks:
             await asyncio.wait(tasks)
 
     async def clear_positions_and_open_orders(self):
@@ -2235,7 +2447,7 @@ class Transactor:
         if not self.transaction_settings.should_transact:
             return
 
-        conflicting_order_tuples = []
+        conflicting_order_ids: dict[str, list[int]] = {}
         for symbol in self.window.data_settings.target_symbols:
             symbol_open_orders = self.account_state["open_orders"][symbol]
             groups_by_command: dict[str, list[int]] = {}
@@ -2245,33 +2457,42 @@ class Transactor:
                     groups_by_command[command_name] = [order_id]
                 else:
                     groups_by_command[command_name].append(order_id)
+            symbol_order_ids = []
             for command_name, group in groups_by_command.items():
                 if command_name == "other":
-                    for order_id in group:
-                        conflicting_order_tuples.append((symbol, order_id))
+                    symbol_order_ids.extend(group)
                 elif len(group) > 1:
                     latest_id = max(group)
                     for order_id in group:
                         if order_id != latest_id:
-                            conflicting_order_tuples.append((symbol, order_id))
+                            symbol_order_ids.append(order_id)
+            if symbol_order_ids:
+                conflicting_order_ids[symbol] = symbol_order_ids
 
-        async def job(conflicting_order_tuple):
+        async def job(symbol: str, order_ids: list[int]):
+            # orders of a symbol are canceled together
             try:
                 payload = {
                     "timestamp": int(datetime.now(timezone.utc).timestamp() * 1000),
-                    "symbol": conflicting_order_tuple[0],
-                    "orderId": conflicting_order_tuple[1],
+                    "symbol": symbol,
+                    "orderIdList": json.dumps(order_ids, separators=(",", ":")),
                 }
                 await self.api_requester.binance(
                     http_method="DELETE",
-                    path="/fapi/v1/order",
+                    path="/fapi/v1/batchOrders",
                     payload=payload,
                 )
             except ApiRequestError:
                 pass
 
-        if conflicting_order_tuples:
-            tasks = [asyncio.create_task(job(c)) for c in conflicting_order_tuples]
+        tasks = []
+        batch_size = 10  # Limit of Binance
+        for symbol, order_ids in conflicting_order_ids.items():
+            for turn in range(0, len(order_ids), batch_size):
+                batch_ids = order_ids[turn : turn + batch_size]
+                tasks.append(asyncio.create_task(job(symbol, batch_ids)))
+
+        if tasks:
             await asyncio.wait(tasks)
 
     async def pan_view_range(self):